@@ -1,4 +1,4 @@
-from .main_agent import run_main_agent
+from .main_agent import run_main_agent, run_main_agent_for_all
 
-__all__ = ["run_main_agent"]
+__all__ = ["run_main_agent", "run_main_agent_for_all"]
 
@@ -1,20 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from agents.main_agent.pipeline import run_main_pipeline
+from agents.sales_agent import deliver_rfp
 from agents.technical_agent import run_technical_agent
 from agents.pricing_agent import run_pricing_agent
 
 from agents.main_agent.src.consolidate_response import consolidate_rfp_response
-from agents.main_agent.src.generate_pdf import generate_rfp_response_pdf
+from agents.main_agent.src.generate_pdf import generate_rfp_response_pdf, response_pdf_path
+from config import RFP_FANOUT_CONCURRENCY
 
 # =====================================================
 # UI ENTRY POINT — DRAFT PHASE (EDITABLE)
 # =====================================================
-def run_main_draft(rfp: dict) -> dict:
+def run_main_draft(rfp: dict, on_summary_chunk=None) -> dict:
     """
     Generates editable Main Agent output.
     Used by UI.
     Does NOT call Technical or Pricing agents.
+    Summaries stream to on_summary_chunk(section, text) when given.
     """
-    return run_main_pipeline(rfp)
+    return run_main_pipeline(rfp, on_summary_chunk=on_summary_chunk)
 
 # =====================================================
 # LEGACY / AUTOMATION ENTRY POINT
@@ -35,10 +40,7 @@ def run_main_agent(rfp: dict) -> dict:
         pricing_result=pricing_result
     )
 
-    pdf_path = (
-        f"data/outputs/RFP_RESPONSE_"
-        f"{main_result['rfp_metadata']['tender_reference']}.pdf"
-    )
+    pdf_path = response_pdf_path(main_result["rfp_metadata"])
 
     generate_rfp_response_pdf(final_rfp_response, pdf_path)
 
@@ -49,3 +51,53 @@ def run_main_agent(rfp: dict) -> dict:
         "final_rfp_response": final_rfp_response,
         "final_pdf_path": pdf_path
     }
+
+# =====================================================
+# BATCH ENTRY POINT — ALL ACCEPTED RFPS
+# =====================================================
+def _run_one(rfp: dict) -> dict:
+    # Own copy, so one RFP's failure or mutations never leak into another
+    rfp = dict(rfp)
+    try:
+        deliver_rfp(rfp)
+        result = run_main_agent(rfp)
+    except Exception as e:
+        print(f"⚠️ RFP {rfp.get('tender_reference')} failed: {e}")
+        return {
+            "tender_reference": rfp.get("tender_reference"),
+            "source_url": rfp.get("source_url"),
+            "status": "FAILED",
+            "error": str(e),
+            "result": None
+        }
+
+    print(f"✔ RFP {rfp.get('tender_reference')} completed: {result['final_pdf_path']}")
+    return {
+        "tender_reference": rfp.get("tender_reference"),
+        "source_url": rfp.get("source_url"),
+        "status": "DONE",
+        "error": None,
+        "result": result
+    }
+
+
+def run_main_agent_for_all(rfps: list, max_workers: int = RFP_FANOUT_CONCURRENCY) -> list:
+    """
+    Runs download → Main → Technical → Pricing → report for every accepted
+    RFP (the sales agent's "accepted_rfps"), up to `max_workers` at once.
+
+    Each RFP runs in isolation: a failure is reported in its own entry and
+    does not stop the others.
+
+    Returns:
+        list: one {tender_reference, source_url, status, error, result}
+        per RFP, in input order (status is "DONE" or "FAILED")
+    """
+    if not rfps:
+        return []
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(rfps))),
+        thread_name_prefix="rfp"
+    ) as pool:
+        return list(pool.map(_run_one, rfps))
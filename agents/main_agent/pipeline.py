@@ -4,61 +4,80 @@ import sys
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, project_root)
 
-from agents.main_agent.src.load_pdf import load_rfp_pdf
-from agents.main_agent.src.summary import extract_role_relevant_text
+from agents.main_agent.src.load_pdf import open_rfp_pages, iter_lines, prefilter_report
+from agents.main_agent.src.summary import iter_role_relevant_lines
 from agents.main_agent.src.parse import (
     build_product_table,
-    export_product_table_to_csv
+    export_product_table_to_csv,
+    rfp_output_key
 )
 from agents.main_agent.src.resolve.resolver import resolve_rfp_summaries
 from agents.technical_agent import run_technical_agent
-from core.llm.ollama_client import OllamaLLM
+from core.llm import build_llm
 
 
-def run_main_pipeline(rfp: dict) -> dict:
+def run_main_pipeline(rfp: dict, on_summary_chunk=None) -> dict:
     """
     Core pipeline for Main Agent.
     - Orchestrates Sales → Technical → (Pricing later)
     - Acts as the single source of truth
+
+    on_summary_chunk(section, text) receives summary tokens as they stream.
     """
 
     if not rfp or "rfp_pdf_path" not in rfp:
         raise ValueError("Invalid RFP input to Main Agent")
 
     # -------------------------------
-    # Step 1: Load RFP PDF
+    # Step 1: Open RFP PDF (pages are extracted lazily)
     # -------------------------------
-    pdf_data = load_rfp_pdf(rfp["rfp_pdf_path"])
+    pdf_data = open_rfp_pages(rfp["rfp_pdf_path"])
 
     # -------------------------------
     # Step 2: Extract role-relevant text
     # -------------------------------
-    relevant_text = extract_role_relevant_text(pdf_data["full_text"])
+    # Streamed page -> line -> classifier, so the product table below is
+    # built while later pages are still being extracted
+    testing_text = []
+
+    def technical_lines():
+        lines = iter_lines(pdf_data["pages"])
+        for role, line in iter_role_relevant_lines(lines):
+            if role == "testing":
+                testing_text.append(line)
+            else:
+                yield line
 
     # -------------------------------
     # Step 3: Build structured product table
     # -------------------------------
-    product_table = build_product_table(
-        relevant_text["technical_text"]
-    )
+    product_table = build_product_table(technical_lines())
+
+    prefilter = prefilter_report(pdf_data["prefilter"])
+    if pdf_data["prefilter"]["enabled"] and not pdf_data["from_cache"]:
+        saved = (
+            f", ~{prefilter['est_saved_s']}s saved" if prefilter["pages_skipped"] else ""
+        )
+        print(
+            f"✔ Page prefilter: skipped {prefilter['pages_skipped']}/"
+            f"{pdf_data['num_pages']} pages{saved}"
+        )
 
     # -------------------------------
     # Step 4: Export product table CSV
     # -------------------------------
-    csv_path = export_product_table_to_csv(
-        product_table,
-        rfp.get("tender_reference", "unknown_rfp")
-    )
+    csv_path = export_product_table_to_csv(product_table, rfp_output_key(rfp))
 
     # -------------------------------
     # Step 5: Generate summaries (AI)
     # -------------------------------
-    llm = OllamaLLM(model="llama3.2")
+    llm = build_llm()
 
     summaries = resolve_rfp_summaries(
         llm_client=llm,
         product_table=product_table,
-        testing_text=relevant_text["testing_text"]
+        testing_text=testing_text,
+        on_chunk=on_summary_chunk
     )
     # -------------------------------
     # Final consolidated output
@@ -67,7 +86,8 @@ def run_main_pipeline(rfp: dict) -> dict:
         "rfp_metadata": rfp,
         "pdf_info": {
             "path": pdf_data["rfp_pdf_path"],
-            "num_pages": pdf_data["num_pages"]
+            "num_pages": pdf_data["num_pages"],
+            "prefilter": prefilter
         },
         "product_table": product_table,
         "product_csv": csv_path,
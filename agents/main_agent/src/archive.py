@@ -0,0 +1,208 @@
+import io
+import os
+import re
+import struct
+import zipfile
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from config import ARCHIVE_BUFFER_MB
+
+
+# Decompressed bytes are produced and cached in blocks of this size
+BLOCK_SIZE = 256 * 1024
+# Decompressor state is saved every this many blocks, so a backward seek
+# re-inflates at most CHECKPOINT_BLOCKS * BLOCK_SIZE bytes
+CHECKPOINT_BLOCKS = 16
+READ_SIZE = 16 * 1024
+
+LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+# Ranking of PDFs inside a bundle: the tender document itself first,
+# supporting documents (corrigenda, annexures, forms, ...) last
+MAIN_DOCUMENT_HINTS = re.compile(r"rfp|tender|nit|bid|main", re.I)
+SUPPORTING_DOCUMENT_HINTS = re.compile(
+    r"corrigendum|addendum|annex|appendix|drawing|boq|form|format|undertaking",
+    re.I
+)
+
+
+# ---------------------------------------------------------
+# SEEKABLE MEMBER READERS
+# ---------------------------------------------------------
+class _StoredReader(io.RawIOBase):
+    """Uncompressed member: a window onto the archive file, no copy."""
+
+    def __init__(self, fp, offset: int, size: int):
+        self._fp = fp
+        self._offset = offset
+        self._size = size
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def readinto(self, buffer):
+        n = max(0, min(len(buffer), self._size - self._pos))
+        if not n:
+            return 0
+        self._fp.seek(self._offset + self._pos)
+        data = self._fp.read(n)
+        buffer[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+class _InflateReader(_StoredReader):
+    """
+    Deflated member with cheap random access in bounded memory.
+
+    zipfile's own reader restarts decompression from the first byte on
+    every backward seek, and PDF parsers seek backwards constantly (xref
+    table at the end, objects all over). Here decompressed blocks are kept
+    in a small LRU cache and decompressor snapshots are taken every few
+    MB, so a seek only re-inflates from the nearest snapshot.
+    """
+
+    def __init__(self, fp, offset: int, compress_size: int, size: int, buffer_bytes: int):
+        super().__init__(fp, offset, size)
+        self._compress_size = compress_size
+        self._blocks = OrderedDict()
+        self._max_blocks = max(2, buffer_bytes // BLOCK_SIZE)
+        # block index -> (compressed bytes consumed, decompressor, pending input)
+        self._checkpoints = {0: (0, zlib.decompressobj(-zlib.MAX_WBITS), b"")}
+
+    def _inflate_block(self, decompressor, consumed: int, pending: bytes):
+        out = []
+        need = BLOCK_SIZE
+        while need and not decompressor.eof:
+            if not pending:
+                if consumed >= self._compress_size:
+                    break
+                self._fp.seek(self._offset + consumed)
+                pending = self._fp.read(min(READ_SIZE, self._compress_size - consumed))
+                if not pending:
+                    break
+                consumed += len(pending)
+            chunk = decompressor.decompress(pending, need)
+            pending = decompressor.unconsumed_tail
+            out.append(chunk)
+            need -= len(chunk)
+        return b"".join(out), consumed, pending
+
+    def _block(self, index: int) -> bytes:
+        if index in self._blocks:
+            self._blocks.move_to_end(index)
+            return self._blocks[index]
+
+        start = max(i for i in self._checkpoints if i <= index)
+        consumed, decompressor, pending = self._checkpoints[start]
+        decompressor = decompressor.copy()
+
+        for i in range(start, index + 1):
+            if i % CHECKPOINT_BLOCKS == 0 and i not in self._checkpoints:
+                self._checkpoints[i] = (consumed, decompressor.copy(), pending)
+            data, consumed, pending = self._inflate_block(decompressor, consumed, pending)
+
+            self._blocks[i] = data
+            self._blocks.move_to_end(i)
+            if len(self._blocks) > self._max_blocks:
+                self._blocks.popitem(last=False)
+        return data
+
+    def readinto(self, buffer):
+        n = max(0, min(len(buffer), self._size - self._pos))
+        if not n:
+            return 0
+        index, start = divmod(self._pos, BLOCK_SIZE)
+        data = self._block(index)[start:start + n]
+        buffer[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+# ---------------------------------------------------------
+# ARCHIVE ACCESS
+# ---------------------------------------------------------
+def is_zip_archive(path: str) -> bool:
+    """True for ZIP bundles (checks the signature, not the extension)."""
+    return os.path.isfile(path) and zipfile.is_zipfile(path)
+
+
+def find_main_pdf(archive: zipfile.ZipFile) -> zipfile.ZipInfo:
+    """
+    Picks the tender document among the PDFs of a bundle, from the
+    central directory only: RFP-like names first, then the largest file.
+    """
+    candidates = [
+        info for info in archive.infolist()
+        if not info.is_dir()
+        and info.filename.lower().endswith(".pdf")
+        and "__MACOSX/" not in info.filename
+        and not os.path.basename(info.filename).startswith("._")
+    ]
+    if not candidates:
+        raise FileNotFoundError(f"No PDF found in archive: {archive.filename}")
+
+    def rank(info):
+        name = os.path.basename(info.filename)
+        return (
+            bool(MAIN_DOCUMENT_HINTS.search(name)),
+            not SUPPORTING_DOCUMENT_HINTS.search(name),
+            info.file_size
+        )
+
+    return max(candidates, key=rank)
+
+
+def _data_offset(fp, info: zipfile.ZipInfo) -> int:
+    fp.seek(info.header_offset)
+    header = LOCAL_HEADER.unpack(fp.read(LOCAL_HEADER.size))
+    if header[0] != b"PK\x03\x04":
+        raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+    name_length, extra_length = header[-2:]
+    return info.header_offset + LOCAL_HEADER.size + name_length + extra_length
+
+
+@contextmanager
+def open_archive_pdf(path: str, buffer_bytes: int = ARCHIVE_BUFFER_MB * 1024 * 1024):
+    """
+    Opens the main PDF of a ZIP bundle as a seekable, read-only stream.
+
+    Nothing is extracted to disk and the member is never held in memory
+    as a whole: stored members are read straight from the archive,
+    deflated ones through a block cache of at most `buffer_bytes`.
+
+    Yields:
+        (stream, member_name)
+    """
+    with open(path, "rb") as fp, zipfile.ZipFile(fp) as archive:
+        info = find_main_pdf(archive)
+        if info.flag_bits & 0x1:
+            raise ValueError(f"Encrypted archive member: {info.filename}")
+
+        if info.compress_type == zipfile.ZIP_STORED:
+            raw = _StoredReader(fp, _data_offset(fp, info), info.file_size)
+        elif info.compress_type == zipfile.ZIP_DEFLATED:
+            raw = _InflateReader(
+                fp, _data_offset(fp, info), info.compress_size,
+                info.file_size, buffer_bytes
+            )
+        else:
+            # bzip2/lzma: zipfile's reader (seekable, slower backwards)
+            raw = archive.open(info)
+
+        with io.BufferedReader(raw, buffer_size=READ_SIZE) as stream:
+            yield stream, info.filename
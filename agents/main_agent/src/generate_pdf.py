@@ -1,9 +1,19 @@
+import os
+
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from reportlab.platypus import Table, TableStyle, Paragraph
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
 
+from .parse import rfp_output_key
+
+
+def response_pdf_path(rfp: dict, output_dir: str = "data/outputs") -> str:
+    """Where the response report for `rfp` is written (unique per RFP)."""
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, f"RFP_RESPONSE_{rfp_output_key(rfp)}.pdf")
+
 
 def generate_rfp_response_pdf(final_response: dict, output_path: str):
     c = canvas.Canvas(output_path, pagesize=A4)
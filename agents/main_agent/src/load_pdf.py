@@ -1,34 +1,361 @@
+import multiprocessing
 import os
-import pdfplumber
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional
 
+from config import (
+    PDF_EXTRACT_BACKEND,
+    PDF_EXTRACT_WORKERS,
+    PDF_PARALLEL_MIN_PAGES,
+    PDF_PAGE_PREFILTER,
+    PDF_TEXT_CACHE_PATH,
+    PDF_TEXT_CACHE_ENABLED,
+    PDF_TEXT_CACHE_MAX_MB
+)
+from .archive import is_zip_archive, open_archive_pdf
+from .page_probe import probe_page
+from .pdf_backends import backend_version, open_document
+from .text_cache import PDFTextCache
 
-def load_rfp_pdf(rfp_pdf_path: str) -> dict:
+
+# Bump when extraction output or the cache format changes, so cached text
+# is not reused (the backend and its version are part of the key too)
+EXTRACTOR_VERSION = "2"
+
+# Page ranges per worker: more than one evens out slow (table-heavy) pages,
+# but every range re-opens the PDF in its worker
+RANGES_PER_WORKER = 2
+# Upper bound on a range, so the first pages reach the caller early
+MAX_RANGE_PAGES = 32
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+_text_cache = None
+_text_cache_lock = threading.Lock()
+
+
+def get_text_cache() -> PDFTextCache:
     """
-    Loads an RFP PDF and extracts all textual content.
-    Works for text-based PDFs with tables and logos.
-    Images (logos) are ignored automatically.
+    Process-wide extracted-text cache (shared by all pipelines).
+    """
+    global _text_cache
+    with _text_cache_lock:
+        if _text_cache is None:
+            _text_cache = PDFTextCache(
+                PDF_TEXT_CACHE_PATH,
+                max_bytes=PDF_TEXT_CACHE_MAX_MB * 1024 * 1024
+            )
+        return _text_cache
+
+
+@contextmanager
+def _open_pdf(rfp_pdf_path: str, backend: str):
+    """Backend document for a plain PDF or for the main PDF of a ZIP bundle."""
+    if is_zip_archive(rfp_pdf_path):
+        with open_archive_pdf(rfp_pdf_path) as (stream, archive_member):
+            with open_document(stream, backend) as document:
+                yield document, archive_member
+    else:
+        with open_document(rfp_pdf_path, backend) as document:
+            yield document, None
+
+
+# ---------------------------------------------------------
+# PAGE EXTRACTION
+# ---------------------------------------------------------
+def new_prefilter_stats(enabled: bool) -> dict:
+    return {
+        "enabled": enabled,
+        "pages_extracted": 0,
+        "pages_skipped": 0,
+        "probe_s": 0.0,
+        "extract_s": 0.0
+    }
+
+
+def _merge_stats(stats: dict, other: dict):
+    for key in ("pages_extracted", "pages_skipped", "probe_s", "extract_s"):
+        stats[key] += other[key]
+
+
+def prefilter_report(stats: dict) -> dict:
+    """
+    Pages skipped by the prefilter and the extraction time that saved
+    (estimated from the average time of the pages that were extracted).
+    """
+    extracted = stats["pages_extracted"]
+    per_page = stats["extract_s"] / extracted if extracted else 0.0
+    return {
+        "pages_extracted": extracted,
+        "pages_skipped": stats["pages_skipped"],
+        "probe_s": round(stats["probe_s"], 3),
+        # Never negative: the probe can cost more than it saved on a
+        # document without skippable pages
+        "est_saved_s": round(
+            max(0.0, stats["pages_skipped"] * per_page - stats["probe_s"]), 3
+        )
+    }
+
+
+def _page_text(document, index: int, stats: dict) -> str:
+    # Engines without a pdfminer page object cannot be probed
+    page_obj = document.probe_object(index) if stats["enabled"] else None
+    if page_obj is not None:
+        start = time.perf_counter()
+        try:
+            relevant = probe_page(page_obj)
+        except Exception:
+            relevant = True
+        stats["probe_s"] += time.perf_counter() - start
+
+        if not relevant:
+            # No line of this page could be technical or testing text
+            stats["pages_skipped"] += 1
+            return ""
+
+    start = time.perf_counter()
+    text = document.page_text(index)
+    stats["pages_extracted"] += 1
+    stats["extract_s"] += time.perf_counter() - start
+    return text
+
+
+def _extract_page_range(
+    rfp_pdf_path: str, start: int, stop: int, backend: str, prefilter: bool
+) -> tuple:
+    """Worker process: (texts of pages [start, stop), prefilter stats)."""
+    stats = new_prefilter_stats(prefilter)
+    with _open_pdf(rfp_pdf_path, backend) as (document, _):
+        return [_page_text(document, i, stats) for i in range(start, stop)], stats
+
+
+# ---------------------------------------------------------
+# WORKER POOL
+# ---------------------------------------------------------
+def usable_cores() -> int:
+    """Cores this process may run on (affinity mask, e.g. a container cpuset)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def resolve_workers(workers: Optional[int] = None) -> int:
+    """
+    Configured worker count; 0 means one per usable core. A result of 1
+    keeps extraction serial (no process pool is started).
+    """
+    workers = PDF_EXTRACT_WORKERS if workers is None else workers
+    return workers if workers > 0 else usable_cores()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool kept across calls, so worker start-up (and the pdfplumber
+    import) is paid once per run, not once per RFP.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # forkserver: workers are not forked from this (threaded) process
+            method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(method)
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def _page_ranges(num_pages: int, workers: int) -> List[tuple]:
+    size = max(1, min(MAX_RANGE_PAGES, -(-num_pages // (workers * RANGES_PER_WORKER))))
+    return [
+        (start, min(start + size, num_pages))
+        for start in range(0, num_pages, size)
+    ]
+
+
+def _iter_parallel(
+    rfp_pdf_path: str, num_pages: int, workers: int, backend: str, stats: dict
+) -> Iterator[str]:
+    pool = _get_pool(workers)
+    futures = [
+        pool.submit(
+            _extract_page_range, rfp_pdf_path, start, stop, backend, stats["enabled"]
+        )
+        for start, stop in _page_ranges(num_pages, workers)
+    ]
+    try:
+        # Ranges are handed on in page order, whatever order they finish in
+        for future in futures:
+            texts, range_stats = future.result()
+            _merge_stats(stats, range_stats)
+            yield from texts
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _iter_pages(
+    rfp_pdf_path: str, num_pages: int, workers: int, backend: str, stats: dict
+) -> Iterator[str]:
+    """Page texts in order, extracted as they are consumed."""
+    done = 0
+    if workers > 1 and num_pages >= PDF_PARALLEL_MIN_PAGES:
+        try:
+            for text in _iter_parallel(
+                os.path.abspath(rfp_pdf_path), num_pages, workers, backend, stats
+            ):
+                done += 1
+                yield text
+            return
+        except (BrokenProcessPool, OSError) as e:
+            print(f"⚠️ Parallel PDF extraction failed ({e}), extracting serially")
+            _discard_pool()
+
+    with _open_pdf(rfp_pdf_path, backend) as (document, _):
+        for index in range(done, num_pages):
+            yield _page_text(document, index, stats)
+
+
+# ---------------------------------------------------------
+# LOADER
+# ---------------------------------------------------------
+def open_rfp_pages(
+    rfp_pdf_path: str,
+    workers: Optional[int] = None,
+    use_cache: bool = PDF_TEXT_CACHE_ENABLED,
+    prefilter: bool = PDF_PAGE_PREFILTER,
+    backend: Optional[str] = None
+) -> dict:
+    """
+    Streaming counterpart of load_rfp_pdf: "pages" is an iterator over the
+    page texts, extracted (or read from the text cache) as it is consumed,
+    so callers can start on the first pages while later ones are still
+    being extracted and never hold the whole document.
+
+    With `prefilter`, a page whose raw content has none of the technical or
+    testing keywords is not laid out at all and comes through as "" (it
+    could not contribute to extract_role_relevant_text anyway). Only the
+    pdfplumber and pdfminer backends can be probed.
+
+    `backend` is the extraction engine (see pdf_backends), default
+    PDF_EXTRACT_BACKEND.
+
+    Returns:
+        dict: {"rfp_pdf_path", "archive_member", "num_pages", "pages",
+               "from_cache", "prefilter"}; prefilter holds the page counts
+               and timings, complete once pages is exhausted
     """
 
     if not os.path.exists(rfp_pdf_path):
         raise FileNotFoundError(f"RFP PDF not found at: {rfp_pdf_path}")
 
-    extracted_text = []
+    backend = backend or PDF_EXTRACT_BACKEND
+    stats = new_prefilter_stats(prefilter)
+    # Prefiltered text lacks the skipped pages, so it is cached separately
+    version = f"{EXTRACTOR_VERSION}/{backend_version(backend)}"
+    version += "+prefilter" if prefilter else ""
 
-    with pdfplumber.open(rfp_pdf_path) as pdf:
-        total_pages = len(pdf.pages)
+    cache = get_text_cache() if use_cache else None
+    cached = None
+    if cache:
+        key = cache.make_key(rfp_pdf_path, version)
+        cached = cache.get(key)
 
-        for page in pdf.pages:
-            # Simpler, more reliable extraction for text-based PDFs
-            text = page.extract_text()
+    if cached:
+        return {
+            "rfp_pdf_path": rfp_pdf_path,
+            "archive_member": cached["archive_member"],
+            "num_pages": cached["num_pages"],
+            "pages": cached["page_texts"],
+            "from_cache": True,
+            "prefilter": stats
+        }
 
-            if text and text.strip():
-                extracted_text.append(text)
+    with _open_pdf(rfp_pdf_path, backend) as (document, archive_member):
+        num_pages = len(document)
 
-    full_text = "\n".join(extracted_text)
+    pages = _iter_pages(
+        rfp_pdf_path, num_pages, resolve_workers(workers), backend, stats
+    )
+    if cache:
+        # Stored once the last page has been read
+        pages = cache.store_pages(key, num_pages, pages, archive_member)
+
+    return {
+        "rfp_pdf_path": rfp_pdf_path,
+        "archive_member": archive_member,
+        "num_pages": num_pages,
+        "pages": pages,
+        "from_cache": False,
+        "prefilter": stats
+    }
+
+
+def iter_lines(pages: Iterable[str]) -> Iterator[str]:
+    """Lines of a page stream (same lines as full_text.splitlines())."""
+    for text in pages:
+        yield from text.splitlines()
+
+
+def load_rfp_pdf(
+    rfp_pdf_path: str,
+    workers: Optional[int] = None,
+    use_cache: bool = PDF_TEXT_CACHE_ENABLED,
+    backend: Optional[str] = None
+) -> dict:
+    """
+    Loads an RFP PDF and extracts all textual content.
+    Works for text-based PDFs with tables and logos.
+    Images (logos) are ignored automatically.
+
+    ZIP bundles are read in place: the main RFP PDF inside is streamed
+    from the archive without extracting it.
+
+    PDFs with at least PDF_PARALLEL_MIN_PAGES pages are split into page
+    ranges extracted by `workers` processes (default PDF_EXTRACT_WORKERS,
+    0 = one per core, 1 = serial); the text is identical either way.
+
+    Per-page text is cached by file content hash, so a PDF that was
+    loaded before is not parsed again.
+
+    `backend` picks the extraction engine (default PDF_EXTRACT_BACKEND,
+    pdfplumber); see agents/main_agent/src/pdf_backends.py.
+
+    Builds the whole text (every page, no prefilter) in memory; the main
+    pipeline uses open_rfp_pages instead.
+    """
+    document = open_rfp_pages(
+        rfp_pdf_path, workers=workers, use_cache=use_cache, prefilter=False,
+        backend=backend
+    )
+    full_text = "\n".join(text for text in document["pages"] if text.strip())
 
     return {
         "rfp_pdf_path": rfp_pdf_path,
-        "num_pages": total_pages,
+        "archive_member": document["archive_member"],
+        "num_pages": document["num_pages"],
         "text_preview": full_text[:500],
-        "full_text": full_text
+        "full_text": full_text,
+        "from_cache": document["from_cache"]
     }
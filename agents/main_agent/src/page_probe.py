@@ -0,0 +1,136 @@
+import re
+from typing import List, Optional
+
+from pdfminer.pdftypes import resolve1
+from pdfminer.psparser import PSLiteral
+
+from .summary import TECHNICAL_KEYWORDS, TESTING_KEYWORDS
+
+
+# A page can only contribute technical/testing lines if one of these occurs
+# in its text (exclude keywords act per line, so they cannot rule out a page)
+PROBE_KEYWORDS = tuple(TECHNICAL_KEYWORDS + TESTING_KEYWORDS)
+
+# Simple fonts whose string bytes are (close enough to) Windows-1252 text
+SIMPLE_FONT_TYPES = {"Type1", "MMType1", "TrueType"}
+SIMPLE_ENCODINGS = {"WinAnsiEncoding", "MacRomanEncoding", "StandardEncoding"}
+
+STRING_START = re.compile(rb"[(<]")
+ESCAPES = {
+    ord("n"): b"\n", ord("r"): b"\r", ord("t"): b"\t", ord("b"): b"\b",
+    ord("f"): b"\f", ord("("): b"(", ord(")"): b")", ord("\\"): b"\\"
+}
+
+
+def _name(value) -> Optional[str]:
+    value = resolve1(value)
+    return value.name if isinstance(value, PSLiteral) else None
+
+
+def _readable_font(font) -> bool:
+    font = resolve1(font)
+    if not isinstance(font, dict) or _name(font.get("Subtype")) not in SIMPLE_FONT_TYPES:
+        return False
+
+    encoding = resolve1(font.get("Encoding"))
+    if encoding is None:
+        # Built-in encoding; with a ToUnicode map the codes are often
+        # arbitrary glyph ids (subset fonts)
+        return "ToUnicode" not in font
+    if isinstance(encoding, dict):
+        # Differences remap codes to arbitrary glyphs
+        return (
+            "Differences" not in encoding
+            and _name(encoding.get("BaseEncoding")) in SIMPLE_ENCODINGS | {None}
+        )
+    return _name(encoding) in SIMPLE_ENCODINGS
+
+
+def _has_forms(resources: dict) -> bool:
+    xobjects = resolve1(resources.get("XObject")) or {}
+    # Images and forms are streams; their dictionary says which is which
+    return any(
+        _name(resolve1(xobject).get("Subtype")) == "Form"
+        for xobject in xobjects.values()
+    )
+
+
+def _literal(data: bytes, i: int):
+    """Literal string starting after '(' at i; returns (bytes, next index)."""
+    out = bytearray()
+    depth = 1
+    while i < len(data):
+        c = data[i]
+        if c == 0x5C and i + 1 < len(data):          # backslash
+            nxt = data[i + 1]
+            if nxt in ESCAPES:
+                out += ESCAPES[nxt]
+                i += 2
+            elif 0x30 <= nxt <= 0x37:                 # octal \ddd
+                j = i + 1
+                while j < min(i + 4, len(data)) and 0x30 <= data[j] <= 0x37:
+                    j += 1
+                out.append(int(data[i + 1:j], 8) & 0xFF)
+                i = j
+            else:                                     # line continuation etc.
+                i += 2
+            continue
+        if c == 0x28:
+            depth += 1
+        elif c == 0x29:
+            depth -= 1
+            if not depth:
+                return bytes(out), i + 1
+        out.append(c)
+        i += 1
+    return bytes(out), i
+
+
+def content_strings(data: bytes) -> List[bytes]:
+    """Every string operand in a content stream, in stream order."""
+    strings = []
+    i = 0
+    while True:
+        match = STRING_START.search(data, i)
+        if not match:
+            return strings
+        i = match.end()
+        if match.group() == b"(":
+            text, i = _literal(data, i)
+            strings.append(text)
+        elif data[i:i + 1] == b"<":
+            i += 1                                    # dictionary, not a string
+        else:
+            end = data.find(b">", i)
+            end = len(data) if end < 0 else end
+            digits = re.sub(rb"[^0-9A-Fa-f]", b"", data[i:end])
+            strings.append(bytes.fromhex((digits + b"0" * (len(digits) % 2)).decode()))
+            i = end + 1
+
+
+def probe_page(page_obj) -> bool:
+    """
+    Cheap relevance check on a pdfminer page: reads the raw content
+    streams, without interpreting them or laying out text.
+
+    Returns False only when the page certainly has none of the technical or
+    testing keywords; True when it may (or cannot be probed reliably:
+    composite/Type3/custom-encoded fonts, text in form XObjects).
+    """
+    resources = resolve1(page_obj.resources) or {}
+    fonts = resolve1(resources.get("Font")) or {}
+    if not all(_readable_font(font) for font in fonts.values()):
+        return True
+    if _has_forms(resources):
+        return True
+
+    contents = page_obj.contents or []
+    # Streams of one page split at token boundaries
+    data = b"\n".join(resolve1(stream).get_data() for stream in contents)
+    strings = [s.decode("cp1252", errors="replace").lower() for s in content_strings(data)]
+
+    # Joined: words kerned into pieces; spaced: words split across operators
+    for text in ("".join(strings), " ".join(strings)):
+        if any(keyword in text for keyword in PROBE_KEYWORDS):
+            return True
+    return False
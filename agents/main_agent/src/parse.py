@@ -1,7 +1,8 @@
 import csv
+import hashlib
 import os
 import re
-from typing import List, Dict
+from typing import Dict, Iterable, List
 
 
 # ---------------------------------------------------------
@@ -11,20 +12,29 @@ def sanitize_filename(text: str) -> str:
     """
     Makes a string safe to use as a filename.
     """
-    return (
-        text.replace("/", "_")
-            .replace("\\", "_")
-            .replace(" ", "_")
-            .replace(":", "_")
-    )
+    # Anything but letters, digits, "." and "-" (portal references often
+    # hold "/"); no leading dots, so never "." or ".."
+    return re.sub(r"[^\w.-]+", "_", text or "").strip("._") or "unknown_rfp"
+
+
+def rfp_output_key(rfp: dict) -> str:
+    """
+    File name stem for one RFP's outputs: sanitized tender reference + a
+    short hash of its source URL, so RFPs run together never overwrite each
+    other's files, even with the same (or no) reference.
+    """
+    source = rfp.get("source_url") or rfp.get("rfp_pdf_path") or ""
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:8]
+    return f"{sanitize_filename(rfp.get('tender_reference'))}_{digest}"
 
 
 # ---------------------------------------------------------
 # PRODUCT TABLE BUILDER
 # ---------------------------------------------------------
-def build_product_table(technical_text: List[str]) -> List[Dict]:
+def build_product_table(technical_text: Iterable[str]) -> List[Dict]:
     """
     Builds a structured product table from extracted technical text.
+    Lines are consumed one at a time, so a generator works as well.
 
     Supports:
     - Section-based RFPs (4.1, 4.2)
@@ -0,0 +1,226 @@
+import io
+import re
+from contextlib import contextmanager
+from typing import List
+
+import pdfplumber
+
+from config import PDF_EXTRACT_BACKEND
+
+
+# Faster than pdfplumber's layout: no hierarchical text box ordering
+# (boxes_flow=None) and no vertical text detection. The wide char_margin
+# keeps a table row on one line, as pdfplumber does (the default 2.0 puts
+# every cell on its own line and the product table parser misses the rows)
+PDFMINER_LAPARAMS = {
+    "char_margin": 50.0,
+    "line_margin": 0.5,
+    "word_margin": 0.1,
+    "boxes_flow": None,
+    "detect_vertical": False
+}
+
+MULTIPLE_SPACES = re.compile(r" {2,}")
+
+
+def _clean(text: str) -> str:
+    """Same shape as pdfplumber's text: "\\n" line ends, no trailing blanks."""
+    return "\n".join(
+        line.rstrip() for line in text.replace("\f", "").splitlines()
+    ).strip("\n")
+
+
+# ---------------------------------------------------------
+# BACKENDS
+# ---------------------------------------------------------
+# A document takes a path or a binary file object and exposes len(),
+# page_text(index), probe_object(index) (the pdfminer page for the
+# prefilter, None if the engine has none) and close().
+
+class _PdfplumberDocument:
+    """pdfplumber extract_text (original extraction, slowest)."""
+
+    @staticmethod
+    def version() -> str:
+        return pdfplumber.__version__
+
+    def __init__(self, source):
+        self._pdf = pdfplumber.open(source)
+
+    def __len__(self):
+        return len(self._pdf.pages)
+
+    def probe_object(self, index: int):
+        return self._pdf.pages[index].page_obj
+
+    def page_text(self, index: int) -> str:
+        page = self._pdf.pages[index]
+        # Simpler, more reliable extraction for text-based PDFs
+        text = page.extract_text() or ""
+        # pdfplumber keeps every page's parsed layout otherwise, so memory
+        # would grow with each page read
+        page.close()
+        return text
+
+    def close(self):
+        self._pdf.close()
+
+
+class _PdfminerDocument:
+    """pdfminer.six text converter with PDFMINER_LAPARAMS."""
+
+    @staticmethod
+    def version() -> str:
+        import pdfminer
+        return f"{pdfminer.__version__}/{sorted(PDFMINER_LAPARAMS.items())}"
+
+    def __init__(self, source):
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfinterp import PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser
+
+        self._file = open(source, "rb") if isinstance(source, str) else None
+        document = PDFDocument(PDFParser(self._file or source))
+        self._pages = list(PDFPage.create_pages(document))
+        self._resources = PDFResourceManager(caching=True)
+
+    def __len__(self):
+        return len(self._pages)
+
+    def probe_object(self, index: int):
+        return self._pages[index]
+
+    def page_text(self, index: int) -> str:
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFPageInterpreter
+
+        output = io.StringIO()
+        device = TextConverter(
+            self._resources, output, laparams=LAParams(**PDFMINER_LAPARAMS)
+        )
+        try:
+            PDFPageInterpreter(self._resources, device).process_page(self._pages[index])
+        finally:
+            device.close()
+        # Word gaps come out as a space even next to a space glyph
+        return _clean(MULTIPLE_SPACES.sub(" ", output.getvalue()))
+
+    def close(self):
+        if self._file:
+            self._file.close()
+
+
+class _PypdfDocument:
+    """pypdf extract_text (pure Python, no layout analysis)."""
+
+    @staticmethod
+    def version() -> str:
+        import pypdf
+        return pypdf.__version__
+
+    def __init__(self, source):
+        from pypdf import PdfReader
+
+        self._reader = PdfReader(source)
+
+    def __len__(self):
+        return len(self._reader.pages)
+
+    def probe_object(self, index: int):
+        return None
+
+    def page_text(self, index: int) -> str:
+        return _clean(self._reader.pages[index].extract_text() or "")
+
+    def close(self):
+        self._reader.close()
+
+
+class _PypdfiumDocument:
+    """PDFium text page (native, fastest)."""
+
+    @staticmethod
+    def version() -> str:
+        import pypdfium2
+        return f"{pypdfium2.version.PYPDFIUM_INFO}/{pypdfium2.version.PDFIUM_INFO}"
+
+    def __init__(self, source):
+        import pypdfium2
+
+        self._pdf = pypdfium2.PdfDocument(source)
+
+    def __len__(self):
+        return len(self._pdf)
+
+    def probe_object(self, index: int):
+        return None
+
+    def page_text(self, index: int) -> str:
+        page = self._pdf[index]
+        try:
+            text_page = page.get_textpage()
+            try:
+                return _clean(text_page.get_text_range())
+            finally:
+                text_page.close()
+        finally:
+            page.close()
+
+    def close(self):
+        self._pdf.close()
+
+
+BACKENDS = {
+    "pdfplumber": _PdfplumberDocument,
+    "pdfminer": _PdfminerDocument,
+    "pypdf": _PypdfDocument,
+    "pypdfium2": _PypdfiumDocument
+}
+
+
+def available_backends() -> List[str]:
+    names = []
+    for name in BACKENDS:
+        try:
+            __import__(name)
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+
+def _backend(backend: str = None):
+    backend = backend or PDF_EXTRACT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown PDF extraction backend '{backend}', "
+            f"expected one of {sorted(BACKENDS)}"
+        )
+    return backend, BACKENDS[backend]
+
+
+def backend_version(backend: str = None) -> str:
+    """"name-version" of a backend, for text cache keys."""
+    backend, document_class = _backend(backend)
+    return f"{backend}-{document_class.version()}"
+
+
+@contextmanager
+def open_document(source, backend: str = None):
+    """
+    PDF document (path or binary file object) read with one of BACKENDS.
+
+    Args:
+        backend (str): "pdfplumber" (original), "pdfminer", "pypdf" or
+            "pypdfium2" (each needs its package installed). Defaults to
+            PDF_EXTRACT_BACKEND. Line breaks and spacing differ a little
+            between engines, see benchmarks/bench_pdf_backends.py.
+    """
+    _, document_class = _backend(backend)
+    document = document_class(source)
+    try:
+        yield document
+    finally:
+        document.close()
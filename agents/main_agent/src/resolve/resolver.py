@@ -4,11 +4,30 @@ from agents.main_agent.src.resolve.prompt import (
 )
 
 
-def resolve_rfp_summaries(llm_client, product_table, testing_text):
+def _generate_summary(llm_client, prompt, section, on_chunk):
+    """
+    Runs a summary prompt, streaming tokens to on_chunk(section, text)
+    when a consumer is attached.
+    """
+    if on_chunk is None:
+        return llm_client.generate(prompt, stage=section)
+
+    chunks = []
+    for chunk in llm_client.generate_stream(prompt, stage=section):
+        chunks.append(chunk)
+        on_chunk(section, chunk)
+
+    return "".join(chunks)
+
+
+def resolve_rfp_summaries(llm_client, product_table, testing_text, on_chunk=None):
     """
     Generates role-specific summaries using LLM:
     - Technical summary for Technical Agent
     - Pricing summary for Pricing Agent
+
+    If on_chunk is given, partial output is streamed to it as
+    on_chunk("technical_summary" | "pricing_summary", text_chunk).
     """
 
     # -------------------------------
@@ -34,7 +53,9 @@ INPUT:
 {technical_input}
 """
 
-    technical_summary = llm_client.generate(technical_prompt)
+    technical_summary = _generate_summary(
+        llm_client, technical_prompt, "technical_summary", on_chunk
+    )
 
     # -------------------------------
     # Build input for Pricing Summary
@@ -51,7 +72,9 @@ INPUT:
 {pricing_input}
 """
 
-    pricing_summary = llm_client.generate(pricing_prompt)
+    pricing_summary = _generate_summary(
+        llm_client, pricing_prompt, "pricing_summary", on_chunk
+    )
 
     return {
         "technical_summary": technical_summary.strip(),
@@ -1,59 +1,80 @@
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 
-def extract_role_relevant_text(full_text: str) -> Dict[str, List[str]]:
-    """
-    Extracts ONLY:
-    1. Technical-related text (for Technical Agent)
-    2. Testing & acceptance-related text (for Pricing Agent)
+TECHNICAL_KEYWORDS = [
+    "scope", "cable", "wire", "voltage", "kv",
+    "conductor", "insulation", "xlpe", "pvc",
+    "armour", "armored", "construction",
+    "standard", "iec", "is ", "ieee"
+]
 
-    All other content is ignored.
+TESTING_KEYWORDS = [
+    "test", "testing", "inspection",
+    "acceptance", "routine test",
+    "type test", "site test", "commissioning"
+]
+
+EXCLUDE_KEYWORDS = [
+    "price", "commercial", "emd", "bid security",
+    "payment", "delivery", "penalty",
+    "liquidated", "eligibility",
+    "turnover", "experience"
+]
+
+
+def classify_line(clean_line: str) -> Optional[str]:
     """
+    "technical", "testing" or None (not relevant) for one stripped line.
+    """
+    lower_line = clean_line.lower()
 
-    lines = full_text.splitlines()
+    if not clean_line:
+        return None
 
-    technical_text = []
-    testing_text = []
+    # Ignore clearly non-relevant sections
+    if any(k in lower_line for k in EXCLUDE_KEYWORDS):
+        return None
+
+    # Testing & acceptance (goes to pricing agent later)
+    if any(k in lower_line for k in TESTING_KEYWORDS):
+        return "testing"
+
+    # Technical requirements (goes to technical agent later)
+    if any(k in lower_line for k in TECHNICAL_KEYWORDS):
+        return "technical"
 
-    technical_keywords = [
-        "scope", "cable", "wire", "voltage", "kv",
-        "conductor", "insulation", "xlpe", "pvc",
-        "armour", "armored", "construction",
-        "standard", "iec", "is ", "ieee"
-    ]
-
-    testing_keywords = [
-        "test", "testing", "inspection",
-        "acceptance", "routine test",
-        "type test", "site test", "commissioning"
-    ]
-
-    exclude_keywords = [
-        "price", "commercial", "emd", "bid security",
-        "payment", "delivery", "penalty",
-        "liquidated", "eligibility",
-        "turnover", "experience"
-    ]
+    return None
 
+
+def iter_role_relevant_lines(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Streaming classifier: yields (role, line) for relevant lines as they
+    arrive, role being "technical" or "testing".
+    """
     for line in lines:
         clean_line = line.strip()
-        lower_line = clean_line.lower()
+        role = classify_line(clean_line)
+        if role:
+            yield role, clean_line
 
-        if not clean_line:
-            continue
 
-        # Ignore clearly non-relevant sections
-        if any(k in lower_line for k in exclude_keywords):
-            continue
+def extract_role_relevant_text(full_text: str) -> Dict[str, List[str]]:
+    """
+    Extracts ONLY:
+    1. Technical-related text (for Technical Agent)
+    2. Testing & acceptance-related text (for Pricing Agent)
+
+    All other content is ignored.
+    """
 
-        # Testing & acceptance (goes to pricing agent later)
-        if any(k in lower_line for k in testing_keywords):
-            testing_text.append(clean_line)
-            continue
+    technical_text = []
+    testing_text = []
 
-        # Technical requirements (goes to technical agent later)
-        if any(k in lower_line for k in technical_keywords):
-            technical_text.append(clean_line)
+    for role, line in iter_role_relevant_lines(full_text.splitlines()):
+        if role == "testing":
+            testing_text.append(line)
+        else:
+            technical_text.append(line)
 
     return {
         "technical_text": technical_text,
@@ -0,0 +1,230 @@
+import hashlib
+import os
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from contextlib import closing
+from typing import Iterable, Iterator, Optional
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+# Page records in the compressed stream: 4-byte length + UTF-8 text
+PAGE_HEADER = struct.Struct("<I")
+
+
+def iter_page_blob(blob: bytes) -> Iterator[str]:
+    """Page texts from a stored blob, decompressed a chunk at a time."""
+    decompressor = zlib.decompressobj()
+    buffer = b""
+    for i in range(0, len(blob), READ_CHUNK_SIZE):
+        buffer += decompressor.decompress(blob[i:i + READ_CHUNK_SIZE])
+        pos = 0
+        while len(buffer) - pos >= PAGE_HEADER.size:
+            (length,) = PAGE_HEADER.unpack_from(buffer, pos)
+            start = pos + PAGE_HEADER.size
+            if len(buffer) < start + length:
+                break
+            yield buffer[start:start + length].decode("utf-8")
+            pos = start + length
+        buffer = buffer[pos:]
+
+
+class PDFTextCache:
+    """
+    On-disk cache of per-page text extracted from RFP PDFs.
+
+    Entries are keyed by the file's content hash + the extractor version,
+    so a renamed or re-downloaded copy of the same tender is a hit and an
+    extractor change invalidates old text. Page texts are stored
+    as one zlib stream per PDF in SQLite, written and read page by page;
+    the least recently used entries are evicted once the stored
+    (compressed) size exceeds max_bytes.
+
+    Content hashes are remembered per (path, size, mtime), so a repeat
+    lookup of an unchanged file does not even re-read it.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pdf_text (
+                    key TEXT PRIMARY KEY,
+                    num_pages INTEGER NOT NULL,
+                    archive_member TEXT,
+                    pages BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_pdf_text_last_access "
+                "ON pdf_text (last_access)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_hashes (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def content_hash(self, file_path: str) -> str:
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT sha256 FROM file_hashes "
+                "WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (file_path, stat.st_size, stat.st_mtime_ns)
+            ).fetchone()
+        if row:
+            return row[0]
+
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, sha256) "
+                "VALUES (?, ?, ?, ?)",
+                (file_path, stat.st_size, stat.st_mtime_ns, sha256)
+            )
+        return sha256
+
+    def make_key(self, file_path: str, extractor_version: str) -> str:
+        return f"{self.content_hash(file_path)}:{extractor_version}"
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Returns:
+            dict | None: {"num_pages", "archive_member", "page_texts"},
+            page_texts being a lazy iterator
+        """
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT num_pages, archive_member, pages FROM pdf_text WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE pdf_text SET last_access = ? WHERE key = ?",
+                    (time.time(), key)
+                )
+
+        with self._lock:
+            if row:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if not row:
+            return None
+        num_pages, archive_member, pages = row
+        return {
+            "num_pages": num_pages,
+            "archive_member": archive_member,
+            "page_texts": iter_page_blob(pages)
+        }
+
+    def store_pages(
+        self,
+        key: str,
+        num_pages: int,
+        page_texts: Iterable[str],
+        archive_member: str = None
+    ) -> Iterator[str]:
+        """
+        Passes page_texts through, compressing them on the way; the entry
+        is stored once the last page has gone by (not if the consumer
+        stops early).
+        """
+        compressor = zlib.compressobj(6)
+        chunks = []
+        for text in page_texts:
+            data = text.encode("utf-8")
+            chunks.append(compressor.compress(PAGE_HEADER.pack(len(data)) + data))
+            yield text
+        chunks.append(compressor.flush())
+        self._put(key, num_pages, b"".join(chunks), archive_member)
+
+    def put(self, key: str, num_pages: int, page_texts: Iterable[str], archive_member: str = None):
+        for _ in self.store_pages(key, num_pages, page_texts, archive_member):
+            pass
+
+    def _put(self, key: str, num_pages: int, pages: bytes, archive_member: str = None):
+        now = time.time()
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pdf_text "
+                "(key, num_pages, archive_member, pages, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, num_pages, archive_member, pages, len(pages), now, now)
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM pdf_text"
+        ).fetchone()[0]
+
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        rows = conn.execute(
+            "SELECT key, size FROM pdf_text ORDER BY last_access ASC"
+        ).fetchall()
+
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM pdf_text WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self.evictions += evicted
+
+    def clear(self):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM pdf_text")
+            conn.execute("DELETE FROM file_hashes")
+
+    def stats(self) -> dict:
+        with closing(self._connect()) as conn:
+            count, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pdf_text"
+            ).fetchone()
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": count,
+            "bytes": total
+        }
@@ -1,3 +1,4 @@
 from .sales_agent import run_sales_agent
+from .pipeline import deliver_rfp
 
-__all__ = ["run_sales_agent"]
+__all__ = ["run_sales_agent", "deliver_rfp"]
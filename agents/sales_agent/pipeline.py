@@ -1,16 +1,30 @@
+import asyncio
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, project_root)
 
-from agents.sales_agent.src.fetch_html import fetch_html
+from agents.sales_agent.src.fetch_html import fetch_html_conditional
+from agents.sales_agent.src.http_cache import PageCache, body_hash
+from agents.sales_agent.src.sweep_state import SweepStateStore
+from agents.sales_agent.src.host_scheduler import get_host_scheduler, host_of
 from agents.sales_agent.src.parse_html import parse_html
-from agents.sales_agent.src.resolve_metadata import resolve_rfp_metadata
+from agents.sales_agent.src.resolve_metadata import resolve_rfp_metadata_async
 from agents.sales_agent.src.resolve_metadata.normalize_metadata import normalize_metadata
-from agents.sales_agent.src.download_pdf import download_pdf
-from core.llm import OllamaLLM
+from agents.sales_agent.src.download_pdf import download_pdf, DEFAULT_RFP_PDF
+from core.llm import build_async_llm
+from config import (
+    SALES_MAX_WORKERS,
+    PAGE_CACHE_PATH,
+    PAGE_CACHE_ENABLED,
+    SWEEP_STATE_PATH,
+    SWEEP_STATE_ENABLED,
+    SWEEP_RECHECK_HOURS,
+    SWEEP_CLOSED_RECHECK_HOURS
+)
 
 
 # ---- CONFIG ----
@@ -39,19 +53,270 @@ def is_within_next_3_months(due_date_str: str, current_date_str: str) -> bool:
     return current_date <= due_date <= max_date
 
 
-def get_rfp(start_date=None, urls=None):
+def fetch_and_parse(url, page_cache=None):
+    """
+    Fetches and parses one tender page, reusing the cached parse (and
+    metadata) when the server answers 304 or the body is unchanged.
+
+    Returns:
+        (parsed, cached_metadata, page): cached_metadata is None unless the
+        page is unchanged; page holds the validators and body hash to store
+    """
+    entry = page_cache.get(url) if page_cache else None
+
+    response = fetch_html_conditional(
+        url,
+        etag=entry["etag"] if entry else None,
+        last_modified=entry["last_modified"] if entry else None
+    )
+
+    # 304 is only possible when validators were sent, i.e. entry exists
+    if response["not_modified"]:
+        content_hash = entry["body_hash"]
+    else:
+        content_hash = body_hash(response["html"])
+
+    page = {
+        "body_hash": content_hash,
+        "etag": response["etag"],
+        "last_modified": response["last_modified"]
+    }
+
+    unchanged = entry is not None and entry["body_hash"] == content_hash
+    if page_cache:
+        page_cache.record(hit=unchanged)
+
+    if unchanged:
+        return entry["parsed"], entry["metadata"], page
+
+    return parse_html(response["html"]), None, page
+
+
+def _interleave_hosts(urls):
+    """
+    Round-robin over hosts (a1, b1, a2, b2, ...), so a long run of URLs on
+    one portal does not hold up the others.
+    """
+    by_host = {}
+    for url in urls:
+        by_host.setdefault(host_of(url), []).append(url)
+    queues = list(by_host.values())
+
+    interleaved = []
+    while queues:
+        for queue in queues:
+            interleaved.append(queue.pop(0))
+        queues = [queue for queue in queues if queue]
+    return interleaved
+
+
+def _next_url(todo, scheduler):
+    # First URL whose host has a free slot; otherwise wait on the first one
+    for i, url in enumerate(todo):
+        if scheduler.available(url):
+            return todo.pop(i)
+    return todo.pop(0)
+
+
+async def _process_url(
+    url, url_state, start_date, async_llm, fetch_pool, emit,
+    page_cache=None, sweep_state=None
+):
+    """
+    Fetch -> parse -> summarize for one URL, emitting STATUS events as it
+    goes. Errors are reported as an ERROR event and never propagate.
+    """
+    loop = asyncio.get_running_loop()
+
+    try:
+        # FETCHING
+        url_state["stages"]["fetching"]["status"] = "running"
+        emit({
+            "type": "STATUS",
+            "url": url,
+            "stage": "FETCHING",
+            "status": "RUNNING"
+        })
+
+        parsed, metadata, page = await loop.run_in_executor(
+            fetch_pool, fetch_and_parse, url, page_cache
+        )
+        cached = metadata is not None
+
+        url_state["stages"]["fetching"]["status"] = "done"
+        emit({
+            "type": "STATUS",
+            "url": url,
+            "stage": "FETCHING",
+            "status": "DONE",
+            "cached": cached
+        })
+
+        # SUMMARIZING
+        url_state["stages"]["summarizing"]["status"] = "running"
+        emit({
+            "type": "STATUS",
+            "url": url,
+            "stage": "SUMMARIZING",
+            "status": "RUNNING"
+        })
+
+        if not cached:
+            raw_metadata = await resolve_rfp_metadata_async(
+                async_llm_client=async_llm,
+                parsed_html=parsed,
+                source_url=url,
+                current_date=start_date
+            )
+            metadata = normalize_metadata(raw_metadata, url)
+
+            if page_cache:
+                await loop.run_in_executor(
+                    fetch_pool,
+                    lambda: page_cache.put(url, parsed=parsed, metadata=metadata, **page)
+                )
+
+        if sweep_state:
+            await loop.run_in_executor(
+                fetch_pool,
+                sweep_state.record_success, url, page["body_hash"], metadata
+            )
+
+        url_state["stages"]["summarizing"]["status"] = "done"
+        url_state["metadata"] = metadata
+        url_state["status"] = "SUMMARIZED"
+        emit({
+            "type": "STATUS",
+            "url": url,
+            "stage": "SUMMARIZING",
+            "status": "DONE",
+            "metadata": metadata,
+            "cached": cached,
+            # {"before", "after"} estimated prompt tokens; None if no LLM call
+            "prompt_tokens": (metadata.get("extraction") or {}).get("prompt_tokens")
+        })
+
+    except Exception as e:
+        url_state["status"] = "ERROR"
+        url_state["error"] = str(e)
+        if sweep_state:
+            await loop.run_in_executor(
+                fetch_pool, sweep_state.record_failure, url, str(e)
+            )
+        emit({
+            "type": "STATUS",
+            "url": url,
+            "stage": "ERROR",
+            "error": str(e)
+        })
+
+
+def process_urls_concurrently(
+    url_states, start_date, async_llm, max_workers,
+    page_cache=None, sweep_state=None
+):
+    """
+    Runs every URL through fetch -> parse -> summarize on a pool of
+    `max_workers` workers and yields STATUS events as work completes.
+
+    While one worker waits on the LLM another is already fetching, so a
+    sweep costs roughly the slowest chain instead of the sum of all of them.
+    LLM calls stay capped by the async client's own concurrency limit;
+    fetches by the per-host scheduler, and workers pick URLs on hosts with
+    a free slot first so one throttled portal does not stall the rest.
+    """
+    loop = asyncio.new_event_loop()
+    events = asyncio.Queue()
+    fetch_pool = ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="sales-fetch"
+    )
+    scheduler = get_host_scheduler()
+
+    async def worker(todo):
+        while todo:
+            url = _next_url(todo, scheduler)
+            await _process_url(
+                url, url_states[url], start_date,
+                async_llm, fetch_pool, events.put_nowait,
+                page_cache, sweep_state
+            )
+
+    async def run_all():
+        todo = _interleave_hosts(url_states)
+        try:
+            await asyncio.gather(*(
+                worker(todo) for _ in range(min(max_workers, len(todo)))
+            ))
+        finally:
+            events.put_nowait(None)
+
+    runner = loop.create_task(run_all())
+
+    try:
+        while True:
+            event = loop.run_until_complete(events.get())
+            if event is None:
+                break
+            yield event
+    finally:
+        # Consumer stopped early: cancel whatever is still running
+        if not runner.done():
+            runner.cancel()
+            loop.run_until_complete(
+                asyncio.gather(runner, return_exceptions=True)
+            )
+        fetch_pool.shutdown(wait=False)
+        loop.close()
+
+
+def deliver_rfp(rfp, sweep_state=None):
+    """
+    Downloads the tender PDF of an accepted RFP and sets rfp["rfp_pdf_path"].
+    Already-delivered RFPs are returned as they are.
+
+    The PDF from an earlier run is reused if the page has not changed since.
+    """
+    if rfp.get("rfp_pdf_path"):
+        return rfp
+
+    if sweep_state is None and SWEEP_STATE_ENABLED:
+        sweep_state = SweepStateStore(
+            SWEEP_STATE_PATH,
+            recheck_s=SWEEP_RECHECK_HOURS * 3600,
+            closed_recheck_s=SWEEP_CLOSED_RECHECK_HOURS * 3600
+        )
+
+    url = rfp["source_url"]
+    pdf_path = None
+    if sweep_state:
+        state = sweep_state.get_many([url]).get(url)
+        if state and state["pdf_path"] and os.path.exists(state["pdf_path"]):
+            pdf_path = state["pdf_path"]
+
+    if not pdf_path:
+        pdf_path = download_pdf(
+            pdf_url=rfp["pdf_url"],
+            source_url=rfp["source_url"]
+        )
+        if sweep_state and pdf_path != DEFAULT_RFP_PDF:
+            sweep_state.record_pdf(url, pdf_path)
+
+    rfp["rfp_pdf_path"] = pdf_path
+    return rfp
+
+
+def get_rfp(start_date=None, urls=None, max_workers=SALES_MAX_WORKERS):
     """
     Generator-based Sales Agent pipeline.
     Yields progress events and a final result.
+
+    Args:
+        max_workers (int): URLs processed at once (1 = one after another)
     """
     if not start_date:
         start_date = CURRENT_DATE
 
-    llm_client = OllamaLLM(
-        model="llama3.2",
-        base_url="http://localhost:11434"
-    )
-
     # ---- Load URLs ----
     if urls:
         url_list = urls
@@ -59,8 +324,9 @@ def get_rfp(start_date=None, urls=None):
         url_list = load_urls(URLS_FILE)
 
     url_results = []
+    url_states = {}
 
-    # ---- PER-URL PIPELINE ----
+    # ---- QUEUE ALL URLS ----
     for url in url_list:
         url_state = {
             "url": url,
@@ -71,8 +337,9 @@ def get_rfp(start_date=None, urls=None):
             "metadata": None,
             "status": "PENDING"
         }
+        url_results.append(url_state)
+        url_states[url] = url_state
 
-        # QUEUED
         yield {
             "type": "STATUS",
             "url": url,
@@ -80,69 +347,56 @@ def get_rfp(start_date=None, urls=None):
             "state": url_state
         }
 
-        try:
-            # FETCHING
-            url_state["stages"]["fetching"]["status"] = "running"
-            yield {
-                "type": "STATUS",
-                "url": url,
-                "stage": "FETCHING",
-                "status": "RUNNING"
-            }
-
-            html = fetch_html(url)
-            parsed = parse_html(html)
+    # ---- SETTLED URLS (served from the sweep state store) ----
+    sweep_state = None
+    stored = {}
+    if SWEEP_STATE_ENABLED:
+        sweep_state = SweepStateStore(
+            SWEEP_STATE_PATH,
+            recheck_s=SWEEP_RECHECK_HOURS * 3600,
+            closed_recheck_s=SWEEP_CLOSED_RECHECK_HOURS * 3600
+        )
+        stored = sweep_state.get_many(url_states)
+
+    pending_states = {}
+    for url, url_state in url_states.items():
+        state = stored.get(url)
+        if not (sweep_state and sweep_state.is_settled(state, start_date)):
+            pending_states[url] = url_state
+            continue
 
-            url_state["stages"]["fetching"]["status"] = "done"
-            yield {
-                "type": "STATUS",
-                "url": url,
-                "stage": "FETCHING",
-                "status": "DONE"
-            }
+        url_state["stages"]["fetching"]["status"] = "done"
+        url_state["stages"]["summarizing"]["status"] = "done"
+        url_state["metadata"] = state["metadata"]
+        url_state["status"] = "SUMMARIZED"
 
-            # SUMMARIZING
-            url_state["stages"]["summarizing"]["status"] = "running"
-            yield {
-                "type": "STATUS",
-                "url": url,
-                "stage": "SUMMARIZING",
-                "status": "RUNNING"
-            }
+        yield {
+            "type": "STATUS",
+            "url": url,
+            "stage": "FETCHING",
+            "status": "DONE",
+            "cached": True
+        }
+        yield {
+            "type": "STATUS",
+            "url": url,
+            "stage": "SUMMARIZING",
+            "status": "DONE",
+            "metadata": state["metadata"],
+            "cached": True
+        }
 
-            raw_metadata = resolve_rfp_metadata(
-                llm_client=llm_client,
-                parsed_html=parsed,
-                source_url=url,
-                current_date=start_date
+    # ---- NEW / CHANGED URLS: FETCH + SUMMARIZE (worker pool) ----
+    if pending_states:
+        async_llm = build_async_llm()
+        page_cache = PageCache(PAGE_CACHE_PATH) if PAGE_CACHE_ENABLED else None
+        try:
+            yield from process_urls_concurrently(
+                pending_states, start_date, async_llm, max(1, max_workers),
+                page_cache, sweep_state
             )
-
-            metadata = normalize_metadata(raw_metadata, url)
-
-            url_state["stages"]["summarizing"]["status"] = "done"
-            url_state["metadata"] = metadata
-            url_state["status"] = "SUMMARIZED"
-
-            yield {
-                "type": "STATUS",
-                "url": url,
-                "stage": "SUMMARIZING",
-                "status": "DONE",
-                "metadata": metadata
-            }
-
-        except Exception as e:
-            url_state["status"] = "ERROR"
-            url_state["error"] = str(e)
-
-            yield {
-                "type": "STATUS",
-                "url": url,
-                "stage": "ERROR",
-                "error": str(e)
-            }
-
-        url_results.append(url_state)
+        finally:
+            async_llm.close()
 
     # ---- GLOBAL FILTERING ----
     filtered_rfps = []
@@ -174,13 +428,17 @@ def get_rfp(start_date=None, urls=None):
                 "status": "SKIPPED"
             }
 
+    # All in-window tenders, in URL order; only the selected one is delivered
+    accepted_rfps = [item["metadata"] for item in filtered_rfps]
+
     # ---- SELECT ONE RFP ----
     if not filtered_rfps:
         yield {
             "type": "FINAL_RESULT",
             "data": {
                 "urls": url_results,
-                "selected_rfp": None
+                "selected_rfp": None,
+                "accepted_rfps": accepted_rfps
             }
         }
         return
@@ -196,12 +454,7 @@ def get_rfp(start_date=None, urls=None):
         "status": "RUNNING"
     }
 
-    pdf_path = download_pdf(
-        pdf_url=selected_rfp["pdf_url"],
-        source_url=selected_rfp["source_url"]
-    )
-
-    selected_rfp["rfp_pdf_path"] = pdf_path
+    pdf_path = deliver_rfp(selected_rfp, sweep_state)["rfp_pdf_path"]
     selected_item["status"] = "DELIVERED"
 
     yield {
@@ -217,6 +470,7 @@ def get_rfp(start_date=None, urls=None):
         "type": "FINAL_RESULT",
         "data": {
             "urls": url_results,
-            "selected_rfp": selected_rfp
+            "selected_rfp": selected_rfp,
+            "accepted_rfps": accepted_rfps
         }
     }
@@ -1,8 +1,12 @@
+from config import SALES_MAX_WORKERS
 from .pipeline import get_rfp
 
-def run_sales_agent(start_date=None, urls=None):
+def run_sales_agent(start_date=None, urls=None, max_workers=SALES_MAX_WORKERS):
     """
     Public interface for Sales Agent.
     UI and Main Agent should call ONLY this method.
+
+    Up to `max_workers` URLs are fetched and summarized at once; events
+    for different URLs arrive interleaved, in completion order.
     """
-    return get_rfp(start_date=start_date, urls=urls)
+    return get_rfp(start_date=start_date, urls=urls, max_workers=max_workers)
@@ -1,6 +1,22 @@
-from .fetch_html import fetch_html
+from .fetch_html import fetch_html, fetch_html_conditional
+from .http_cache import PageCache
+from .sweep_state import SweepStateStore
 from .parse_html import parse_html
 from .resolve_metadata.resolver import resolve_rfp_metadata
-from .download_pdf import download_pdf
+from .download_pdf import download_pdf, get_download_store
+from .download_store import DownloadStore
+from .host_scheduler import HostScheduler, get_host_scheduler
 
-__all__ = ["fetch_html", "parse_html", "resolve_rfp_metadata", "download_pdf"]
\ No newline at end of file
+__all__ = [
+    "fetch_html",
+    "fetch_html_conditional",
+    "PageCache",
+    "SweepStateStore",
+    "parse_html",
+    "resolve_rfp_metadata",
+    "download_pdf",
+    "get_download_store",
+    "DownloadStore",
+    "HostScheduler",
+    "get_host_scheduler"
+]
\ No newline at end of file
@@ -1,26 +1,42 @@
 import os
-import uuid
+import threading
 import requests
 from urllib.parse import urljoin, urlparse
 from typing import Optional
 from config import DOWNLOADS_DIR
+from .download_store import DownloadStore
 
 
 DEFAULT_RFP_PDF = "data/rfp/rfp_1.pdf"
+# Stored extensions: the PDF itself or a bundle it is read from
+DOCUMENT_EXTENSIONS = (".pdf", ".zip")
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_download_store() -> DownloadStore:
+    """
+    Process-wide download store under DOWNLOADS_DIR.
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = DownloadStore(DOWNLOADS_DIR)
+        return _store
 
 
 def download_pdf(pdf_url: str, source_url: str) -> Optional[str]:
     """
-    Downloads RFP PDF and saves it at project_root/data/downloads.
+    Downloads RFP PDF into the content-addressed store at
+    project_root/data/downloads. Unchanged documents are not downloaded
+    again and interrupted downloads resume where they stopped.
     Always returns a valid PDF path:
-    - downloaded PDF path if successful
+    - downloaded (or already stored) PDF path if successful
     - DEFAULT_RFP_PDF if download fails
     """
 
     try:
-        # Create downloads directory if it doesn't exist
-        os.makedirs(DOWNLOADS_DIR, exist_ok=True)
-
         # Handle relative URLs
         full_pdf_url = urljoin(source_url, pdf_url)
 
@@ -30,41 +46,33 @@ def download_pdf(pdf_url: str, source_url: str) -> Optional[str]:
             print(f"⚠️ Invalid URL format: {full_pdf_url}")
             return DEFAULT_RFP_PDF
 
-        # Generate filename
-        base_name = os.path.basename(parsed.path) or "rfp.pdf"
-        if '?' in base_name:
-            base_name = base_name.split('?')[0]
-        if not base_name.lower().endswith('.pdf'):
-            base_name = f"{base_name}.pdf"
-
-        unique_id = uuid.uuid4().hex[:8]
-        filename = f"rfp_{unique_id}_{base_name}"
-        file_path = os.path.join(DOWNLOADS_DIR, filename)
+        # .zip bundles keep their extension; anything else (getfile.aspx,
+        # no extension, ...) is stored as .pdf
+        ext = os.path.splitext(parsed.path)[1].lower()
+        if ext not in DOCUMENT_EXTENSIONS:
+            ext = ".pdf"
 
         print(f"Downloading PDF from: {full_pdf_url}")
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
+        result = get_download_store().fetch(full_pdf_url, ext=ext)
+        file_path = result["path"]
 
-        response = requests.get(
-            full_pdf_url,
-            headers=headers,
-            timeout=30,
-            stream=True
-        )
-        response.raise_for_status()
-
-        content_type = response.headers.get("content-type", "").lower()
-        if "pdf" not in content_type and not full_pdf_url.lower().endswith(".pdf"):
+        content_type = result["content_type"]
+        if (
+            content_type is not None
+            and "pdf" not in content_type and "zip" not in content_type
+            and not full_pdf_url.lower().endswith(DOCUMENT_EXTENSIONS)
+        ):
             print(f"⚠️ Warning: Content-Type is '{content_type}', not PDF")
 
-        with open(file_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-
         if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
-            print(f"PDF saved: {file_path} ({os.path.getsize(file_path)} bytes)")
+            if result["reused"]:
+                print(f"PDF unchanged, reusing: {file_path}")
+            else:
+                print(
+                    f"PDF saved: {file_path} ({os.path.getsize(file_path)} bytes, "
+                    f"{result['bytes_transferred']} transferred)"
+                )
             return file_path
 
         print(f"⚠️ PDF save failed, using default RFP PDF")
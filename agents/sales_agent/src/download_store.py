@@ -0,0 +1,269 @@
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Optional
+
+from .host_scheduler import HostScheduler, get_host_scheduler
+
+CHUNK_SIZE = 64 * 1024
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    # Byte ranges and sizes must refer to the stored bytes, not a gzip stream
+    "Accept-Encoding": "identity"
+}
+
+
+class DownloadStore:
+    """
+    Content-addressed store for downloaded tender documents.
+
+    - Each unique document is kept once, as objects/<sha[:2]>/<sha><ext>.
+    - Per URL the ETag, Last-Modified, size and content hash are indexed,
+      so a repeat download is a conditional GET (304), or is abandoned
+      right after the headers when the size and ETag match.
+    - Interrupted downloads stay in partial/ and resume with an HTTP Range
+      request (guarded by If-Range) instead of starting over.
+
+    Requests go through `scheduler` (the shared per-host scheduler by
+    default), so downloads respect the same portal limits as page fetches.
+    """
+
+    def __init__(self, root: str, timeout: int = 30, scheduler: Optional[HostScheduler] = None):
+        self.root = root
+        self.timeout = timeout
+        self.scheduler = scheduler or get_host_scheduler()
+        self.objects_dir = os.path.join(root, "objects")
+        self.partial_dir = os.path.join(root, "partial")
+        self.index_path = os.path.join(root, "store.sqlite")
+
+        self.counters = {
+            "downloads": 0,           # requests that transferred a body
+            "reused": 0,              # served from the store, no body transferred
+            "resumed": 0,             # downloads continued from a partial file
+            "deduplicated": 0,        # downloaded, but the content was already stored
+            "bytes_downloaded": 0,    # bandwidth actually used
+            "bytes_saved_network": 0, # not transferred thanks to reuse/resume
+            "bytes_saved_disk": 0     # not stored twice thanks to deduplication
+        }
+        self._lock = threading.Lock()
+        self._url_locks = {}
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.partial_dir, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS downloads (
+                    url TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL,
+                    ext TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.index_path, timeout=30)
+
+    def _count(self, **deltas):
+        with self._lock:
+            for key, value in deltas.items():
+                self.counters[key] += value
+
+    def _url_lock(self, url: str) -> threading.Lock:
+        with self._lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def object_path(self, sha256: str, ext: str) -> str:
+        return os.path.join(self.objects_dir, sha256[:2], f"{sha256}{ext}")
+
+    # ---------------------------------------------------------
+    # INDEX
+    # ---------------------------------------------------------
+    def _get_entry(self, url: str) -> Optional[dict]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT sha256, ext, size, etag, last_modified "
+                "FROM downloads WHERE url = ?", (url,)
+            ).fetchone()
+        if not row:
+            return None
+        sha256, ext, size, etag, last_modified = row
+        path = self.object_path(sha256, ext)
+        if not os.path.exists(path):
+            return None
+        return {
+            "sha256": sha256,
+            "ext": ext,
+            "size": size,
+            "etag": etag,
+            "last_modified": last_modified,
+            "path": path
+        }
+
+    def _put_entry(self, url, sha256, ext, size, etag, last_modified):
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO downloads "
+                "(url, sha256, ext, size, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, sha256, ext, size, etag, last_modified, time.time())
+            )
+
+    # ---------------------------------------------------------
+    # PARTIAL DOWNLOADS
+    # ---------------------------------------------------------
+    def _partial_paths(self, url: str):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.partial_dir, key)
+        return base + ".part", base + ".json"
+
+    def _load_partial(self, url: str) -> Optional[dict]:
+        part_path, meta_path = self._partial_paths(url)
+        if not (os.path.exists(part_path) and os.path.exists(meta_path)):
+            return None
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        meta["offset"] = os.path.getsize(part_path)
+        # Without a validator a resumed range could splice two versions
+        if not meta["offset"] or not (meta.get("etag") or meta.get("last_modified")):
+            return None
+        return meta
+
+    def _discard_partial(self, url: str):
+        for path in self._partial_paths(url):
+            if os.path.exists(path):
+                os.remove(path)
+
+    # ---------------------------------------------------------
+    # FETCH
+    # ---------------------------------------------------------
+    def fetch(self, url: str, ext: str = ".pdf") -> dict:
+        """
+        Gets the document at `url`, downloading only what is not already
+        in the store.
+
+        Returns:
+            dict: {"path", "reused" (no body transferred),
+                   "bytes_transferred" (by this call), "content_type"
+                   (None when reused)}
+
+        Raises:
+            requests.RequestException: On network/HTTP errors (a partial
+            file is kept for the next attempt)
+        """
+        with self._url_lock(url):
+            return self._fetch(url, ext)
+
+    @staticmethod
+    def _outcome(path: str, transferred: int = 0, content_type: str = None) -> dict:
+        return {
+            "path": path,
+            "reused": content_type is None,
+            "bytes_transferred": transferred,
+            "content_type": content_type
+        }
+
+    def _fetch(self, url: str, ext: str) -> dict:
+        entry = self._get_entry(url)
+        partial = self._load_partial(url)
+
+        headers = dict(HEADERS)
+        if partial:
+            headers["Range"] = f"bytes={partial['offset']}-"
+            headers["If-Range"] = partial.get("etag") or partial["last_modified"]
+        elif entry:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        with self.scheduler.request(
+            "GET", url, headers=headers, timeout=self.timeout, stream=True
+        ) as response:
+            if response.status_code == 304 and entry:
+                self._count(reused=1, bytes_saved_network=entry["size"])
+                return self._outcome(entry["path"])
+
+            stale_partial = response.status_code == 416 and partial
+            if not stale_partial:
+                response.raise_for_status()
+                return self._handle_response(url, ext, response, entry, partial)
+
+        # Range past the end: the partial file is stale (retried outside
+        # the request so the host slot is free again)
+        self._discard_partial(url)
+        return self._fetch(url, ext)
+
+    def _handle_response(self, url, ext, response, entry, partial) -> dict:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        length = response.headers.get("Content-Length")
+
+        # Server ignored the conditional headers but it is the same file
+        if (
+            entry and response.status_code == 200
+            and etag and etag == entry["etag"]
+            and length is not None and int(length) == entry["size"]
+        ):
+            self._count(reused=1, bytes_saved_network=entry["size"])
+            return self._outcome(entry["path"])
+
+        resumed = response.status_code == 206 and partial is not None
+        return self._receive(url, ext, response, etag, last_modified, resumed, partial)
+
+    def _receive(self, url, ext, response, etag, last_modified, resumed, partial):
+        part_path, meta_path = self._partial_paths(url)
+        digest = hashlib.sha256()
+
+        if resumed:
+            etag = etag or partial.get("etag")
+            last_modified = last_modified or partial.get("last_modified")
+            with open(part_path, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            mode = "ab"
+            self._count(resumed=1, bytes_saved_network=partial["offset"])
+        else:
+            mode = "wb"
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({"etag": etag, "last_modified": last_modified}, f)
+
+        received = 0
+        try:
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    received += len(chunk)
+        finally:
+            self._count(downloads=1, bytes_downloaded=received)
+
+        sha256 = digest.hexdigest()
+        size = os.path.getsize(part_path)
+        path = self.object_path(sha256, ext)
+
+        if os.path.exists(path):
+            self._count(deduplicated=1, bytes_saved_disk=size)
+            os.remove(part_path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            shutil.move(part_path, path)
+        os.remove(meta_path)
+
+        self._put_entry(url, sha256, ext, size, etag, last_modified)
+        return self._outcome(
+            path, received, response.headers.get("Content-Type", "").lower()
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self.counters)
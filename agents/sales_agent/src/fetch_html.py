@@ -1,11 +1,22 @@
 import requests
-from typing import Optional
+from typing import Dict, Optional
+
+from .host_scheduler import get_host_scheduler
 
 
 class HTMLFetchError(Exception):
     pass
 
 
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0 Safari/537.36"
+    )
+}
+
+
 def fetch_html(url: str, timeout: int = 15) -> str:
     """
     Fetch raw HTML content from a given URL.
@@ -21,22 +32,67 @@ def fetch_html(url: str, timeout: int = 15) -> str:
         HTMLFetchError: If request fails or returns non-200
     """
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0 Safari/537.36"
-        )
-    }
+    try:
+        with get_host_scheduler().request(
+            "GET", url, headers=HEADERS, timeout=timeout
+        ) as response:
+            if response.status_code != 200:
+                raise HTMLFetchError(
+                    f"Non-200 status code {response.status_code} for URL: {url}"
+                )
+            return response.text
+    except requests.RequestException as e:
+        raise HTMLFetchError(f"Failed to fetch URL: {url}") from e
+
+
+def fetch_html_conditional(
+    url: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    timeout: int = 15
+) -> Dict:
+    """
+    Conditional GET: sends If-None-Match / If-Modified-Since when
+    validators from a previous fetch are known. Goes through the per-host
+    scheduler (rate limits, 429/503 back-off and retries).
+
+    Returns:
+        dict: {"not_modified": bool, "html": str | None,
+               "etag": str | None, "last_modified": str | None}
+
+    Raises:
+        HTMLFetchError: If request fails or returns neither 200 nor 304
+    """
+    headers = dict(HEADERS)
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
 
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
+        with get_host_scheduler().request(
+            "GET", url, headers=headers, timeout=timeout
+        ) as response:
+            html = response.text
     except requests.RequestException as e:
         raise HTMLFetchError(f"Failed to fetch URL: {url}") from e
 
+    if response.status_code == 304:
+        return {
+            "not_modified": True,
+            "html": None,
+            "etag": response.headers.get("ETag", etag),
+            "last_modified": response.headers.get("Last-Modified", last_modified)
+        }
+
     if response.status_code != 200:
         raise HTMLFetchError(
             f"Non-200 status code {response.status_code} for URL: {url}"
         )
 
-    return response.text
+    return {
+        "not_modified": False,
+        "html": html,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified")
+    }
@@ -0,0 +1,244 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+
+from config import (
+    HOST_MAX_CONCURRENCY,
+    HOST_RATE_PER_SEC,
+    HOST_BURST,
+    HOST_MAX_BACKOFF_S,
+    HOST_MAX_RETRIES
+)
+
+
+THROTTLE_STATUSES = (429, 503)
+# First back-off without Retry-After; doubles per consecutive throttle
+BASE_BACKOFF_S = 1.0
+# Throttled hosts run at a fraction of the configured rate, then recover
+MIN_RATE_FRACTION = 0.1
+RECOVERY_FRACTION = 0.1
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Retry-After as seconds: either delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class _HostState:
+    def __init__(self, rate: float, burst: int):
+        self.active = 0
+        self.rate = rate
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.strikes = 0
+
+
+class HostScheduler:
+    """
+    Per-host politeness for portal crawling.
+
+    - At most `max_per_host` requests in flight per host.
+    - Token bucket per host: `rate` requests/s on average, bursts up to
+      `burst` (rate <= 0 disables it).
+    - On 429/503 the host is paused (Retry-After when given, otherwise
+      exponential back-off) and its rate is halved, recovering gradually
+      on successful responses.
+
+    Hosts are independent, so requests to different portals never wait
+    on each other.
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = HOST_MAX_CONCURRENCY,
+        rate: float = HOST_RATE_PER_SEC,
+        burst: int = HOST_BURST,
+        max_backoff_s: float = HOST_MAX_BACKOFF_S,
+        max_retries: int = HOST_MAX_RETRIES
+    ):
+        self.max_per_host = max(1, max_per_host)
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_backoff_s = max_backoff_s
+        self.max_retries = max_retries
+
+        self._hosts = {}
+        self._cond = threading.Condition()
+        self.counters = {
+            "requests": 0,
+            "throttled": 0,     # 429/503 responses
+            "retried": 0,
+            "wait_s": 0.0       # time spent waiting for slots/tokens/back-off
+        }
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.rate, self.burst)
+        return state
+
+    def available(self, url: str) -> bool:
+        """True if a request to this URL's host could start right now."""
+        with self._cond:
+            state = self._state(host_of(url))
+            return (
+                state.active < self.max_per_host
+                and state.blocked_until <= time.monotonic()
+            )
+
+    # ---------------------------------------------------------
+    # SLOTS + TOKENS
+    # ---------------------------------------------------------
+    def _acquire(self, host: str):
+        start = time.monotonic()
+        with self._cond:
+            state = self._state(host)
+            while state.active >= self.max_per_host:
+                self._cond.wait()
+            state.active += 1
+
+        try:
+            while True:
+                with self._cond:
+                    now = time.monotonic()
+                    wait = state.blocked_until - now
+                    if wait <= 0:
+                        if self.rate <= 0:
+                            break
+                        state.tokens = min(
+                            self.burst,
+                            state.tokens + (now - state.updated) * state.rate
+                        )
+                        state.updated = now
+                        if state.tokens >= 1:
+                            state.tokens -= 1
+                            break
+                        wait = (1 - state.tokens) / state.rate
+                time.sleep(wait)
+        except BaseException:
+            self._release(host)
+            raise
+
+        with self._cond:
+            self.counters["requests"] += 1
+            self.counters["wait_s"] += time.monotonic() - start
+
+    def _release(self, host: str):
+        with self._cond:
+            self._state(host).active -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, url: str):
+        """Holds one of the host's request slots for the duration."""
+        host = host_of(url)
+        self._acquire(host)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    # ---------------------------------------------------------
+    # FEEDBACK
+    # ---------------------------------------------------------
+    def feedback(self, url: str, status_code: int, retry_after: Optional[str] = None) -> float:
+        """
+        Adapts the host's pace to a response.
+
+        Returns:
+            float: back-off applied in seconds (0 if not throttled)
+        """
+        with self._cond:
+            state = self._state(host_of(url))
+
+            if status_code not in THROTTLE_STATUSES:
+                state.strikes = 0
+                if self.rate > 0:
+                    state.rate = min(self.rate, state.rate + self.rate * RECOVERY_FRACTION)
+                return 0.0
+
+            state.strikes += 1
+            self.counters["throttled"] += 1
+            if self.rate > 0:
+                state.rate = max(self.rate * MIN_RATE_FRACTION, state.rate / 2)
+
+            delay = _retry_after_seconds(retry_after)
+            if delay is None:
+                delay = BASE_BACKOFF_S * 2 ** (state.strikes - 1)
+                delay *= random.uniform(1.0, 1.5)      # spread retries out
+            delay = min(delay, self.max_backoff_s)
+
+            state.blocked_until = max(state.blocked_until, time.monotonic() + delay)
+            return delay
+
+    # ---------------------------------------------------------
+    # REQUESTS
+    # ---------------------------------------------------------
+    @contextmanager
+    def request(self, method: str, url: str, **kwargs):
+        """
+        requests.request() under this host's limits, retrying throttled
+        responses up to max_retries times. The slot is held until the
+        block exits, so streamed bodies count against the host's cap.
+
+        Yields:
+            requests.Response (the last one if every attempt was throttled)
+        """
+        for attempt in range(self.max_retries + 1):
+            with self.slot(url):
+                response = requests.request(method, url, **kwargs)
+                self.feedback(url, response.status_code, response.headers.get("Retry-After"))
+
+                if (
+                    response.status_code in THROTTLE_STATUSES
+                    and attempt < self.max_retries
+                ):
+                    response.close()
+                    with self._cond:
+                        self.counters["retried"] += 1
+                    continue
+
+                with response:
+                    yield response
+                return
+
+    def stats(self) -> dict:
+        with self._cond:
+            stats = dict(self.counters)
+            stats["wait_s"] = round(stats["wait_s"], 3)
+            stats["hosts"] = len(self._hosts)
+            return stats
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_host_scheduler() -> HostScheduler:
+    """
+    Process-wide scheduler shared by page fetches and PDF downloads.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = HostScheduler()
+        return _scheduler
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Optional
+
+
+def body_hash(html: str) -> str:
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+class PageCache:
+    """
+    On-disk cache of tender pages for conditional re-fetching.
+
+    Per URL it keeps the validators from the last 200 response (ETag,
+    Last-Modified), a hash of the body, and what the pipeline derived from
+    that body (parse_html output and resolved metadata). When a page comes
+    back 304 or with an identical body hash, the derived data is reused and
+    the parse and LLM steps are skipped.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS page_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body_hash TEXT NOT NULL,
+                    parsed TEXT NOT NULL,
+                    metadata TEXT,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, url: str) -> Optional[dict]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified, body_hash, parsed, metadata, fetched_at "
+                "FROM page_cache WHERE url = ?", (url,)
+            ).fetchone()
+
+        if not row:
+            return None
+
+        etag, last_modified, content_hash, parsed, metadata, fetched_at = row
+        return {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_hash": content_hash,
+            "parsed": json.loads(parsed),
+            "metadata": json.loads(metadata) if metadata else None,
+            "fetched_at": fetched_at
+        }
+
+    def put(
+        self,
+        url: str,
+        body_hash: str,
+        parsed: dict,
+        metadata: Optional[dict] = None,
+        etag: str = None,
+        last_modified: str = None
+    ):
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO page_cache "
+                "(url, etag, last_modified, body_hash, parsed, metadata, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    etag,
+                    last_modified,
+                    body_hash,
+                    json.dumps(parsed),
+                    json.dumps(metadata) if metadata else None,
+                    time.time()
+                )
+            )
+
+    def record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def clear(self):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM page_cache")
+
+    def stats(self) -> dict:
+        with closing(self._connect()) as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM page_cache").fetchone()
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": count
+            }
@@ -1,19 +1,272 @@
-from bs4 import BeautifulSoup
+from collections import Counter
+from html.entities import html5
+from html.parser import HTMLParser
 from typing import Dict, List
 
+from config import HTML_PARSER_BACKEND
 
-def parse_html(html: str) -> Dict:
+
+# Tags that never hold content (no end tag is expected)
+VOID_TAGS = {
+    "area", "base", "basefont", "bgsound", "br", "col", "command", "embed",
+    "frame", "hr", "image", "img", "input", "isindex", "keygen", "link",
+    "menuitem", "meta", "nextid", "param", "source", "spacer", "track", "wbr"
+}
+
+# Text inside these is not page text (same set BeautifulSoup skips)
+NON_TEXT_TAGS = {"script", "style", "template", "rt", "rp"}
+
+FEED_CHUNK_SIZE = 64 * 1024
+
+
+# ---------------------------------------------------------
+# SINGLE-PASS EXTRACTOR
+# ---------------------------------------------------------
+class _Extractor:
     """
-    Lightweight HTML parsing to extract raw signals.
-    No assumptions, no AI, no field mapping.
+    Builds the parse_html result from a stream of start/end/data events
+    in one pass.
+
+    Open tables, rows, cells and links are tracked on stacks, so nested
+    markup gives the same result as the BeautifulSoup version (an outer
+    table also lists its inner tables' rows, a cell's text includes nested
+    cells). Rows and cells are slotted in at their start tag to keep
+    document order.
     """
 
+    def __init__(self):
+        self.text_blocks: List[str] = []
+        self.tables: List[list] = []
+        self.links: List[dict] = []
+
+        self._open = []             # open element names
+        self._tables = []           # row lists of open tables
+        self._rows = []             # cell lists of open rows
+        self._cells = []            # text parts of open cells
+        self._links = []            # (link dict, text parts) per open <a>
+        self._non_text = 0          # open script/style/... elements
+        self._pending = []          # text since the last tag
+
+    def flush(self):
+        if not self._pending:
+            return
+        text = "".join(self._pending).strip()
+        self._pending = []
+        if not text or self._non_text:
+            return
+
+        if len(text) > 2:
+            self.text_blocks.append(text)
+        for parts in self._cells:
+            parts.append(text)
+        for link, parts in self._links:
+            if link is not None:
+                parts.append(text)
+
+    def data(self, text: str):
+        self._pending.append(text)
+
+    def start(self, tag: str, href=None):
+        self.flush()
+        self._open.append(tag)
+
+        if tag in NON_TEXT_TAGS:
+            self._non_text += 1
+        elif tag == "table":
+            rows = []
+            self.tables.append(rows)
+            self._tables.append(rows)
+        elif tag == "tr":
+            cells = []
+            for rows in self._tables:
+                rows.append(cells)
+            self._rows.append(cells)
+        elif tag in ("td", "th"):
+            parts = []
+            for cells in self._rows:
+                cells.append(parts)
+            self._cells.append(parts)
+        elif tag == "a":
+            # Only <a href> become links; plain anchors still nest
+            link = None
+            if href is not None:
+                link = {"text": None, "href": href}
+                self.links.append(link)
+            self._links.append((link, []))
+
+    def end(self, tag: str):
+        self.flush()
+        if tag not in self._open:
+            # Stray end tag: ignored, like BeautifulSoup does
+            return
+
+        while self._open:
+            closed = self._open.pop()
+            self._close(closed)
+            if closed == tag:
+                break
+
+    def _close(self, tag: str):
+        if tag in NON_TEXT_TAGS:
+            self._non_text -= 1
+        elif tag == "table":
+            self._tables.pop()
+        elif tag == "tr":
+            self._rows.pop()
+        elif tag in ("td", "th"):
+            self._cells.pop()
+        elif tag == "a":
+            link, parts = self._links.pop()
+            if link is not None:
+                link["text"] = "".join(parts)
+
+    def result(self) -> Dict:
+        self.flush()
+        while self._open:
+            self._close(self._open.pop())
+
+        return {
+            "text_blocks": self.text_blocks,
+            "tables": [
+                rows for rows in (
+                    [["".join(cell) for cell in row] for row in table if row]
+                    for table in self.tables
+                )
+                if rows
+            ],
+            "links": self.links
+        }
+
+
+# ---------------------------------------------------------
+# BACKENDS
+# ---------------------------------------------------------
+class _StreamingParser(HTMLParser):
+    """
+    html.parser event handler that mirrors how BeautifulSoup's html.parser
+    builder treats character references and void-element end tags, so the
+    two backends agree even on sloppy markup.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.extractor = _Extractor()
+        # void tag -> number of <tag> whose </tag> would be redundant
+        self._closed_void = Counter()
+
+    def handle_starttag(self, tag, attrs, self_closing=False):
+        href = None
+        for name, value in attrs:
+            if name == "href":
+                # Last one wins; a bare `href` counts as empty
+                href = value if value is not None else ""
+        self.extractor.start(tag, href if tag == "a" else None)
+        if tag in VOID_TAGS and not self_closing:
+            self.extractor.end(tag)
+            self._closed_void[tag] += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs, self_closing=True)
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        # </br> after <br> is redundant and does not even split the text.
+        # (BeautifulSoup applies this to <br/> too, leaving it open; kept
+        # for identical output.)
+        if self._closed_void[tag]:
+            self._closed_void[tag] -= 1
+        else:
+            self.extractor.end(tag)
+
+    def handle_charref(self, name):
+        code = int(name[1:], 16) if name[:1] in ("x", "X") else int(name)
+        char = None
+        if code < 256:
+            # &#147; usually means Windows-1252, not the C1 control
+            try:
+                char = bytes([code]).decode("windows-1252")
+            except UnicodeDecodeError:
+                pass
+        if not char:
+            try:
+                char = chr(code)
+            except (ValueError, OverflowError):
+                pass
+        self.extractor.data(char or "\N{REPLACEMENT CHARACTER}")
+
+    def handle_entityref(self, name):
+        # Unknown names are literal text ("&copya" stays as written)
+        self.extractor.data(html5.get(name + ";", "&" + name))
+
+    def handle_data(self, data):
+        self.extractor.data(data)
+
+    def handle_comment(self, data):
+        self.extractor.flush()
+
+    def handle_decl(self, decl):
+        self.extractor.flush()
+
+    def handle_pi(self, data):
+        self.extractor.flush()
+
+    def unknown_decl(self, data):
+        self.extractor.flush()
+        if data.upper().startswith("CDATA["):
+            text = data[len("CDATA["):].strip()
+            if len(text) > 2 and not self.extractor._non_text:
+                self.extractor.text_blocks.append(text)
+
+
+def _parse_stdlib(html: str, chunk_size: int = FEED_CHUNK_SIZE) -> Dict:
+    parser = _StreamingParser()
+    # html.parser rescans its whole buffer often enough that one huge
+    # feed() gets slower per byte as pages grow; chunks keep it linear
+    for i in range(0, len(html), chunk_size):
+        parser.feed(html[i:i + chunk_size])
+    parser.close()
+    return parser.extractor.result()
+
+
+class _LxmlTarget:
+    """lxml parser target: receives the same events as _StreamingParser."""
+
+    def __init__(self):
+        self.extractor = _Extractor()
+
+    def start(self, tag, attrib):
+        self.extractor.start(tag, attrib.get("href") if tag == "a" else None)
+
+    def end(self, tag):
+        self.extractor.end(tag)
+
+    def data(self, data):
+        self.extractor.data(data)
+
+    def comment(self, text):
+        self.extractor.flush()
+
+    def close(self):
+        return self.extractor.result()
+
+
+def _parse_lxml(html: str) -> Dict:
+    from lxml import etree
+
+    parser = etree.HTMLParser(target=_LxmlTarget())
+    parser.feed(html)
+    return parser.close()
+
+
+def _parse_bs4(html: str) -> Dict:
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "html.parser")
 
     text_blocks = [
-        text.strip()
+        text
         for text in soup.stripped_strings
-        if len(text.strip()) > 2
+        if len(text) > 2
     ]
 
     tables = []
@@ -41,3 +294,42 @@ def parse_html(html: str) -> Dict:
         "tables": tables,
         "links": links
     }
+
+
+BACKENDS = {
+    "stdlib": _parse_stdlib,
+    "lxml": _parse_lxml,
+    "bs4": _parse_bs4
+}
+
+
+def available_backends() -> List[str]:
+    names = ["stdlib"]
+    for name, module in (("lxml", "lxml"), ("bs4", "bs4")):
+        try:
+            __import__(module)
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+
+def parse_html(html: str, backend: str = None) -> Dict:
+    """
+    Lightweight HTML parsing to extract raw signals.
+    No assumptions, no AI, no field mapping.
+
+    Args:
+        backend (str): "stdlib" (streaming html.parser, single pass),
+            "lxml" (libxml2, needs lxml installed) or "bs4" (original
+            BeautifulSoup tree walk). Defaults to HTML_PARSER_BACKEND.
+            lxml repairs malformed markup its own way, so its output can
+            differ from the other two on broken pages.
+    """
+    backend = backend or HTML_PARSER_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown HTML parser backend '{backend}', "
+            f"expected one of {sorted(BACKENDS)}"
+        )
+    return BACKENDS[backend](html)
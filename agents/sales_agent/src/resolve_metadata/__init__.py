@@ -1,4 +1,10 @@
-from .resolver import resolve_rfp_metadata
+from .resolver import resolve_rfp_metadata, resolve_rfp_metadata_async
 from .normalize_metadata import normalize_metadata
+from .rules import extract_metadata_rules
 
-__all__ = ["resolve_rfp_metadata", "normalize_metadata"]
\ No newline at end of file
+__all__ = [
+    "resolve_rfp_metadata",
+    "resolve_rfp_metadata_async",
+    "normalize_metadata",
+    "extract_metadata_rules"
+]
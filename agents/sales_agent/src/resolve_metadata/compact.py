@@ -0,0 +1,155 @@
+import re
+from typing import Dict, List
+
+from .rules import _label_field
+
+
+# Links worth showing the LLM: tender documents, not navigation
+DOCUMENT_EXTENSIONS = (".pdf", ".doc", ".docx", ".xls", ".xlsx", ".zip", ".rar")
+DOCUMENT_LINK_TEXT = re.compile(
+    r"download|document|rfp|tender|nit|corrigendum|specification|\.pdf", re.I
+)
+
+# Text blocks that carry no tender information. Whole blocks only (one
+# line, copyright notices up to ~100 characters), so "Contact person: ..."
+# or "Terms of payment ..." are kept
+BOILERPLATE = re.compile(
+    r"^\s*(?:"
+    r"(?:©|copyright\b).{0,100}"
+    r"|.{0,80}\ball rights reserved"
+    r"|home|help|contact(?: us)?|login|vendor login|dashboard|menu|"
+    r"skip to(?: main)? content|sitemap|faqs?|privacy(?: policy)?|"
+    r"terms(?: of use| (?:and|&) conditions)?"
+    r")[.!]?\s*$",
+    re.I
+)
+# Menus are runs of short, digit-free blocks (e.g. Home, Tenders, Vendors)
+MAX_NAV_WORDS = 3
+MIN_NAV_RUN = 5
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough LLaMA-style token count: one per word and one per punctuation
+    mark, which tracks the tokenizer far better than len/4 on repr() dumps.
+    """
+    return len(re.findall(r"\w+|[^\w\s]", text))
+
+
+def _key(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+def _is_document_link(link: dict) -> bool:
+    href = link["href"].strip()
+    if not href or href.startswith(("#", "javascript:", "mailto:")):
+        return False
+    path = href.split("?")[0].split("#")[0].lower()
+    return path.endswith(DOCUMENT_EXTENSIONS) or bool(
+        DOCUMENT_LINK_TEXT.search(link["text"])
+    )
+
+
+def _nav_indexes(text_blocks: List[str]) -> set:
+    """
+    Indexes of blocks in menu-like runs. Field labels ("Reference No",
+    "Title", ...) break a run, so label/value pairs are never dropped.
+    """
+    def nav_like(block):
+        return (
+            len(block.split()) <= MAX_NAV_WORDS
+            and not re.search(r"[\d:]", block)
+            and _label_field(block) is None
+        )
+
+    indexes = set()
+    run = []
+    for i, block in enumerate(text_blocks + [""]):
+        if block and nav_like(block):
+            run.append(i)
+            continue
+        if len(run) >= MIN_NAV_RUN:
+            indexes.update(run)
+        run = []
+    return indexes
+
+
+def compact_sections(parsed_html: Dict) -> Dict[str, List[str]]:
+    """
+    Deduplicated, boilerplate-free content as lines per section:
+    - tables: one "a | b | c" line per row
+    - links: "text -> href" for document-like links only
+    - text: blocks not already shown in a table or link
+    """
+    tables = parsed_html.get("tables", [])
+    links = parsed_html.get("links", [])
+    text_blocks = parsed_html.get("text_blocks", [])
+
+    table_lines = []
+    seen_rows = set()
+    shown = set()
+    for table in tables:
+        for row in table:
+            line = " | ".join(re.sub(r"\s+", " ", cell).strip() for cell in row)
+            if _key(line) in seen_rows:
+                continue
+            seen_rows.add(_key(line))
+            table_lines.append(line)
+            shown.update(_key(cell) for cell in row)
+        table_lines.append("")
+    while table_lines and not table_lines[-1]:
+        table_lines.pop()
+
+    link_lines = []
+    seen_hrefs = set()
+    for link in links:
+        if not _is_document_link(link) or link["href"] in seen_hrefs:
+            continue
+        seen_hrefs.add(link["href"])
+        link_lines.append(f"{link['text'] or '(no text)'} -> {link['href']}")
+        shown.add(_key(link["text"]))
+
+    nav = _nav_indexes(text_blocks)
+
+    text_lines = []
+    seen_text = set(shown)
+    for i, block in enumerate(text_blocks):
+        key = _key(block)
+        if key in seen_text or i in nav or BOILERPLATE.match(block):
+            continue
+        seen_text.add(key)
+        text_lines.append(re.sub(r"\s+", " ", block).strip())
+
+    return {"tables": table_lines, "links": link_lines, "text": text_lines}
+
+
+def format_compact_content(sections: Dict[str, List[str]]) -> str:
+    return (
+        "TEXT:\n" + "\n".join(sections["text"])
+        + "\n\nTABLES (one row per line, cells separated by |):\n"
+        + "\n".join(sections["tables"])
+        + "\n\nDOCUMENT LINKS:\n" + "\n".join(sections["links"])
+    )
+
+
+def compact_content(parsed_html: Dict, token_budget: int) -> str:
+    """
+    Compact prompt content, trimmed to at most `token_budget` tokens.
+
+    When over budget, free text is dropped first (from the end), then
+    table rows; document links are kept as long as possible since the
+    PDF link is one of the fields being extracted.
+    """
+    sections = compact_sections(parsed_html)
+    content = format_compact_content(sections)
+
+    for section in ("text", "tables", "links"):
+        lines = sections[section]
+        while lines and estimate_tokens(content) > token_budget:
+            # Drop roughly the overshoot in one go, then fine-tune
+            overshoot = estimate_tokens(content) - token_budget
+            drop = max(1, min(len(lines), overshoot // 20))
+            del lines[-drop:]
+            content = format_compact_content(sections)
+
+    return content
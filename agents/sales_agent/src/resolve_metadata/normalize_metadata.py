@@ -1,3 +1,5 @@
+import re
+from datetime import date
 from urllib.parse import urljoin
 from dateutil import parser
 
@@ -8,12 +10,17 @@ def normalize_metadata(raw_metadata: dict, source_url: str) -> dict:
     """
 
     # --- Normalize date ---
+    # ISO dates (what the LLM is asked for) must not go through dayfirst,
+    # which would read 2026-08-10 as 8 October
     raw_date = raw_metadata.get("submission_due_date")
     try:
-        submission_due_date = (
-            parser.parse(raw_date, dayfirst=True).date().isoformat()
-            if raw_date else None
-        )
+        if raw_date and re.match(r"^\d{4}-\d{2}-\d{2}", raw_date.strip()):
+            submission_due_date = date.fromisoformat(raw_date.strip()[:10]).isoformat()
+        else:
+            submission_due_date = (
+                parser.parse(raw_date, dayfirst=True).date().isoformat()
+                if raw_date else None
+            )
     except Exception:
         submission_due_date = None
 
@@ -21,10 +28,16 @@ def normalize_metadata(raw_metadata: dict, source_url: str) -> dict:
     raw_pdf_url = raw_metadata.get("pdf_url")
     pdf_url = urljoin(source_url, raw_pdf_url) if raw_pdf_url else None
 
-    return {
+    metadata = {
         "tender_reference": raw_metadata.get("tender_reference"),
         "tender_title": raw_metadata.get("tender_title"),
         "submission_due_date": submission_due_date,
         "pdf_url": pdf_url,
         "source_url": source_url
     }
+
+    # How the fields were obtained (rules / LLM) and with what confidence
+    if raw_metadata.get("extraction"):
+        metadata["extraction"] = raw_metadata["extraction"]
+
+    return metadata
@@ -1,4 +1,4 @@
-SYSTEM_PROMPT = """
+SYSTEM_PROMPT_TEMPLATE = """
 You are an AI assistant extracting structured RFP metadata from website content.
 
 STRICT RULES:
@@ -10,13 +10,74 @@ STRICT RULES:
 - Select the most relevant RFP/Tender PDF link only
 
 Required JSON fields:
-- tender_reference
-- tender_title
-- submission_due_date
-- pdf_url
+{fields}
 """
 
-def build_user_prompt(parsed_html, source_url, current_date):
+METADATA_FIELDS = [
+    "tender_reference",
+    "tender_title",
+    "submission_due_date",
+    "pdf_url"
+]
+
+# Passed to Ollama's `format` so decoding is constrained to this shape
+METADATA_SCHEMA = {
+    "type": "object",
+    "properties": {
+        field: {"type": ["string", "null"]} for field in METADATA_FIELDS
+    },
+    "required": list(METADATA_FIELDS)
+}
+
+
+def build_system_prompt(fields=None):
+    """System prompt asking for `fields` only (default: all of them)."""
+    return SYSTEM_PROMPT_TEMPLATE.format(
+        fields="\n".join(f"- {field}" for field in fields or METADATA_FIELDS)
+    )
+
+
+SYSTEM_PROMPT = build_system_prompt()
+
+
+def build_metadata_schema(fields):
+    """METADATA_SCHEMA restricted to `fields` (the ones still unresolved)."""
+    return {
+        "type": "object",
+        "properties": {field: METADATA_SCHEMA["properties"][field] for field in fields},
+        "required": list(fields)
+    }
+
+def format_raw_content(parsed_html):
+    """Original content section: repr() of every block, table and link."""
+    return f"""TEXT BLOCKS:
+{parsed_html['text_blocks']}
+
+TABLES:
+{parsed_html['tables']}
+
+LINKS:
+{parsed_html['links']}"""
+
+
+FIELD_INSTRUCTIONS = {
+    "tender_reference": "Identify the tender reference number",
+    "tender_title": "Identify the tender title",
+    "submission_due_date": (
+        "Identify the submission due date "
+        "(submission end / bid submission end / deadline)"
+    ),
+    "pdf_url": "Identify the most relevant RFP PDF link from the links section"
+}
+
+
+def build_user_prompt(parsed_html, source_url, current_date, content=None, fields=None):
+    if content is None:
+        content = format_raw_content(parsed_html)
+    instructions = "\n".join(
+        f"- {FIELD_INSTRUCTIONS[field]}" for field in fields or METADATA_FIELDS
+    )
+
     return f"""
 Current date: {current_date}
 Source URL: {source_url}
@@ -25,19 +86,9 @@ TASK:
 Extract RFP/Tender metadata.
 
 INSTRUCTIONS:
-- Identify the tender reference number
-- Identify the tender title
-- Identify the submission due date (submission end / bid submission end / deadline)
-- Identify the most relevant RFP PDF link from the links section
+{instructions}
 
 CONTENT:
 
-TEXT BLOCKS:
-{parsed_html['text_blocks']}
-
-TABLES:
-{parsed_html['tables']}
-
-LINKS:
-{parsed_html['links']}
+{content}
 """
@@ -1,27 +1,117 @@
-import json
-import re
-from .prompt import SYSTEM_PROMPT, build_user_prompt
+from config import (
+    METADATA_RULES_ENABLED,
+    METADATA_RULES_MIN_CONFIDENCE,
+    METADATA_PROMPT_COMPACT,
+    METADATA_PROMPT_TOKEN_BUDGET
+)
+from .compact import compact_content, estimate_tokens
+from .prompt import (
+    METADATA_FIELDS,
+    build_metadata_schema,
+    build_system_prompt,
+    build_user_prompt
+)
+from .rules import extract_metadata_rules
 
-def resolve_rfp_metadata(llm_client, parsed_html, source_url, current_date):
-    user_prompt = build_user_prompt(parsed_html, source_url, current_date)
 
-    full_prompt = f"""
-{SYSTEM_PROMPT}
+def _assemble_prompt(parsed_html, source_url, current_date, fields, content=None):
+    # Only ask for what the rules could not settle
+    user_prompt = build_user_prompt(
+        parsed_html, source_url, current_date, content, fields
+    )
+
+    return f"""
+{build_system_prompt(fields)}
 
 USER INPUT:
 {user_prompt}
 """
 
-    response_text = llm_client.generate(full_prompt)
 
-    # Defensive JSON extraction (LLMs sometimes add text)
-    match = re.search(r"\{.*\}", response_text, re.S)
-    if not match:
-        raise ValueError("LLM did not return valid JSON")
+def build_metadata_prompt(parsed_html, source_url, current_date, fields=None):
+    """
+    Returns:
+        (prompt, token counts {"before": full repr prompt, "after": sent})
+    """
+    raw_prompt = _assemble_prompt(parsed_html, source_url, current_date, fields)
+    before = estimate_tokens(raw_prompt)
+
+    if not METADATA_PROMPT_COMPACT:
+        return raw_prompt, {"before": before, "after": before}
+
+    # Budget covers the whole prompt; the content gets what is left
+    overhead = estimate_tokens(
+        _assemble_prompt(parsed_html, source_url, current_date, fields, content="")
+    )
+    content = compact_content(
+        parsed_html, max(0, METADATA_PROMPT_TOKEN_BUDGET - overhead)
+    )
+    prompt = _assemble_prompt(parsed_html, source_url, current_date, fields, content)
+    return prompt, {"before": before, "after": estimate_tokens(prompt)}
+
+
+def _rules_first(parsed_html):
+    """
+    Runs the rule-based extractor; returns (rules result, fields for the LLM).
+    """
+    if not METADATA_RULES_ENABLED:
+        return None, list(METADATA_FIELDS)
+
+    rules = extract_metadata_rules(parsed_html, METADATA_RULES_MIN_CONFIDENCE)
+    return rules, rules["missing"]
+
+
+def _merge(rules, llm_metadata, llm_fields, prompt_tokens=None):
+    """
+    Rule values for confident fields, LLM values for the rest, plus a
+    record of how the metadata was obtained.
+    """
+    metadata = dict(rules["metadata"]) if rules else {}
+    for field in llm_fields:
+        metadata[field] = (llm_metadata or {}).get(field)
 
-    try:
-        metadata = json.loads(match.group())
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON returned by LLM: {e}")
+    if not llm_fields:
+        method = "rules"
+    elif rules and len(llm_fields) < len(METADATA_FIELDS):
+        method = "rules+llm"
+    else:
+        method = "llm"
 
+    metadata["extraction"] = {
+        "method": method,
+        "llm_fields": list(llm_fields),
+        "confidence": rules["confidence"] if rules else {},
+        "prompt_tokens": prompt_tokens
+    }
     return metadata
+
+
+def resolve_rfp_metadata(llm_client, parsed_html, source_url, current_date):
+    rules, llm_fields = _rules_first(parsed_html)
+    if not llm_fields:
+        return _merge(rules, None, llm_fields)
+
+    full_prompt, prompt_tokens = build_metadata_prompt(
+        parsed_html, source_url, current_date, llm_fields
+    )
+
+    # JSON mode + schema validation; raises LLMJSONError (a ValueError)
+    # only if no JSON object can be recovered at all
+    llm_metadata = llm_client.generate_json(
+        full_prompt, build_metadata_schema(llm_fields), stage="sales_metadata"
+    )
+    return _merge(rules, llm_metadata, llm_fields, prompt_tokens)
+
+
+async def resolve_rfp_metadata_async(async_llm_client, parsed_html, source_url, current_date):
+    rules, llm_fields = _rules_first(parsed_html)
+    if not llm_fields:
+        return _merge(rules, None, llm_fields)
+
+    full_prompt, prompt_tokens = build_metadata_prompt(
+        parsed_html, source_url, current_date, llm_fields
+    )
+    llm_metadata = await async_llm_client.generate_json(
+        full_prompt, build_metadata_schema(llm_fields), stage="sales_metadata"
+    )
+    return _merge(rules, llm_metadata, llm_fields, prompt_tokens)
@@ -0,0 +1,213 @@
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from dateutil import parser as date_parser
+
+from .prompt import METADATA_FIELDS
+
+
+# Two defaults differing in day, month and year (see _valid_value)
+DATE_DEFAULTS = (datetime(2000, 1, 1), datetime(2001, 2, 2))
+
+
+# ---------------------------------------------------------
+# FIELD LABELS
+# ---------------------------------------------------------
+# Matched against a whole (normalized) label cell, e.g. "Tender Reference No"
+FIELD_LABELS = {
+    "tender_reference": re.compile(
+        r"^(tender|bid|rfp|nit|enquiry)?\s*(reference|ref|id|no|number)"
+        r"(\s*(no|number|id))?$"
+    ),
+    "tender_title": re.compile(
+        r"^(tender|bid|rfp)?\s*(title|name of work|subject|work name)$"
+    ),
+    "submission_due_date": re.compile(
+        r"^(bid|tender|offer)?\s*(submission\s*(end|closing|last|due)"
+        r"(\s*date)?(\s*(and|&)\s*time)?|closing date|last date.*submission.*"
+        r"|due date|submission deadline|deadline)$"
+    ),
+}
+
+# Confidence per source of a label/value pair
+TABLE_CONFIDENCE = 0.95
+TEXT_CONFIDENCE = 0.85
+
+DOCUMENT_HINTS = re.compile(r"rfp|tender|nit|bid|document|specification", re.I)
+
+
+def _normalize_label(text: str) -> str:
+    text = text.lower().replace(".", " ").replace(":", " ")
+    text = re.sub(r"/.*$", "", text)          # drop bilingual suffixes
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _label_field(text: str) -> Optional[str]:
+    if len(text) > 60:
+        return None
+    label = _normalize_label(text)
+    for field, pattern in FIELD_LABELS.items():
+        if pattern.match(label):
+            return field
+    return None
+
+
+# ---------------------------------------------------------
+# CANDIDATES
+# ---------------------------------------------------------
+def _table_pairs(tables: List[list]) -> List[Tuple[str, str]]:
+    """
+    Label/value pairs from key-value style rows:
+    [label, value] or [label, value, label, value].
+    """
+    pairs = []
+    for table in tables:
+        for row in table:
+            if len(row) % 2:
+                continue
+            for i in range(0, len(row), 2):
+                pairs.append((row[i], row[i + 1]))
+    return pairs
+
+
+def _text_pairs(text_blocks: List[str]) -> List[Tuple[str, str]]:
+    """
+    "Label: value" blocks and label blocks directly followed by their value
+    (definition lists, div grids).
+    """
+    pairs = []
+    for i, block in enumerate(text_blocks):
+        label, sep, value = block.partition(":")
+        if sep and value.strip():
+            pairs.append((label, value.strip()))
+        if i + 1 < len(text_blocks):
+            pairs.append((block, text_blocks[i + 1]))
+    return pairs
+
+
+def _valid_value(field: str, value: str) -> bool:
+    value = value.strip()
+    if not value or _label_field(value):
+        return False
+
+    if field == "submission_due_date":
+        # dateutil fills missing parts from the default, so "15:00",
+        # "Friday" or "March" would parse; a full date parses the same
+        # whatever the default
+        try:
+            parsed = [
+                date_parser.parse(value, dayfirst=True, fuzzy=False, default=default)
+                for default in DATE_DEFAULTS
+            ]
+        except (ValueError, OverflowError):
+            return False
+        return parsed[0] == parsed[1]
+
+    if field == "tender_reference":
+        # Reference numbers are one token with at least one digit
+        return (
+            4 <= len(value) <= 80
+            and " " not in value
+            and bool(re.search(r"\d", value))
+        )
+
+    return len(value) <= 300
+
+
+def _best_candidate(candidates: List[Tuple[str, float]]) -> Tuple[Optional[str], float]:
+    """
+    Highest-confidence value; disagreeing values at that level mean the
+    page is ambiguous (e.g. original vs corrigendum dates).
+    """
+    if not candidates:
+        return None, 0.0
+
+    best = max(conf for _, conf in candidates)
+    values = {
+        re.sub(r"\s+", " ", value).strip()
+        for value, conf in candidates
+        if conf == best
+    }
+    if len(values) > 1:
+        return None, 0.0
+    return values.pop(), best
+
+
+def _pdf_candidate(links: List[dict], reference: Optional[str]) -> Tuple[Optional[str], float]:
+    pdf_links = [
+        link for link in links
+        if link["href"].split("?")[0].split("#")[0].lower().endswith(".pdf")
+    ]
+    hrefs = list(dict.fromkeys(link["href"] for link in pdf_links))
+
+    if len(hrefs) == 1:
+        return hrefs[0], TABLE_CONFIDENCE
+    if not hrefs:
+        return None, 0.0
+
+    # Several PDFs: take the one named after the tender, if exactly one is
+    preferred = [
+        link["href"] for link in pdf_links
+        if (reference and reference.lower() in (link["text"] + link["href"]).lower())
+    ] or [
+        link["href"] for link in pdf_links
+        if DOCUMENT_HINTS.search(link["text"] + " " + link["href"])
+    ]
+    preferred = list(dict.fromkeys(preferred))
+    if len(preferred) == 1:
+        return preferred[0], TEXT_CONFIDENCE
+    return None, 0.0
+
+
+# ---------------------------------------------------------
+# EXTRACTOR
+# ---------------------------------------------------------
+def extract_metadata_rules(parsed_html: Dict, min_confidence: float) -> Dict:
+    """
+    Rule-based metadata extraction from parse_html output.
+
+    Looks for known field labels in key/value table rows and text blocks,
+    and for the tender PDF among the links. Ambiguous fields (two different
+    values with equal support) are left unresolved.
+
+    Returns:
+        dict: {
+            "metadata": {field: value or None},
+            "confidence": {field: 0..1},
+            "missing": [fields below min_confidence, for the LLM]
+        }
+    """
+    candidates = {field: [] for field in FIELD_LABELS}
+
+    sources = [
+        (_table_pairs(parsed_html.get("tables", [])), TABLE_CONFIDENCE),
+        (_text_pairs(parsed_html.get("text_blocks", [])), TEXT_CONFIDENCE)
+    ]
+    for pairs, confidence in sources:
+        for label, value in pairs:
+            field = _label_field(label)
+            if field and _valid_value(field, value):
+                candidates[field].append((value, confidence))
+
+    metadata = {}
+    confidence = {}
+    for field in FIELD_LABELS:
+        metadata[field], confidence[field] = _best_candidate(candidates[field])
+
+    metadata["pdf_url"], confidence["pdf_url"] = _pdf_candidate(
+        parsed_html.get("links", []), metadata["tender_reference"]
+    )
+
+    missing = [
+        field for field in METADATA_FIELDS
+        if confidence[field] < min_confidence
+    ]
+    for field in missing:
+        metadata[field] = None
+
+    return {
+        "metadata": metadata,
+        "confidence": confidence,
+        "missing": missing
+    }
@@ -0,0 +1,134 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Dict, Iterable, Optional
+
+
+class SweepStateStore:
+    """
+    Per-URL sales sweep state that persists across runs.
+
+    For every tender URL it records the last content hash, the resolved
+    metadata and due date, the downloaded PDF and how often it has failed
+    in a row. A URL is settled (served from the store without any network
+    or LLM work) when it was summarized successfully less than `recheck_s`
+    seconds ago, or `closed_recheck_s` once its tender has closed (a
+    corrigendum can still extend the deadline).
+    """
+
+    def __init__(self, path: str, recheck_s: float, closed_recheck_s: float = None):
+        self.path = path
+        self.recheck_s = recheck_s
+        self.closed_recheck_s = recheck_s if closed_recheck_s is None else closed_recheck_s
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sweep_state (
+                    url TEXT PRIMARY KEY,
+                    content_hash TEXT,
+                    metadata TEXT,
+                    due_date TEXT,
+                    pdf_path TEXT,
+                    failure_count INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    last_checked REAL NOT NULL
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def _row_to_dict(row) -> dict:
+        (url, content_hash, metadata, due_date, pdf_path,
+         failure_count, last_error, last_checked) = row
+        return {
+            "url": url,
+            "content_hash": content_hash,
+            "metadata": json.loads(metadata) if metadata else None,
+            "due_date": due_date,
+            "pdf_path": pdf_path,
+            "failure_count": failure_count,
+            "last_error": last_error,
+            "last_checked": last_checked
+        }
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, dict]:
+        urls = list(urls)
+        states = {}
+        with closing(self._connect()) as conn:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(urls), 500):
+                batch = urls[i:i + 500]
+                rows = conn.execute(
+                    "SELECT url, content_hash, metadata, due_date, pdf_path, "
+                    "failure_count, last_error, last_checked FROM sweep_state "
+                    f"WHERE url IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+                for row in rows:
+                    states[row[0]] = self._row_to_dict(row)
+        return states
+
+    def is_settled(self, state: Optional[dict], current_date: str) -> bool:
+        if not state or not state["metadata"] or state["failure_count"]:
+            return False
+
+        # Closed tenders rarely change, but are still re-checked now and then
+        due_date = state["due_date"]
+        recheck_s = (
+            self.closed_recheck_s if due_date and due_date < current_date
+            else self.recheck_s
+        )
+        return time.time() - state["last_checked"] < recheck_s
+
+    def record_success(self, url: str, content_hash: str, metadata: dict):
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO sweep_state "
+                "(url, content_hash, metadata, due_date, failure_count, last_checked) "
+                "VALUES (?, ?, ?, ?, 0, ?) "
+                "ON CONFLICT(url) DO UPDATE SET "
+                "pdf_path = CASE WHEN content_hash = excluded.content_hash "
+                "THEN pdf_path END, "
+                "content_hash = excluded.content_hash, "
+                "metadata = excluded.metadata, "
+                "due_date = excluded.due_date, "
+                "failure_count = 0, last_error = NULL, "
+                "last_checked = excluded.last_checked",
+                (
+                    url,
+                    content_hash,
+                    json.dumps(metadata),
+                    metadata.get("submission_due_date"),
+                    time.time()
+                )
+            )
+
+    def record_failure(self, url: str, error: str):
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO sweep_state "
+                "(url, failure_count, last_error, last_checked) "
+                "VALUES (?, 1, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET "
+                "failure_count = failure_count + 1, "
+                "last_error = excluded.last_error, "
+                "last_checked = excluded.last_checked",
+                (url, error, time.time())
+            )
+
+    def record_pdf(self, url: str, pdf_path: str):
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE sweep_state SET pdf_path = ? WHERE url = ?",
+                (pdf_path, url)
+            )
+
+    def clear(self):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM sweep_state")
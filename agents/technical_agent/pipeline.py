@@ -1,13 +1,29 @@
+import asyncio
+
 from agents.technical_agent.src.validate_input import validate_technical_input
 from agents.technical_agent.src.load_oem import load_oem_products
-from agents.technical_agent.src.normalize_specs import normalize_spec_block_llm
+from agents.technical_agent.src.normalize_specs import normalize_spec_block_llm_async
 from agents.technical_agent.src.select_top_oem import select_top_oem_products
 from agents.technical_agent.src.normalize_oem import normalize_oem_product
-from core.llm.ollama_client import OllamaLLM
+from core.llm import build_async_llm
 
 OEM_CSV_PATH = "data/oem_products.csv"
 
 
+async def normalize_products_concurrently(async_llm, rfp_products: list) -> list:
+    """
+    Issues one normalization call per RFP item concurrently.
+    Results are returned in input order.
+    """
+    return await asyncio.gather(*[
+        normalize_spec_block_llm_async(
+            async_llm,
+            "\n".join(product.get("raw_block", []))
+        )
+        for product in rfp_products
+    ])
+
+
 def run_technical_pipeline(main_result: dict) -> dict:
 
     # Step 1: Validate
@@ -22,16 +38,18 @@ def run_technical_pipeline(main_result: dict) -> dict:
     oem_products = [normalize_oem_product(oem) for oem in raw_oem_products]
 
 
-    # Step 3: Normalize (AI)
-    llm = OllamaLLM(model="llama3.2")
-    normalized_products = []
+    # Step 3: Normalize (AI) — one concurrent call per item
+    async_llm = build_async_llm()
+    try:
+        normalized_specs = asyncio.run(
+            normalize_products_concurrently(async_llm, rfp_products)
+        )
+    finally:
+        async_llm.close()
 
-    for product in rfp_products:
-        raw_text = "\n".join(product.get("raw_block", []))
-        normalized = normalize_spec_block_llm(llm, raw_text)
+    normalized_products = []
 
-        normalized = normalize_spec_block_llm(llm, raw_text)
-        
+    for product, normalized in zip(rfp_products, normalized_specs):
         if not normalized or not isinstance(normalized, dict):
             normalized = {}
 
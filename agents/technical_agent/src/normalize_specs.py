@@ -1,6 +1,6 @@
 from typing import Dict
-import json
-import re
+
+from core.llm.json_output import LLMJSONError
 
 
 NORMALIZED_KEYS = [
@@ -13,13 +13,24 @@ NORMALIZED_KEYS = [
     "standards"
 ]
 
+NORMALIZED_SPECS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "category": {"type": ["string", "null"]},
+        "cable_type": {"type": ["string", "null"]},
+        "armored": {"type": ["boolean", "null"]},
+        "conductor_material": {"type": ["string", "null"]},
+        "conductor_size": {"type": ["string", "null"]},
+        "voltage_rating": {"type": ["string", "null"]},
+        "standards": {"type": ["string", "array", "null"]}
+    },
+    "required": NORMALIZED_KEYS,
+    "additionalProperties": False
+}
 
-def normalize_spec_block_llm(llm_client, raw_text: str) -> Dict:
-    """
-    Uses LLM to normalize unstructured spec text into structured fields.
-    """
 
-    prompt = f"""
+def build_normalization_prompt(raw_text: str) -> str:
+    return f"""
 You are a technical specification normalization assistant.
 
 TASK:
@@ -39,16 +50,32 @@ TEXT:
 {raw_text}
 """
 
-    response = llm_client.generate(prompt)
 
-    # Defensive JSON extraction
-    match = re.search(r"\{.*\}", response, re.S)
-    if not match:
+def normalize_spec_block_llm(llm_client, raw_text: str) -> Dict:
+    """
+    Uses LLM to normalize unstructured spec text into structured fields.
+    """
+    try:
+        return llm_client.generate_json(
+            build_normalization_prompt(raw_text),
+            NORMALIZED_SPECS_SCHEMA,
+            stage="spec_normalization"
+        )
+    except LLMJSONError:
         print("⚠️ LLM did not return valid JSON")
         return {}
 
+
+async def normalize_spec_block_llm_async(async_llm_client, raw_text: str) -> Dict:
+    """
+    Async variant of normalize_spec_block_llm for concurrent fan-out.
+    """
     try:
-        return json.loads(match.group())
-    except json.JSONDecodeError:
-        print("⚠️ Failed to parse LLM JSON output")
+        return await async_llm_client.generate_json(
+            build_normalization_prompt(raw_text),
+            NORMALIZED_SPECS_SCHEMA,
+            stage="spec_normalization"
+        )
+    except LLMJSONError:
+        print("⚠️ LLM did not return valid JSON")
         return {}
@@ -0,0 +1,111 @@
+"""
+Benchmark: peak memory and time-to-first-line of the Main Agent's PDF →
+classifier → product table stage, streaming vs the original full-text
+path, on synthetic tender PDFs of growing size.
+
+- legacy:    the original code (pdfplumber pages kept open, full_text
+             string, splitlines() copy, lists between the steps)
+- full-text: load_rfp_pdf + extract_role_relevant_text + build_product_table
+- streaming: open_rfp_pages → iter_lines → iter_role_relevant_lines →
+             build_product_table, as in run_main_pipeline
+
+Peak memory is Python allocations (tracemalloc), which slows every mode
+about equally. Serial extraction, text cache off.
+
+Usage:
+    python benchmarks/bench_main_streaming.py [pages ...]
+    e.g. python benchmarks/bench_main_streaming.py 100 1000
+
+Defaults to 50 and 200 pages; pass larger counts explicitly (much slower).
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pdfplumber
+
+from bench_pdf_extract import synthetic_rfp
+from agents.main_agent.src.load_pdf import iter_lines, load_rfp_pdf, open_rfp_pages
+from agents.main_agent.src.parse import build_product_table
+from agents.main_agent.src.summary import extract_role_relevant_text, iter_role_relevant_lines
+
+
+def legacy(path, first_line):
+    extracted_text = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text()
+            if text and text.strip():
+                extracted_text.append(text)
+    relevant = extract_role_relevant_text("\n".join(extracted_text))
+    first_line()
+    return build_product_table(relevant["technical_text"]), relevant["testing_text"]
+
+
+def full_text(path, first_line):
+    pdf_data = load_rfp_pdf(path, workers=1, use_cache=False)
+    relevant = extract_role_relevant_text(pdf_data["full_text"])
+    first_line()
+    return build_product_table(relevant["technical_text"]), relevant["testing_text"]
+
+
+def streaming(path, first_line):
+    pdf_data = open_rfp_pages(path, workers=1, use_cache=False)
+    testing_text = []
+
+    def technical_lines():
+        for role, line in iter_role_relevant_lines(iter_lines(pdf_data["pages"])):
+            if role == "testing":
+                testing_text.append(line)
+            else:
+                first_line()
+                yield line
+
+    return build_product_table(technical_lines()), testing_text
+
+
+MODES = {"legacy": legacy, "full-text": full_text, "streaming": streaming}
+
+
+def run(mode, path):
+    first = []
+
+    def first_line():
+        if not first:
+            first.append(time.perf_counter())
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = MODES[mode](path, first_line)
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, total, first[0] - start, peak
+
+
+def main(page_counts):
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in page_counts:
+            path = os.path.join(tmp, f"synthetic_{pages}.pdf")
+            synthetic_rfp(path, pages)
+            print(f"\nsynthetic tender, {pages} pages")
+
+            expected = None
+            for mode in MODES:
+                result, total, first, peak = run(mode, path)
+                expected = expected or result
+                same = "identical" if result == expected else "DIFFERS"
+                print(
+                    f"  {mode:<10} peak {peak / 2 ** 20:8.1f} MB  "
+                    f"total {total:7.2f} s  first line to table {first:7.2f} s  {same}"
+                )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [50, 200])
@@ -0,0 +1,64 @@
+"""
+Micro-benchmark: per-call overhead of bare requests.post vs the pooled
+keep-alive OllamaTransport, measured against the local Ollama stub so
+that model time is excluded.
+
+Usage:
+    python benchmarks/bench_ollama_transport.py [num_calls]
+"""
+import os
+import sys
+import time
+
+import requests
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.llm import OllamaLLM
+from core.llm.stub_server import OllamaStubServer
+
+
+def bare_requests_call(base_url: str, prompt: str) -> str:
+    # Mirrors the original OllamaLLM.generate implementation
+    response = requests.post(
+        f"{base_url}/api/generate",
+        json={"model": "stub", "prompt": prompt, "stream": False}
+    )
+    response.raise_for_status()
+    return response.json()["response"]
+
+
+def time_calls(fn, num_calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(num_calls):
+        fn(f"prompt {i}")
+    return time.perf_counter() - start
+
+
+def main(num_calls: int = 500):
+    with OllamaStubServer() as stub:
+        base_url = stub.base_url
+        pooled = OllamaLLM(model="stub", base_url=base_url)
+
+        # Warm both paths once so imports and first connect are excluded
+        bare_requests_call(base_url, "warmup")
+        pooled.generate("warmup")
+
+        bare_time = time_calls(lambda p: bare_requests_call(base_url, p), num_calls)
+        pooled_time = time_calls(pooled.generate, num_calls)
+
+        pooled.transport.close()
+
+    bare_ms = bare_time / num_calls * 1000
+    pooled_ms = pooled_time / num_calls * 1000
+
+    print(f"Calls per mode        : {num_calls}")
+    print(f"Bare requests.post    : {bare_ms:.3f} ms/call")
+    print(f"Pooled OllamaTransport: {pooled_ms:.3f} ms/call")
+    print(f"Saved per call        : {bare_ms - pooled_ms:.3f} ms "
+          f"({bare_ms / pooled_ms:.2f}x faster)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,129 @@
+"""
+Benchmark: Main Agent PDF stage (open_rfp_pages → classifier → product
+table) with and without the page-relevance prefilter, on synthetic tenders
+where only some pages are technical; the rest are commercial terms and bid
+forms, as in real tender documents. Output is checked to be identical.
+
+Usage:
+    python benchmarks/bench_page_prefilter.py [pages ...]
+    e.g. python benchmarks/bench_page_prefilter.py 100 400
+
+Serial extraction, text cache off.
+"""
+import glob
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Table, TableStyle
+
+from agents.main_agent.src.load_pdf import iter_lines, open_rfp_pages, prefilter_report
+from agents.main_agent.src.page_probe import PROBE_KEYWORDS
+from agents.main_agent.src.parse import build_product_table
+from agents.main_agent.src.summary import iter_role_relevant_lines
+
+# Commercial clauses free of every probe keyword (asserted below)
+COMMERCIAL = [
+    "The bidder shall furnish a bank guarantee towards earnest money deposit.",
+    "Price bids shall be opened only for bidders who qualify on eligibility.",
+    "Payment of ninety percent will be made on receipt of material at stores.",
+    "Liquidated damages at half percent per week of delay shall be levied.",
+    "Bidders shall quote firm prices valid for one hundred twenty days.",
+    "The purchaser reserves the right to reject any or all bids without reason.",
+]
+FORM_FIELDS = ["Name of bidder", "Address", "GST number", "PAN", "Bank account", "Signature"]
+
+
+def mixed_rfp(path: str, pages: int, technical_every: int = 4, seed: int = 0):
+    """
+    A tender of `pages` pages; every `technical_every`-th page is a scope /
+    bill of quantities page, the others commercial clauses or bid forms.
+    """
+    rng = random.Random(seed)
+    styles = getSampleStyleSheet()
+    story = []
+    for page in range(1, pages + 1):
+        if page % technical_every == 1:
+            story.append(Paragraph(f"Section {page}: Scope of supply", styles["Heading2"]))
+            for clause in range(1, 4):
+                story.append(Paragraph(
+                    f"{page}.{clause} Supply of {rng.randint(1, 90)} km 11 kV XLPE "
+                    f"insulated armoured cable as per IS 7098, with type and "
+                    f"acceptance tests.",
+                    styles["BodyText"]
+                ))
+            rows = [["Item", "Description", "Cores", "Size (sqmm)", "Qty (km)"]]
+            for item in range(1, 9):
+                rows.append([
+                    f"{page}.{item}", "11 kV XLPE cable", str(rng.choice([1, 3])),
+                    str(rng.choice([70, 185, 300])), str(rng.randint(1, 40))
+                ])
+            story.append(Table(rows))
+        elif page % 2:
+            story.append(Paragraph(f"Annexure {page}: Bid form", styles["Heading2"]))
+            table = Table([[field, ""] for field in FORM_FIELDS], colWidths=[160, 280])
+            table.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.5, colors.grey)]))
+            story.append(table)
+        else:
+            story.append(Paragraph(f"Chapter {page}: General conditions", styles["Heading2"]))
+            for clause in range(1, 13):
+                story.append(Paragraph(
+                    f"{page}.{clause} {rng.choice(COMMERCIAL)}", styles["BodyText"]
+                ))
+        story.append(PageBreak())
+    SimpleDocTemplate(path, pagesize=A4).build(story)
+
+
+def run(path: str, prefilter: bool):
+    document = open_rfp_pages(path, workers=1, use_cache=False, prefilter=prefilter)
+    testing_text = []
+
+    def technical_lines():
+        for role, line in iter_role_relevant_lines(iter_lines(document["pages"])):
+            if role == "testing":
+                testing_text.append(line)
+            else:
+                yield line
+
+    start = time.perf_counter()
+    result = build_product_table(technical_lines()), testing_text
+    return result, time.perf_counter() - start, prefilter_report(document["prefilter"])
+
+
+def report(name: str, path: str):
+    expected, baseline_s, _ = run(path, prefilter=False)
+    result, seconds, stats = run(path, prefilter=True)
+    same = "identical" if result == expected else "DIFFERS"
+    print(
+        f"{name}\n"
+        f"  off {baseline_s:7.2f} s | on {seconds:7.2f} s  "
+        f"({baseline_s / seconds:4.2f}x)  skipped {stats['pages_skipped']}/"
+        f"{stats['pages_skipped'] + stats['pages_extracted']} pages  "
+        f"probe {stats['probe_s']:.2f} s  est. saved {stats['est_saved_s']:.2f} s  {same}"
+    )
+
+
+def main(page_counts):
+    for text in COMMERCIAL + FORM_FIELDS:
+        assert not any(keyword in text.lower() for keyword in PROBE_KEYWORDS), text
+
+    for path in sorted(glob.glob(os.path.join(PROJECT_ROOT, "data", "rfp", "rfp_*.pdf"))):
+        report(os.path.relpath(path, PROJECT_ROOT), path)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in page_counts:
+            path = os.path.join(tmp, f"mixed_{pages}.pdf")
+            mixed_rfp(path, pages)
+            report(f"synthetic tender, {pages} pages (1 in 4 technical)", path)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 400])
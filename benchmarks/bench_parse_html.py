@@ -0,0 +1,106 @@
+"""
+Benchmark: parse_html backends on the bundled tender pages and on large
+synthetic portal pages. Every backend's output is checked against the
+original BeautifulSoup implementation.
+
+Usage:
+    python benchmarks/bench_parse_html.py [synthetic_mb ...]
+    e.g. python benchmarks/bench_parse_html.py 1 5
+"""
+import glob
+import os
+import random
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from agents.sales_agent.src.parse_html import available_backends, parse_html
+
+
+def synthetic_portal(target_mb: float, seed: int = 0) -> str:
+    """
+    A tender-listing page of roughly target_mb: navigation, scripts,
+    a large listing table and per-tender notices with document links.
+    """
+    rng = random.Random(seed)
+    parts = [
+        "<!DOCTYPE html><html><head><title>e-Procurement Portal</title>",
+        "<style>td { padding: 4px; } .notice { margin: 1em; }</style>",
+        "<script>var tracking = {page: 'tenders', ids: [1, 2, 3]};</script>",
+        "</head><body><nav><ul>",
+        "".join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(20)),
+        "</ul></nav><!-- listing --><table class='tenders'>",
+        "<tr><th>Ref</th><th>Title</th><th>Due date</th><th>Document</th></tr>"
+    ]
+    size = sum(len(p) for p in parts)
+    i = 0
+    while size < target_mb * 1024 * 1024:
+        i += 1
+        kv = rng.choice(["11", "33", "66", "1.1"])
+        row = (
+            f"<tr><td>RFP-{2025}-{i:06d}</td>"
+            f"<td>Supply of {kv} kV XLPE <b>armoured</b> cable &amp; accessories</td>"
+            f"<td>{rng.randint(1, 28):02d}-{rng.randint(1, 12):02d}-2026</td>"
+            f'<td><a href="/docs/rfp_{i}.pdf">Download&nbsp;PDF</a></td></tr>'
+        )
+        notice = (
+            f"<div class='notice'><p>Tender {i}: bids are invited for "
+            f"{rng.randint(1, 90)} km of {kv} kV power cable.</p>"
+            f"<p>Corrigendum &#8211; see <a href='/corr/{i}'>notice</a><br>"
+            f"EMD: Rs. {rng.randint(10, 500)},000</p></div>"
+        )
+        parts.append(row)
+        parts.append(f"<!-- {i} -->" if i % 7 else "")
+        size += len(row)
+        if i % 5 == 0:
+            parts.append("</table>" + notice + "<table class='tenders'>")
+            size += len(notice)
+    parts.append("</table></body></html>")
+    return "".join(parts)
+
+
+def time_backend(backend: str, html: str, min_time: float = 0.5):
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        result = parse_html(html, backend=backend)
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / runs, result
+
+
+def report(name: str, html: str, backends):
+    mb = len(html.encode("utf-8")) / (1024 * 1024)
+    print(f"\n{name} ({mb:.2f} MB)")
+
+    baseline_s, expected = time_backend("bs4", html)
+    for backend in backends:
+        seconds, result = (
+            (baseline_s, expected) if backend == "bs4"
+            else time_backend(backend, html)
+        )
+        same = "identical" if result == expected else "DIFFERS from bs4"
+        print(
+            f"  {backend:<7} {seconds * 1000:9.2f} ms  "
+            f"{mb / seconds:7.2f} MB/s  {baseline_s / seconds:5.2f}x  {same}"
+        )
+
+
+def main(synthetic_mb):
+    backends = available_backends()
+    print(f"Backends: {', '.join(backends)}")
+
+    pages = sorted(glob.glob(os.path.join(PROJECT_ROOT, "data", "rfp", "webpage_*", "index.html")))
+    for path in pages:
+        with open(path, encoding="utf-8") as f:
+            report(os.path.relpath(path, PROJECT_ROOT), f.read(), backends)
+
+    for mb in synthetic_mb:
+        report(f"synthetic portal ~{mb} MB", synthetic_portal(mb), backends)
+
+
+if __name__ == "__main__":
+    main([float(arg) for arg in sys.argv[1:]] or [1, 4])
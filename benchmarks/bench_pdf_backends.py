@@ -0,0 +1,105 @@
+"""
+Benchmark: PDF extraction backends on the bundled data/rfp corpus (PDFs and
+ZIP bundles) and on synthetic tender PDFs. Speed is pages/s of serial
+extraction; accuracy is measured against the pdfplumber baseline:
+
+- lines: share of the baseline's non-blank lines the backend reproduces
+  exactly (in order)
+- words: the same on the word sequence, so re-wrapped lines still count
+- table: whether the Main Agent's product table and testing text (what the
+  pipeline actually uses) come out identical
+
+Usage:
+    python benchmarks/bench_pdf_backends.py [--diff] [synthetic_pages ...]
+    e.g. python benchmarks/bench_pdf_backends.py --diff 100
+
+--diff prints the first lines of a unified diff against pdfplumber for every
+document a backend does not reproduce exactly. Text cache and prefilter off.
+"""
+import difflib
+import glob
+import os
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_pdf_extract import synthetic_rfp
+from agents.main_agent.src.load_pdf import load_rfp_pdf
+from agents.main_agent.src.parse import build_product_table
+from agents.main_agent.src.pdf_backends import available_backends
+from agents.main_agent.src.summary import extract_role_relevant_text
+
+DIFF_LINES = 20
+
+
+def extract(path: str, backend: str):
+    start = time.perf_counter()
+    result = load_rfp_pdf(path, workers=1, use_cache=False, backend=backend)
+    return time.perf_counter() - start, result
+
+
+def pipeline_output(full_text: str):
+    relevant = extract_role_relevant_text(full_text)
+    return build_product_table(relevant["technical_text"]), relevant["testing_text"]
+
+
+def match_ratio(expected: list, actual: list) -> float:
+    if not expected:
+        return 1.0
+    matcher = difflib.SequenceMatcher(None, expected, actual, autojunk=False)
+    return sum(block.size for block in matcher.get_matching_blocks()) / len(expected)
+
+
+def report(name: str, path: str, backends, show_diff: bool):
+    baseline_s, expected = extract(path, "pdfplumber")
+    expected_lines = [line.strip() for line in expected["full_text"].splitlines() if line.strip()]
+    expected_output = pipeline_output(expected["full_text"])
+    pages = expected["num_pages"]
+    print(f"\n{name} ({pages} pages)")
+
+    for backend in backends:
+        seconds, result = (
+            (baseline_s, expected) if backend == "pdfplumber"
+            else extract(path, backend)
+        )
+        lines = [line.strip() for line in result["full_text"].splitlines() if line.strip()]
+        table = "identical" if pipeline_output(result["full_text"]) == expected_output else "DIFFERS"
+        print(
+            f"  {backend:<10} {seconds:7.2f} s  {pages / seconds:7.1f} pages/s  "
+            f"{baseline_s / seconds:5.2f}x  lines {match_ratio(expected_lines, lines):6.1%}  "
+            f"words {match_ratio(expected['full_text'].split(), result['full_text'].split()):6.1%}  "
+            f"table {table}"
+        )
+
+        if show_diff and lines != expected_lines:
+            diff = difflib.unified_diff(
+                expected_lines, lines, "pdfplumber", backend, n=0, lineterm=""
+            )
+            for line in list(diff)[:DIFF_LINES]:
+                print(f"      {line}")
+
+
+def main(synthetic_pages, show_diff: bool):
+    backends = available_backends()
+    print(f"Backends: {', '.join(backends)}")
+
+    corpus = glob.glob(os.path.join(PROJECT_ROOT, "data", "rfp", "**", "*.pdf"), recursive=True)
+    corpus += glob.glob(os.path.join(PROJECT_ROOT, "data", "rfp", "**", "*.zip"), recursive=True)
+    for path in sorted(corpus):
+        report(os.path.relpath(path, PROJECT_ROOT), path, backends, show_diff)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in synthetic_pages:
+            path = os.path.join(tmp, f"synthetic_{pages}.pdf")
+            synthetic_rfp(path, pages)
+            report(f"synthetic tender, {pages} pages", path, backends, show_diff)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    show_diff = "--diff" in args
+    main([int(arg) for arg in args if arg != "--diff"] or [100], show_diff)
@@ -0,0 +1,116 @@
+"""
+Benchmark: serial vs process-parallel RFP PDF text extraction on the
+bundled data/rfp/rfp_*.pdf and on large synthetic tender PDFs. Every run's
+text is checked against the serial extraction.
+
+Usage:
+    python benchmarks/bench_pdf_extract.py [synthetic_pages ...]
+    e.g. python benchmarks/bench_pdf_extract.py 100 300
+
+Worker counts tried: 1, 2, 4, ... up to the number of CPU cores (at least
+1 and 2). Speed-up is bounded by the core count of the machine.
+"""
+import glob
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Table, TableStyle
+
+from agents.main_agent.src.load_pdf import _discard_pool, load_rfp_pdf, usable_cores
+
+
+def synthetic_rfp(path: str, pages: int, seed: int = 0):
+    """
+    A tender document of `pages` pages: clauses, a bill of quantities table
+    and testing requirements on every page.
+    """
+    rng = random.Random(seed)
+    styles = getSampleStyleSheet()
+    story = []
+    for page in range(1, pages + 1):
+        kv = rng.choice(["1.1", "11", "33", "66"])
+        story.append(Paragraph(f"Section {page}: Scope of supply", styles["Heading2"]))
+        for clause in range(1, 5):
+            story.append(Paragraph(
+                f"{page}.{clause} The bidder shall supply {rng.randint(1, 90)} km of "
+                f"{kv} kV XLPE insulated, armoured power cable with aluminium "
+                f"conductor as per IS 7098 / IEC 60502, including routine, type "
+                f"and acceptance tests witnessed by the purchaser.",
+                styles["BodyText"]
+            ))
+        rows = [["Item", "Description", "Cores", "Size (sqmm)", "Qty (km)"]]
+        for item in range(1, 13):
+            rows.append([
+                f"{page}.{item}", f"{kv} kV XLPE cable", str(rng.choice([1, 3, 4])),
+                str(rng.choice([35, 70, 95, 185, 300])), str(rng.randint(1, 40))
+            ])
+        table = Table(rows)
+        table.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.5, colors.grey)]))
+        story.append(table)
+        story.append(PageBreak())
+    SimpleDocTemplate(path, pagesize=A4).build(story)
+
+
+def worker_counts():
+    cores = usable_cores()
+    counts = [1, 2]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if cores not in counts:
+        counts.append(cores)
+    return counts
+
+
+def report(name: str, path: str):
+    _discard_pool()
+    # Untimed warm-up: worker start-up is paid once per process, not per PDF
+    for workers in worker_counts()[1:]:
+        load_rfp_pdf(path, workers=workers, use_cache=False)
+
+    results = {}
+    for workers in worker_counts():
+        start = time.perf_counter()
+        result = load_rfp_pdf(path, workers=workers, use_cache=False)
+        results[workers] = (time.perf_counter() - start, result)
+
+    baseline_s, expected = results[1]
+    print(f"\n{name} ({expected['num_pages']} pages)")
+    for workers, (seconds, result) in results.items():
+        same = "identical" if result["full_text"] == expected["full_text"] else "DIFFERS"
+        print(
+            f"  {workers:>2} workers {seconds:8.2f} s  "
+            f"{expected['num_pages'] / seconds:7.1f} pages/s  "
+            f"{baseline_s / seconds:5.2f}x  {same}"
+        )
+
+
+def main(synthetic_pages):
+    # Always take the parallel path when workers > 1, even for short PDFs
+    import agents.main_agent.src.load_pdf as load_pdf
+    load_pdf.PDF_PARALLEL_MIN_PAGES = 1
+
+    print(f"CPU cores: {usable_cores()}  |  worker counts: {worker_counts()}")
+
+    for path in sorted(glob.glob(os.path.join(PROJECT_ROOT, "data", "rfp", "rfp_*.pdf"))):
+        report(os.path.relpath(path, PROJECT_ROOT), path)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in synthetic_pages:
+            path = os.path.join(tmp, f"synthetic_{pages}.pdf")
+            synthetic_rfp(path, pages)
+            report(f"synthetic tender, {pages} pages", path)
+
+    _discard_pool()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 300])
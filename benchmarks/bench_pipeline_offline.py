@@ -0,0 +1,160 @@
+"""
+End-to-end pipeline run with no network and no live Ollama.
+
+Serves the bundled data/rfp/webpage_* portals from a local HTTP server,
+answers every LLM call from the Ollama stub with scripted replies, and
+reports per-stage wall time next to the time spent inside LLM calls, so
+orchestration overhead can be measured separately from model time.
+
+Usage:
+    python benchmarks/bench_pipeline_offline.py [latency_spec]
+    e.g. fixed:0 (pure overhead), lognormal:-1,0.5 (CPU-like model)
+"""
+import functools
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+os.chdir(PROJECT_ROOT)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# config is read on first import of core/agents, so point it at the stub now
+STUB_PORT = _free_port()
+os.environ["OLLAMA_HOSTS"] = f"http://127.0.0.1:{STUB_PORT}"
+os.environ["LLM_CACHE_ENABLED"] = "0"
+os.environ["PAGE_CACHE_ENABLED"] = "0"
+os.environ["SWEEP_STATE_ENABLED"] = "0"
+os.environ["PDF_TEXT_CACHE_ENABLED"] = "0"
+
+from core.llm import get_metrics
+from core.llm.stub_server import OllamaStubServer
+from agents.sales_agent import run_sales_agent
+from agents.main_agent.main_agent import run_main_draft
+from agents.technical_agent import run_technical_agent
+from agents.pricing_agent import run_pricing_agent
+
+LATENCY = sys.argv[1] if len(sys.argv) > 1 else "fixed:0"
+START_DATE = "2025-12-01"
+
+METADATA = {
+    "webpage_1": {
+        "tender_reference": "RFP-IND-CABLE-2025-02",
+        "tender_title": "Process Plant Electrical & Instrumentation Cabling",
+        "submission_due_date": "2026-01-20",
+        "pdf_url": "documents/RFP.pdf"
+    },
+    "webpage_2": {
+        "tender_reference": "RFP-INFRA-CABLE-2025-ALT",
+        "tender_title": "Supply of Medium Voltage Power Cable (33 kV)",
+        "submission_due_date": "2026-02-15",
+        "pdf_url": "documents/RFP_2.pdf"
+    },
+    "webpage_3": {
+        "tender_reference": "NR3/NT/G-CABLE/DOM/CP1/24/16970",
+        "tender_title": "Supply of 33 kV Power Cable and Instrumentation Cable",
+        "submission_due_date": "2026-08-10",
+        "pdf_url": "documents/NIT-CABLE-IND-2025-03.pdf"
+    }
+}
+
+RULES = [
+    {"match": f"Source URL: \\S*{page}/", "response": json.dumps(meta)}
+    for page, meta in METADATA.items()
+] + [
+    {
+        "match": "Technical Team",
+        "response": "33 kV XLPE armoured aluminium power cables as per IS 7098."
+    },
+    {
+        "match": "Pricing Team",
+        "response": "Routine tests, type tests and acceptance tests on all cables."
+    },
+    {
+        "match": "specification normalization assistant",
+        "response": json.dumps({
+            "category": "Power Cable",
+            "cable_type": "XLPE",
+            "armored": True,
+            "conductor_material": "Aluminium",
+            "conductor_size": "240 sqmm",
+            "voltage_rating": "33",
+            "standards": "IS 7098"
+        })
+    }
+]
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def start_portal_server():
+    handler = functools.partial(
+        QuietHandler,
+        directory=os.path.join(PROJECT_ROOT, "data", "rfp")
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    stub = OllamaStubServer(port=STUB_PORT, rules=RULES, latency=LATENCY).start()
+    portal = start_portal_server()
+
+    portal_url = f"http://127.0.0.1:{portal.server_address[1]}"
+    urls = [f"{portal_url}/{page}/" for page in METADATA]
+    timings = {}
+
+    def llm_seconds():
+        return sum(r["wall_time_s"] for r in get_metrics().records)
+
+    def timed(stage, fn):
+        llm_before = llm_seconds()
+        start = time.perf_counter()
+        result = fn()
+        timings[stage] = (time.perf_counter() - start, llm_seconds() - llm_before)
+        return result
+
+    def sales():
+        rfp = None
+        for event in run_sales_agent(start_date=START_DATE, urls=urls):
+            if event.get("type") == "FINAL_RESULT":
+                rfp = event["data"]["selected_rfp"]
+        return rfp
+
+    rfp = timed("sales", sales)
+    main_result = timed("main", lambda: run_main_draft(rfp))
+    technical = timed("technical", lambda: run_technical_agent(main_result))
+    timed("pricing", lambda: run_pricing_agent({
+        **main_result,
+        "technical_recommendations": technical["rfp_items"]
+    }))
+
+    stub.stop()
+    portal.shutdown()
+
+    print(f"\nStub latency: {LATENCY}  |  LLM requests: {stub.requests}")
+    print(f"{'Stage':<10} {'Wall (s)':>10} {'In LLM calls (s)':>18}")
+    for stage, (wall, llm) in timings.items():
+        print(f"{stage:<10} {wall:>10.3f} {llm:>18.3f}")
+    total_wall = sum(w for w, _ in timings.values())
+    print(f"{'total':<10} {total_wall:>10.3f}")
+    print("(LLM time is summed per call; concurrent calls overlap wall time)")
+
+
+if __name__ == "__main__":
+    main()
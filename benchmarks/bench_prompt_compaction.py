@@ -0,0 +1,85 @@
+"""
+Benchmark: sales metadata prompt size before/after compaction on the
+bundled tender pages, plus a check that compaction drops only boilerplate:
+blocks that merely start like boilerplate ("Contact person: ...", "Terms of
+payment ...") carry fields the resolver needs and must survive.
+
+Usage:
+    python benchmarks/bench_prompt_compaction.py
+"""
+import glob
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from agents.sales_agent.src.parse_html import parse_html
+from agents.sales_agent.src.resolve_metadata.compact import compact_sections
+from agents.sales_agent.src.resolve_metadata.resolver import build_metadata_prompt
+
+CURRENT_DATE = "2025-12-01"
+
+# Must be kept by compaction
+CONTENT_BLOCKS = [
+    "Contact person: Mr. R. Sharma, Manager (Procurement), +91 11 2345 6789",
+    "Terms of payment: 90% on delivery, 10% after commissioning",
+    "Help desk no 1800-233-7315 for bid submission queries",
+    "Homeland Cables Ltd is not eligible for this tender",
+    "Privacy of bid documents is ensured by the e-procurement system",
+    "Copyright assignment of drawings shall pass to the purchaser on award of the contract, "
+    "including all design documents, calculations and test reports submitted with the bid",
+]
+# Must be dropped
+BOILERPLATE_BLOCKS = [
+    "Home", "Contact Us", "Help", "Vendor Login", "Terms & Conditions", "FAQs",
+    "Skip to main content", "© 2025 Tender Portal. All rights reserved.",
+]
+
+
+def report_page(path: str):
+    parsed = parse_html(open(path, encoding="utf-8").read())
+    start = time.perf_counter()
+    _, tokens = build_metadata_prompt(parsed, "https://example.org/tender", CURRENT_DATE)
+    seconds = time.perf_counter() - start
+    print(
+        f"  {os.path.relpath(path, PROJECT_ROOT):<36} {tokens['before']:6d} -> "
+        f"{tokens['after']:5d} tokens  ({1 - tokens['after'] / tokens['before']:5.1%} less)  "
+        f"{seconds * 1000:6.2f} ms"
+    )
+
+
+def check_boilerplate():
+    parsed = {
+        "text_blocks": CONTENT_BLOCKS + BOILERPLATE_BLOCKS,
+        "tables": [],
+        "links": []
+    }
+    kept = set(compact_sections(parsed)["text"])
+    lost = [block for block in CONTENT_BLOCKS if block not in kept]
+    leaked = [block for block in BOILERPLATE_BLOCKS if block in kept]
+
+    print(
+        f"\nBoilerplate filter: {len(CONTENT_BLOCKS) - len(lost)}/{len(CONTENT_BLOCKS)} "
+        f"content blocks kept, {len(BOILERPLATE_BLOCKS) - len(leaked)}/"
+        f"{len(BOILERPLATE_BLOCKS)} boilerplate blocks dropped"
+    )
+    for block in lost:
+        print(f"  LOST:   {block}")
+    for block in leaked:
+        print(f"  LEAKED: {block}")
+    return not lost and not leaked
+
+
+def main():
+    print("Metadata prompt (estimated tokens, before -> after compaction)")
+    for path in sorted(glob.glob(os.path.join(PROJECT_ROOT, "data", "rfp", "webpage_*", "index.html"))):
+        report_page(path)
+
+    if not check_boilerplate():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,3 +6,111 @@ PROJECT_ROOT = os.path.abspath(
 
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 DOWNLOADS_DIR = os.path.join(DATA_DIR, "downloads")
+
+# ---- Ollama endpoints ----
+OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "llama3.2")
+# Comma-separated; more than one host enables least-loaded routing
+OLLAMA_HOSTS = [
+    host.strip().rstrip("/")
+    for host in os.environ.get("OLLAMA_HOSTS", "http://localhost:11434").split(",")
+    if host.strip()
+]
+
+# ---- LLM response cache ----
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+LLM_CACHE_PATH = os.path.join(CACHE_DIR, "llm_cache.sqlite")
+LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE_ENABLED", "1") != "0"
+LLM_CACHE_MAX_ENTRIES = 10_000
+LLM_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# ---- LLM concurrency ----
+# Per host; match Ollama's OLLAMA_NUM_PARALLEL, extra requests only queue
+# server-side
+LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", "4"))
+
+# ---- LLM metrics ----
+# Set to a file path to also append per-call timings as JSON lines
+LLM_METRICS_PATH = os.environ.get("LLM_METRICS_PATH")
+
+# ---- Ollama model residency ----
+# keep_alive per model: how long Ollama keeps it loaded after the last call,
+# so a batch run does not pay the model load more than once
+LLM_KEEP_ALIVE = {
+    OLLAMA_MODEL: os.environ.get("LLM_KEEP_ALIVE", "30m")
+}
+
+# ---- Sales sweep ----
+# Tender URLs fetched/summarized at once by the sales agent
+SALES_MAX_WORKERS = int(os.environ.get("SALES_MAX_WORKERS", "8"))
+
+# ---- Portal politeness ----
+# Per host: requests in flight, average requests/s (token bucket, 0 = no
+# limit) and burst size. 429/503 pause the host (Retry-After or exponential
+# back-off, capped) and are retried up to HOST_MAX_RETRIES times
+HOST_MAX_CONCURRENCY = int(os.environ.get("HOST_MAX_CONCURRENCY", "2"))
+HOST_RATE_PER_SEC = float(os.environ.get("HOST_RATE_PER_SEC", "2"))
+HOST_BURST = int(os.environ.get("HOST_BURST", "4"))
+HOST_MAX_BACKOFF_S = float(os.environ.get("HOST_MAX_BACKOFF_S", "60"))
+HOST_MAX_RETRIES = int(os.environ.get("HOST_MAX_RETRIES", "3"))
+
+# ---- Multi-RFP mode ----
+# Accepted RFPs taken through download → Main → Technical → Pricing at once
+RFP_FANOUT_CONCURRENCY = int(os.environ.get("RFP_FANOUT_CONCURRENCY", "2"))
+
+# ---- Tender document bundles ----
+# Upper bound on decompressed data buffered while reading a PDF inside a ZIP
+ARCHIVE_BUFFER_MB = int(os.environ.get("ARCHIVE_BUFFER_MB", "16"))
+
+# ---- RFP PDF text extraction ----
+# Worker processes for page extraction (0 = one per CPU core, 1 = serial);
+# PDFs shorter than PDF_PARALLEL_MIN_PAGES are always extracted serially
+PDF_EXTRACT_WORKERS = int(os.environ.get("PDF_EXTRACT_WORKERS", "0"))
+PDF_PARALLEL_MIN_PAGES = int(os.environ.get("PDF_PARALLEL_MIN_PAGES", "24"))
+# Text engine: "pdfplumber" (original), "pdfminer", "pypdf" or "pypdfium2"
+# (the last two only if installed)
+PDF_EXTRACT_BACKEND = os.environ.get("PDF_EXTRACT_BACKEND", "pdfplumber")
+
+# ---- RFP page prefilter ----
+# Skip layout extraction of pages whose raw text has no technical/testing
+# keyword (they cannot contribute to the technical or testing text)
+PDF_PAGE_PREFILTER = os.environ.get("PDF_PAGE_PREFILTER", "1") != "0"
+
+# ---- Extracted RFP text cache ----
+# Per-page text keyed by PDF content hash + extractor version (compressed);
+# least recently used entries go once the cache exceeds PDF_TEXT_CACHE_MAX_MB
+PDF_TEXT_CACHE_PATH = os.path.join(CACHE_DIR, "pdf_text.sqlite")
+PDF_TEXT_CACHE_ENABLED = os.environ.get("PDF_TEXT_CACHE_ENABLED", "1") != "0"
+PDF_TEXT_CACHE_MAX_MB = int(os.environ.get("PDF_TEXT_CACHE_MAX_MB", "256"))
+
+# ---- Tender page parsing ----
+# "stdlib" (single-pass html.parser), "lxml" (needs lxml) or "bs4" (legacy)
+HTML_PARSER_BACKEND = os.environ.get("HTML_PARSER_BACKEND", "stdlib")
+
+# ---- Sales metadata fast path ----
+# Fields the rule-based extractor resolves with at least this confidence
+# are not sent to the LLM; when all are resolved the LLM call is skipped
+METADATA_RULES_ENABLED = os.environ.get("METADATA_RULES_ENABLED", "1") != "0"
+METADATA_RULES_MIN_CONFIDENCE = float(
+    os.environ.get("METADATA_RULES_MIN_CONFIDENCE", "0.8")
+)
+
+# ---- Sales metadata prompt ----
+# Compact the page content (dedupe, drop menus/boilerplate, document links
+# only, one line per table row) and cap the whole prompt at this many tokens
+METADATA_PROMPT_COMPACT = os.environ.get("METADATA_PROMPT_COMPACT", "1") != "0"
+METADATA_PROMPT_TOKEN_BUDGET = int(
+    os.environ.get("METADATA_PROMPT_TOKEN_BUDGET", "1500")
+)
+
+# ---- Tender page cache ----
+# ETag/Last-Modified + body hash per URL; unchanged pages skip parse and LLM
+PAGE_CACHE_PATH = os.path.join(CACHE_DIR, "page_cache.sqlite")
+PAGE_CACHE_ENABLED = os.environ.get("PAGE_CACHE_ENABLED", "1") != "0"
+
+# ---- Sales sweep state ----
+# URLs summarized less than SWEEP_RECHECK_HOURS ago (SWEEP_CLOSED_RECHECK_HOURS
+# once the tender has closed) are served from the store without fetching
+SWEEP_STATE_PATH = os.path.join(CACHE_DIR, "sweep_state.sqlite")
+SWEEP_STATE_ENABLED = os.environ.get("SWEEP_STATE_ENABLED", "1") != "0"
+SWEEP_RECHECK_HOURS = float(os.environ.get("SWEEP_RECHECK_HOURS", "6"))
+SWEEP_CLOSED_RECHECK_HOURS = float(os.environ.get("SWEEP_CLOSED_RECHECK_HOURS", "24"))
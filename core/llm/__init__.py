@@ -1,3 +1,50 @@
 from .ollama_client import OllamaLLM
+from .async_client import AsyncBaseLLM, AsyncOllamaLLM
+from .transport import OllamaTransport
+from .cache import CachedLLM, LLMResponseCache
+from .single_flight import SingleFlightGroup, SingleFlightLLM
+from .pool import PooledLLM
+from .json_output import LLMJSONError
+from .metrics import (
+    MetricsSink,
+    InMemoryMetricsSink,
+    JSONLMetricsSink,
+    MultiMetricsSink
+)
+from .factory import (
+    build_llm,
+    build_async_llm,
+    get_response_cache,
+    get_single_flight_group,
+    get_metrics,
+    get_metrics_sink,
+    get_host_pool,
+    get_transport
+)
+from .warmup import warm_up_models
 
-__all__ = ["OllamaLLM"]
\ No newline at end of file
+__all__ = [
+    "OllamaLLM",
+    "AsyncBaseLLM",
+    "AsyncOllamaLLM",
+    "OllamaTransport",
+    "CachedLLM",
+    "LLMResponseCache",
+    "SingleFlightGroup",
+    "SingleFlightLLM",
+    "PooledLLM",
+    "LLMJSONError",
+    "MetricsSink",
+    "InMemoryMetricsSink",
+    "JSONLMetricsSink",
+    "MultiMetricsSink",
+    "build_llm",
+    "build_async_llm",
+    "get_response_cache",
+    "get_single_flight_group",
+    "get_metrics",
+    "get_metrics_sink",
+    "get_host_pool",
+    "get_transport",
+    "warm_up_models"
+]
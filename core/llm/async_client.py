@@ -0,0 +1,84 @@
+import asyncio
+import weakref
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from .base import BaseLLM
+from .json_output import parse_json_response
+from .ollama_client import OllamaLLM
+
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class AsyncBaseLLM(ABC):
+    @abstractmethod
+    async def generate(self, prompt: str, format=None, stage=None) -> str:
+        pass
+
+    async def generate_json(
+        self,
+        prompt: str,
+        schema: Optional[dict] = None,
+        stage=None
+    ) -> Any:
+        response = await self.generate(prompt, format=schema or "json", stage=stage)
+        return parse_json_response(response, schema)
+
+
+class AsyncOllamaLLM(AsyncBaseLLM):
+    """
+    Asyncio client for Ollama with bounded concurrency.
+
+    Requests go through one pooled keep-alive transport shared by all
+    in-flight calls; a semaphore caps how many are outstanding at once so
+    the server's OLLAMA_NUM_PARALLEL slots are filled but not overrun.
+    The blocking HTTP call runs on a dedicated thread pool sized to the
+    concurrency limit, so any sync BaseLLM stack (e.g. CachedLLM) can be
+    wrapped via `llm=`.
+    """
+
+    def __init__(
+        self,
+        model="llama3",
+        base_url="http://localhost:11434",
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        llm: BaseLLM = None
+    ):
+        self.max_concurrency = max_concurrency
+        self.llm = llm or OllamaLLM(
+            model=model,
+            base_url=base_url,
+            pool_size=max_concurrency
+        )
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="ollama"
+        )
+        # asyncio primitives are bound to one event loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    @property
+    def model(self):
+        return getattr(self.llm, "model", None)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run(self, fn, *args):
+        async with self._semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def generate(self, prompt: str, format=None, stage=None) -> str:
+        return await self._run(self.llm.generate, prompt, format, stage)
+
+    def close(self):
+        self._executor.shutdown(wait=False)
@@ -1,6 +1,36 @@
 from abc import ABC, abstractmethod
+from typing import Any, Iterator, Optional
+
+from .json_output import parse_json_response
 
 class BaseLLM(ABC):
     @abstractmethod
-    def generate(self, prompt: str) -> str:
+    def generate(self, prompt: str, format=None, stage=None) -> str:
+        """
+        format: None, "json", or a JSON schema dict constraining the output.
+        stage: pipeline stage tag reported to the metrics sink.
+        """
         pass
+
+    def generate_stream(self, prompt: str, stage=None) -> Iterator[str]:
+        """
+        Yields the response incrementally as text chunks.
+        Clients without native streaming yield the full response once.
+        """
+        yield self.generate(prompt, stage=stage)
+
+    def generate_json(
+        self,
+        prompt: str,
+        schema: Optional[dict] = None,
+        stage=None
+    ) -> Any:
+        """
+        Generates constrained JSON output, then validates it against the
+        schema with cheap repair of malformed or truncated replies.
+
+        Raises:
+            LLMJSONError: If no usable JSON object can be recovered
+        """
+        response = self.generate(prompt, format=schema or "json", stage=stage)
+        return parse_json_response(response, schema)
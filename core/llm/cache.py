@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Iterator, Optional
+
+from .base import BaseLLM
+
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class LLMResponseCache:
+    """
+    Content-addressed, on-disk store of LLM responses.
+
+    Entries are keyed by model name + prompt hash + generation options
+    and kept in SQLite, so they survive restarts and are shared between
+    processes (main.py, Streamlit sessions).
+    The least recently used entries are evicted once either the entry
+    count or the total stored size exceeds its bound.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access "
+                "ON llm_cache (last_access)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def make_key(
+        model: str,
+        prompt: str,
+        options: Optional[dict] = None,
+        format=None
+    ) -> str:
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        options_json = json.dumps(options or {}, sort_keys=True, default=str)
+        key_source = f"{model}\0{prompt_hash}\0{options_json}"
+        if format:
+            key_source += "\0" + json.dumps(format, sort_keys=True)
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT response FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE llm_cache SET last_access = ? WHERE key = ?",
+                    (time.time(), key)
+                )
+
+        with self._lock:
+            if row:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        return row[0] if row else None
+
+    def put(self, key: str, response: str, model: str = None):
+        now = time.time()
+        size = len(response.encode("utf-8"))
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache "
+                "(key, model, response, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now)
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        evicted = 0
+        while True:
+            count, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+
+            excess = max(0, count - self.max_entries)
+            if total > self.max_bytes:
+                # Assume average-sized entries; another round if the oldest
+                # turn out smaller
+                excess = max(excess, -(-(total - self.max_bytes) * count // total))
+            if not excess:
+                break
+
+            # Oldest first, straight off the last_access index
+            evicted += conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY last_access ASC LIMIT ?)",
+                (excess,)
+            ).rowcount
+
+        if evicted:
+            with self._lock:
+                self.evictions += evicted
+
+    def clear(self):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> dict:
+        with closing(self._connect()) as conn:
+            count, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": count,
+            "bytes": total
+        }
+
+
+class CachedLLM(BaseLLM):
+    """
+    Wraps any BaseLLM and serves repeated prompts from an LLMResponseCache.
+    """
+
+    def __init__(self, llm: BaseLLM, cache: LLMResponseCache):
+        self.llm = llm
+        self.cache = cache
+
+    @property
+    def model(self):
+        return getattr(self.llm, "model", None)
+
+    @property
+    def options(self):
+        return getattr(self.llm, "options", None)
+
+    def generate(self, prompt: str, format=None, stage=None) -> str:
+        key = self.cache.make_key(self.model, prompt, self.options, format)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self.llm.generate(prompt, format=format, stage=stage)
+        self.cache.put(key, response, model=self.model)
+        return response
+
+    def generate_stream(self, prompt: str, stage=None) -> Iterator[str]:
+        key = self.cache.make_key(self.model, prompt, self.options)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        for chunk in self.llm.generate_stream(prompt, stage=stage):
+            chunks.append(chunk)
+            yield chunk
+
+        # Only completed streams are cached
+        self.cache.put(key, "".join(chunks), model=self.model)
@@ -0,0 +1,173 @@
+import threading
+
+from config import (
+    OLLAMA_MODEL,
+    OLLAMA_HOSTS,
+    LLM_CACHE_PATH,
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_MAX_BYTES,
+    LLM_MAX_CONCURRENCY,
+    LLM_METRICS_PATH,
+    LLM_KEEP_ALIVE
+)
+from .async_client import AsyncOllamaLLM
+from .base import BaseLLM
+from .cache import CachedLLM, LLMResponseCache
+from .metrics import (
+    InMemoryMetricsSink,
+    JSONLMetricsSink,
+    MetricsSink,
+    MultiMetricsSink
+)
+from .ollama_client import OllamaLLM
+from .pool import PooledLLM
+from .single_flight import SingleFlightGroup, SingleFlightLLM
+from .transport import DEFAULT_POOL_SIZE, OllamaTransport
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+_single_flight_group = SingleFlightGroup()
+_metrics = InMemoryMetricsSink()
+_metrics_sink = (
+    MultiMetricsSink(_metrics, JSONLMetricsSink(LLM_METRICS_PATH))
+    if LLM_METRICS_PATH else _metrics
+)
+_host_pools = {}
+_host_pools_lock = threading.Lock()
+_transports = {}
+_transports_lock = threading.Lock()
+
+
+def get_response_cache() -> LLMResponseCache:
+    """
+    Process-wide LLM response cache (shared by all pipelines).
+    """
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = LLMResponseCache(
+                LLM_CACHE_PATH,
+                max_entries=LLM_CACHE_MAX_ENTRIES,
+                max_bytes=LLM_CACHE_MAX_BYTES
+            )
+        return _response_cache
+
+
+def get_single_flight_group() -> SingleFlightGroup:
+    """
+    Process-wide registry of in-flight prompts (shared by all pipelines).
+    """
+    return _single_flight_group
+
+
+def get_metrics() -> InMemoryMetricsSink:
+    """
+    Process-wide per-call LLM metrics (see InMemoryMetricsSink.summary()).
+    """
+    return _metrics
+
+
+def get_metrics_sink() -> MetricsSink:
+    return _metrics_sink
+
+
+def get_transport(base_url: str, pool_size: int) -> OllamaTransport:
+    """
+    Process-wide transport per host, so keep-alive connections are reused
+    across agents, RFPs and sessions, not just within one client's
+    lifetime. Its pool grows to the largest pool_size asked for (sync
+    clients and async fan-out share it).
+    """
+    key = base_url.rstrip("/")
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = OllamaTransport(base_url=base_url, pool_size=pool_size)
+            _transports[key] = transport
+    transport.ensure_pool_size(pool_size)
+    return transport
+
+
+def get_host_pool(model: str, hosts: list, pool_size: int) -> PooledLLM:
+    """
+    Process-wide pool per (model, hosts), so outstanding-request counts
+    and host health are shared by every pipeline and Streamlit session.
+    pool_size only applies when the pool is first created.
+    """
+    key = (model, tuple(hosts))
+    with _host_pools_lock:
+        pool = _host_pools.get(key)
+        if pool is None:
+            pool = PooledLLM([
+                OllamaLLM(
+                    model=model,
+                    base_url=host,
+                    transport=get_transport(host, pool_size),
+                    metrics_sink=get_metrics_sink(),
+                    keep_alive=LLM_KEEP_ALIVE.get(model)
+                )
+                for host in hosts
+            ])
+            _host_pools[key] = pool
+        return pool
+
+
+def build_llm(
+    model: str = None,
+    base_url: str = None,
+    use_cache: bool = LLM_CACHE_ENABLED,
+    pool_size: int = DEFAULT_POOL_SIZE
+) -> BaseLLM:
+    """
+    Builds the LLM client used by the agent pipelines.
+    Stack: single-flight → response cache → Ollama host(s).
+
+    Model and hosts default to config.OLLAMA_MODEL / config.OLLAMA_HOSTS;
+    several hosts are load-balanced through a shared PooledLLM. Clients
+    for the same host share one keep-alive connection pool (get_transport).
+    """
+    model = model or OLLAMA_MODEL
+    hosts = [base_url] if base_url else OLLAMA_HOSTS
+
+    if len(hosts) > 1:
+        llm = get_host_pool(model, hosts, pool_size)
+    else:
+        llm = OllamaLLM(
+            model=model,
+            base_url=hosts[0],
+            transport=get_transport(hosts[0], pool_size),
+            metrics_sink=get_metrics_sink(),
+            keep_alive=LLM_KEEP_ALIVE.get(model)
+        )
+
+    if use_cache:
+        llm = CachedLLM(llm, get_response_cache())
+
+    return SingleFlightLLM(llm, get_single_flight_group())
+
+
+def build_async_llm(
+    model: str = None,
+    base_url: str = None,
+    max_concurrency: int = None,
+    use_cache: bool = LLM_CACHE_ENABLED
+) -> AsyncOllamaLLM:
+    """
+    Builds the concurrent LLM client for fan-out stages.
+    Wraps the same sync stack as build_llm(); concurrency defaults to
+    LLM_MAX_CONCURRENCY per configured host.
+    """
+    hosts = [base_url] if base_url else OLLAMA_HOSTS
+    max_concurrency = max_concurrency or LLM_MAX_CONCURRENCY * len(hosts)
+
+    return AsyncOllamaLLM(
+        max_concurrency=max_concurrency,
+        llm=build_llm(
+            model=model,
+            base_url=base_url,
+            use_cache=use_cache,
+            pool_size=max_concurrency
+        )
+    )
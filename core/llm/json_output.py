@@ -0,0 +1,211 @@
+import json
+import re
+from typing import Any, Optional
+
+
+class LLMJSONError(ValueError):
+    pass
+
+
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.I)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_PY_LITERALS = {"None": "null", "True": "true", "False": "false"}
+# A JSON string literal, or a bare Python literal outside of strings
+_PY_LITERAL_RE = re.compile(r'"(?:\\.|[^"\\])*"|\b(None|True|False)\b')
+
+
+def _balance(text: str) -> str:
+    """
+    Closes an unterminated string and any open objects/arrays,
+    which is what a reply cut off by num_predict looks like.
+    """
+    stack = []
+    in_string = False
+    escaped = False
+
+    for ch in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]" and stack:
+            stack.pop()
+
+    if in_string:
+        text += '"'
+
+    text = text.rstrip().rstrip(",")
+    if text.endswith(":"):
+        text += " null"
+
+    return text + "".join(reversed(stack))
+
+
+def _object_end(text: str) -> Optional[int]:
+    """
+    Index of the "}" closing the object that text starts with, or None if
+    it never closes (braces inside strings do not count).
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if not depth:
+                return i
+
+    return None
+
+
+def repair_json(text: str) -> str:
+    """
+    Cheap, deterministic fixes for the usual LLM JSON defects:
+    markdown fences, leading/trailing prose, smart quotes, Python literals,
+    single-quoted keys/strings, trailing commas and truncation.
+    """
+    text = _FENCE_RE.sub("", text.strip())
+
+    start = text.find("{")
+    if start == -1:
+        raise LLMJSONError("LLM did not return valid JSON")
+    text = text[start:]
+
+    text = (
+        text.replace("“", '"').replace("”", '"')
+            .replace("‘", "'").replace("’", "'")
+    )
+
+    if '"' not in text:
+        text = text.replace("'", '"')
+
+    # Trailing prose goes only after a complete object; a truncated one is
+    # left whole for _balance (a "}" inside a string is not its end)
+    end = _object_end(text)
+    if end is not None:
+        text = text[:end + 1]
+
+    text = _PY_LITERAL_RE.sub(
+        lambda m: _PY_LITERALS[m.group(1)] if m.group(1) else m.group(0),
+        text
+    )
+    text = _TRAILING_COMMA_RE.sub(r"\1", text)
+
+    return _balance(text)
+
+
+def extract_json(text: str) -> Any:
+    """
+    Parses an LLM reply as JSON, repairing it if needed.
+
+    Raises:
+        LLMJSONError: If no JSON object can be recovered
+    """
+    try:
+        return json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        pass
+
+    repaired = repair_json(text or "")
+    try:
+        return json.loads(repaired)
+    except json.JSONDecodeError as e:
+        raise LLMJSONError(f"Invalid JSON returned by LLM: {e}")
+
+
+_JSON_TYPES = {
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None)
+}
+
+
+def _coerce(value, expected):
+    if expected is None:
+        return value
+
+    types = expected if isinstance(expected, list) else [expected]
+    if any(
+        isinstance(value, _JSON_TYPES[t])
+        and not (t in ("number", "integer") and isinstance(value, bool))
+        for t in types
+    ):
+        return value
+
+    # Scalars the model typed loosely ("11", 11, ["IS 7098"], ...)
+    if "string" in types and isinstance(value, (int, float)):
+        return str(value)
+    if "string" in types and isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    if "array" in types and isinstance(value, str):
+        return [value]
+    if "boolean" in types and isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("yes", "true", "y"):
+            return True
+        if lowered in ("no", "false", "n"):
+            return False
+
+    return None
+
+
+def validate_json(data: Any, schema: Optional[dict]) -> Any:
+    """
+    Validates a decoded reply against a (subset of) JSON schema:
+    object type, property types and required keys.
+    Missing or uncoercible properties are set to None rather than
+    failing the whole extraction.
+    """
+    if not schema:
+        return data
+
+    if schema.get("type") == "object":
+        if not isinstance(data, dict):
+            raise LLMJSONError(
+                f"Expected a JSON object, got {type(data).__name__}"
+            )
+
+        properties = schema.get("properties", {})
+        result = {}
+
+        for key, value in data.items():
+            if key in properties:
+                result[key] = _coerce(value, properties[key].get("type"))
+            elif schema.get("additionalProperties", True):
+                result[key] = value
+
+        for key in list(properties) + schema.get("required", []):
+            result.setdefault(key, None)
+
+        return result
+
+    return data
+
+
+def parse_json_response(text: str, schema: Optional[dict] = None) -> Any:
+    return validate_json(extract_json(text), schema)
@@ -0,0 +1,140 @@
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+
+# Ollama reports these durations in nanoseconds
+_DURATION_FIELDS = [
+    "total_duration",
+    "load_duration",
+    "prompt_eval_duration",
+    "eval_duration"
+]
+_COUNT_FIELDS = ["prompt_eval_count", "eval_count"]
+
+# A warm model reports a load_duration of a few milliseconds
+COLD_LOAD_THRESHOLD_S = 0.5
+
+
+def build_call_metrics(
+    stage: Optional[str],
+    model: str,
+    response: dict,
+    wall_time_s: float,
+    streamed: bool = False
+) -> dict:
+    """
+    Builds one metrics record from a (final) Ollama /api/generate response.
+    Durations are converted to seconds.
+    """
+    record = {
+        "timestamp": time.time(),
+        "stage": stage or "untagged",
+        "model": model,
+        "streamed": streamed,
+        "wall_time_s": round(wall_time_s, 4)
+    }
+
+    for field in _DURATION_FIELDS:
+        value = response.get(field)
+        record[f"{field}_s"] = value / 1e9 if value is not None else None
+
+    for field in _COUNT_FIELDS:
+        record[field] = response.get(field)
+
+    if record["prompt_eval_count"] and record["prompt_eval_duration_s"]:
+        record["prompt_tokens_per_s"] = round(
+            record["prompt_eval_count"] / record["prompt_eval_duration_s"], 2
+        )
+    if record["eval_count"] and record["eval_duration_s"]:
+        record["eval_tokens_per_s"] = round(
+            record["eval_count"] / record["eval_duration_s"], 2
+        )
+
+    return record
+
+
+class MetricsSink(ABC):
+    @abstractmethod
+    def record(self, metrics: dict):
+        pass
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """
+    Keeps call records in memory and aggregates them per stage.
+    """
+
+    def __init__(self, max_records: int = 10_000):
+        self.max_records = max_records
+        self.records: List[dict] = []
+        self._lock = threading.Lock()
+
+    def record(self, metrics: dict):
+        with self._lock:
+            self.records.append(metrics)
+            if len(self.records) > self.max_records:
+                del self.records[:len(self.records) - self.max_records]
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        Per-stage totals: where time goes between model load,
+        prompt ingestion and decoding.
+        """
+        totals = defaultdict(lambda: defaultdict(float))
+
+        with self._lock:
+            records = list(self.records)
+
+        for r in records:
+            stage = totals[r["stage"]]
+            stage["calls"] += 1
+            if (r.get("load_duration_s") or 0) > COLD_LOAD_THRESHOLD_S:
+                stage["cold_loads"] += 1
+            for key in (
+                "wall_time_s",
+                "load_duration_s",
+                "prompt_eval_duration_s",
+                "eval_duration_s",
+                "prompt_eval_count",
+                "eval_count"
+            ):
+                stage[key] += r.get(key) or 0
+
+        counters = {"calls", "cold_loads", "prompt_eval_count", "eval_count"}
+        return {
+            stage: {
+                k: int(v) if k in counters else round(v, 4)
+                for k, v in values.items()
+            }
+            for stage, values in totals.items()
+        }
+
+
+class JSONLMetricsSink(MetricsSink):
+    """
+    Appends one JSON line per call, for offline analysis.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def record(self, metrics: dict):
+        line = json.dumps(metrics)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class MultiMetricsSink(MetricsSink):
+    def __init__(self, *sinks: MetricsSink):
+        self.sinks = list(sinks)
+
+    def record(self, metrics: dict):
+        for sink in self.sinks:
+            sink.record(metrics)
@@ -1,19 +1,122 @@
-import requests
+import json
+import time
+from typing import Iterator
+
 from .base import BaseLLM
+from .metrics import MetricsSink, build_call_metrics
+from .transport import (
+    OllamaTransport,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT
+)
 
 class OllamaLLM(BaseLLM):
-    def __init__(self, model="llama3", base_url="http://localhost:11434"):
+    def __init__(
+        self,
+        model="llama3",
+        base_url="http://localhost:11434",
+        pool_size=DEFAULT_POOL_SIZE,
+        connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+        read_timeout=DEFAULT_READ_TIMEOUT,
+        transport=None,
+        options=None,
+        metrics_sink: MetricsSink = None,
+        keep_alive=None
+    ):
         self.model = model
         self.base_url = base_url
+        # Ollama generation options (temperature, num_ctx, seed, ...)
+        self.options = options
+        # How long Ollama keeps the model loaded after a call ("30m", -1, ...)
+        self.keep_alive = keep_alive
+
+        # A transport may be shared between clients to share its pool
+        self.transport = transport or OllamaTransport(
+            base_url=base_url,
+            pool_size=pool_size,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout
+        )
+        self.metrics_sink = metrics_sink
+
+    def _build_payload(self, prompt: str, stream: bool, format=None) -> dict:
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": stream
+        }
+        if self.options:
+            payload["options"] = self.options
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+        if format:
+            # "json" or a JSON schema (structured outputs)
+            payload["format"] = format
+        return payload
+
+    def _record_metrics(self, stage, data: dict, started: float, streamed: bool):
+        if self.metrics_sink is None:
+            return
+        self.metrics_sink.record(
+            build_call_metrics(
+                stage=stage,
+                model=self.model,
+                response=data,
+                wall_time_s=time.perf_counter() - started,
+                streamed=streamed
+            )
+        )
+
+    def generate(self, prompt: str, format=None, stage=None) -> str:
+        started = time.perf_counter()
+        response = self.transport.post(
+            "/api/generate",
+            self._build_payload(prompt, stream=False, format=format)
+        )
+        data = response.json()
+        self._record_metrics(stage, data, started, streamed=False)
+        return data["response"]
 
-    def generate(self, prompt: str) -> str:
-        response = requests.post(
-            f"{self.base_url}/api/generate",
-            json={
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False
-            }
+    def generate_stream(self, prompt: str, stage=None) -> Iterator[str]:
+        """
+        Yields response tokens as Ollama emits NDJSON chunks.
+        """
+        started = time.perf_counter()
+        response = self.transport.post(
+            "/api/generate",
+            self._build_payload(prompt, stream=True),
+            stream=True
         )
-        response.raise_for_status()
-        return response.json()["response"]
+
+        with response:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(f"Ollama stream error: {chunk['error']}")
+
+                if chunk.get("response"):
+                    yield chunk["response"]
+
+                if chunk.get("done"):
+                    # The final chunk carries the timing fields
+                    self._record_metrics(stage, chunk, started, streamed=True)
+                    break
+
+    def warm_up(self) -> float:
+        """
+        Loads the model into memory without generating anything
+        (Ollama preloads on a prompt-less request) and pins it for
+        keep_alive. Returns the time spent loading, in seconds.
+        """
+        started = time.perf_counter()
+        payload = {"model": self.model}
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+
+        response = self.transport.post("/api/generate", payload)
+        self._record_metrics("warm_up", response.json(), started, streamed=False)
+        return time.perf_counter() - started
@@ -0,0 +1,183 @@
+import itertools
+import threading
+import time
+from typing import Iterator, List
+
+import requests
+
+from .base import BaseLLM
+from .ollama_client import OllamaLLM
+
+
+DEFAULT_COOLDOWN_S = 15
+MAX_COOLDOWN_S = 300
+
+
+class _Host:
+    def __init__(self, client: OllamaLLM):
+        self.client = client
+        self.outstanding = 0
+        self.completed = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.down_until = 0.0
+
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.down_until
+
+
+def _is_host_failure(error: Exception) -> bool:
+    """
+    Connection problems, timeouts and 5xx mean the host is unhealthy.
+    4xx (bad request, unknown model) would fail on any host.
+    """
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code >= 500
+    return isinstance(error, requests.RequestException)
+
+
+class PooledLLM(BaseLLM):
+    """
+    Spreads requests across several Ollama endpoints.
+
+    Each call goes to the healthy host with the fewest outstanding
+    requests. A host that fails (connection error, timeout, 5xx) is taken
+    out of rotation for a cooldown that doubles on consecutive failures,
+    and the call is retried on the next host.
+    """
+
+    def __init__(
+        self,
+        clients: List[OllamaLLM],
+        cooldown_s: float = DEFAULT_COOLDOWN_S
+    ):
+        if not clients:
+            raise ValueError("PooledLLM needs at least one client")
+
+        self.hosts = [_Host(client) for client in clients]
+        self.cooldown_s = cooldown_s
+        self._lock = threading.Lock()
+        self._tiebreak = itertools.count()
+
+    @property
+    def model(self):
+        return self.hosts[0].client.model
+
+    @property
+    def options(self):
+        return self.hosts[0].client.options
+
+    def _acquire(self, exclude) -> _Host:
+        now = time.monotonic()
+        with self._lock:
+            candidates = [h for h in self.hosts if h not in exclude]
+            if not candidates:
+                return None
+
+            healthy = [h for h in candidates if h.is_healthy(now)]
+            if healthy:
+                # Least outstanding; rotate among ties
+                offset = next(self._tiebreak)
+                host = min(
+                    healthy,
+                    key=lambda h: (
+                        h.outstanding,
+                        (self.hosts.index(h) - offset) % len(self.hosts)
+                    )
+                )
+            else:
+                # Everything is cooling down: try the one due back first
+                host = min(candidates, key=lambda h: h.down_until)
+
+            host.outstanding += 1
+            return host
+
+    def _release(self, host: _Host, error: Exception = None):
+        with self._lock:
+            host.outstanding -= 1
+
+            if error is None:
+                host.completed += 1
+                host.consecutive_failures = 0
+                host.down_until = 0.0
+                return
+
+            host.failures += 1
+            host.consecutive_failures += 1
+            cooldown = min(
+                self.cooldown_s * 2 ** (host.consecutive_failures - 1),
+                MAX_COOLDOWN_S
+            )
+            host.down_until = time.monotonic() + cooldown
+
+        print(
+            f"⚠️ Ollama host {host.client.base_url} failed "
+            f"({error.__class__.__name__}); out of rotation for {cooldown:.0f}s"
+        )
+
+    def generate(self, prompt: str, format=None, stage=None) -> str:
+        tried = set()
+        last_error = None
+
+        while True:
+            host = self._acquire(tried)
+            if host is None:
+                raise last_error
+
+            tried.add(host)
+            failure = None
+            try:
+                return host.client.generate(prompt, format=format, stage=stage)
+            except Exception as e:
+                if not _is_host_failure(e):
+                    raise
+                failure = last_error = e
+            finally:
+                self._release(host, failure)
+
+    def generate_stream(self, prompt: str, stage=None) -> Iterator[str]:
+        tried = set()
+        last_error = None
+
+        while True:
+            host = self._acquire(tried)
+            if host is None:
+                raise last_error
+
+            tried.add(host)
+            started = False
+            failure = None
+            try:
+                for chunk in host.client.generate_stream(prompt, stage=stage):
+                    started = True
+                    yield chunk
+                return
+            except Exception as e:
+                if not _is_host_failure(e):
+                    raise
+                failure = last_error = e
+                # Tokens already reached the consumer: cannot fail over
+                if started:
+                    raise
+            finally:
+                self._release(host, failure)
+
+    def warm_up(self) -> dict:
+        timings = {}
+        for host in self.hosts:
+            timings[host.client.base_url] = host.client.warm_up()
+        return timings
+
+    def stats(self) -> List[dict]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "base_url": h.client.base_url,
+                    "healthy": h.is_healthy(now),
+                    "outstanding": h.outstanding,
+                    "completed": h.completed,
+                    "failures": h.failures
+                }
+                for h in self.hosts
+            ]
@@ -0,0 +1,98 @@
+import threading
+from typing import Iterator
+
+from .base import BaseLLM
+from .cache import LLMResponseCache
+
+
+class _InFlightCall:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlightGroup:
+    """
+    Registry of prompts currently being generated.
+
+    Shared by every SingleFlightLLM in the process so that identical
+    prompts from different workers or Streamlit sessions collapse
+    into one upstream request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+        self.calls = 0
+        self.collapsed = 0
+
+    def do(self, key: str, fn):
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self.collapsed += 1
+                leader = False
+            else:
+                call = _InFlightCall()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "collapsed": self.collapsed,
+                "in_flight": len(self._calls)
+            }
+
+
+class SingleFlightLLM(BaseLLM):
+    """
+    Wraps any BaseLLM so that concurrent identical prompts are sent once;
+    duplicate callers block until the leading call finishes and share its
+    result (or its exception).
+    Streaming calls are passed through without deduplication.
+    """
+
+    def __init__(self, llm: BaseLLM, group: SingleFlightGroup = None):
+        self.llm = llm
+        self.group = group or SingleFlightGroup()
+
+    @property
+    def model(self):
+        return getattr(self.llm, "model", None)
+
+    @property
+    def options(self):
+        return getattr(self.llm, "options", None)
+
+    def generate(self, prompt: str, format=None, stage=None) -> str:
+        key = LLMResponseCache.make_key(self.model, prompt, self.options, format)
+        return self.group.do(
+            key,
+            lambda: self.llm.generate(prompt, format=format, stage=stage)
+        )
+
+    def generate_stream(self, prompt: str, stage=None) -> Iterator[str]:
+        return self.llm.generate_stream(prompt, stage=stage)
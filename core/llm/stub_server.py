@@ -0,0 +1,352 @@
+"""
+Deterministic local stand-in for the Ollama HTTP API.
+
+Implements /api/generate (streaming and non-streaming) with scripted or
+recorded responses and configurable latency, so pipelines, benchmarks and
+CI runs work without a live Ollama and orchestration overhead can be
+measured separately from model time.
+
+Usage:
+    python -m core.llm.stub_server --port 11434 --latency lognormal:-1,0.5
+"""
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+from .base import BaseLLM
+
+
+DEFAULT_RESPONSE = "Stub response."
+
+
+# ---------------------------------------------------------
+# LATENCY
+# ---------------------------------------------------------
+class LatencyModel:
+    """
+    Seeded latency distribution, parsed from "kind:params":
+    - fixed:0.5
+    - uniform:0.1,0.5
+    - normal:0.5,0.1       (mean, stddev; clipped at 0)
+    - lognormal:-1,0.5     (mu, sigma of the underlying normal)
+    """
+
+    def __init__(self, spec: str = "fixed:0", seed: int = 0):
+        self.spec = spec
+        kind, _, params = spec.partition(":")
+        self.kind = kind
+        self.params = [float(p) for p in params.split(",") if p]
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+        if kind not in expected or len(self.params) != expected[kind]:
+            raise ValueError(f"Invalid latency spec: {spec}")
+
+    def sample(self) -> float:
+        with self._lock:
+            if self.kind == "fixed":
+                return self.params[0]
+            if self.kind == "uniform":
+                return self._rng.uniform(*self.params)
+            if self.kind == "normal":
+                return max(0.0, self._rng.gauss(*self.params))
+            return self._rng.lognormvariate(*self.params)
+
+
+# ---------------------------------------------------------
+# RESPONSE SCRIPT
+# ---------------------------------------------------------
+def _prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def _null_object(schema) -> str:
+    if isinstance(schema, dict) and schema.get("properties"):
+        return json.dumps({key: None for key in schema["properties"]})
+    return "{}"
+
+
+class ResponseScript:
+    """
+    Picks the reply for a prompt:
+    1. exact recorded prompt (by hash), loaded from a JSONL recording
+    2. first scripted rule whose regex matches the prompt
+    3. default: an all-null object for JSON requests, else DEFAULT_RESPONSE
+    """
+
+    def __init__(self, rules: Optional[List[dict]] = None, recording: str = None):
+        self.rules = [
+            (re.compile(rule["match"], re.S), rule["response"])
+            for rule in (rules or [])
+        ]
+        self.recorded = {}
+        if recording:
+            with open(recording, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.recorded[_prompt_hash(entry["prompt"])] = entry["response"]
+
+    def reply(self, prompt: str, format=None) -> str:
+        recorded = self.recorded.get(_prompt_hash(prompt))
+        if recorded is not None:
+            return recorded
+
+        for pattern, response in self.rules:
+            if pattern.search(prompt):
+                return response
+
+        return _null_object(format) if format else DEFAULT_RESPONSE
+
+
+class RecordingLLM(BaseLLM):
+    """
+    Wraps a real client and appends every prompt/response pair to a JSONL
+    file that ResponseScript(recording=...) can replay.
+    """
+
+    def __init__(self, llm: BaseLLM, path: str):
+        self.llm = llm
+        self.path = path
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        return getattr(self.llm, "model", None)
+
+    def generate(self, prompt: str, format=None, stage=None) -> str:
+        response = self.llm.generate(prompt, format=format, stage=stage)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"prompt": prompt, "response": response}) + "\n")
+        return response
+
+
+# ---------------------------------------------------------
+# HTTP SERVER
+# ---------------------------------------------------------
+def _tokenize(text: str) -> List[str]:
+    # Roughly token-sized chunks that concatenate back to the text
+    return re.findall(r"\s*\S+|\s+", text) or [""]
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Go's net/http (real Ollama) disables Nagle as well
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _write_chunk(self, body: dict):
+        data = (json.dumps(body) + "\n").encode()
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path == "/api/tags":
+            self._send_json(200, {"models": [{"name": "stub"}]})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/api/generate":
+            self._send_json(404, {"error": "not found"})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": "invalid JSON body"})
+            return
+
+        self.server.stub.handle_generate(self, request)
+
+
+class OllamaStubServer:
+    """
+    In-process Ollama stand-in. Use as a context manager:
+
+        with OllamaStubServer(rules=[...], latency="fixed:0.2") as stub:
+            llm = OllamaLLM(base_url=stub.base_url)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rules: Optional[List[dict]] = None,
+        recording: str = None,
+        latency: str = "fixed:0",
+        load_latency: str = "fixed:0",
+        tokens_per_s: float = 0,
+        seed: int = 0
+    ):
+        """
+        Args:
+            rules (list): [{"match": regex, "response": text}, ...]
+            recording (str): JSONL of {"prompt", "response"} pairs to replay
+            latency (str): prompt-processing delay before the first token
+            load_latency (str): extra delay on the first request per model
+            tokens_per_s (float): streaming decode speed (0 = instant)
+        """
+        self.script = ResponseScript(rules, recording)
+        self.latency = LatencyModel(latency, seed)
+        self.load_latency = LatencyModel(load_latency, seed + 1)
+        self.tokens_per_s = tokens_per_s
+
+        self.requests = 0
+        self._loaded_models = set()
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer((host, port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "OllamaStubServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="ollama-stub",
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _load_delay(self, model: str) -> float:
+        with self._lock:
+            self.requests += 1
+            if model in self._loaded_models:
+                return 0.0
+            self._loaded_models.add(model)
+        return self.load_latency.sample()
+
+    def handle_generate(self, handler: _StubHandler, request: dict):
+        model = request.get("model", "stub")
+        prompt = request.get("prompt")
+        started = time.perf_counter()
+
+        load_s = self._load_delay(model)
+        time.sleep(load_s)
+
+        # Prompt-less request: Ollama just loads the model
+        if not prompt:
+            handler._send_json(200, {
+                "model": model,
+                "response": "",
+                "done": True,
+                "done_reason": "load",
+                "load_duration": int(load_s * 1e9),
+                "total_duration": int((time.perf_counter() - started) * 1e9)
+            })
+            return
+
+        prompt_s = self.latency.sample()
+        time.sleep(prompt_s)
+
+        text = self.script.reply(prompt, request.get("format"))
+        tokens = _tokenize(text)
+        token_delay = 1 / self.tokens_per_s if self.tokens_per_s else 0
+
+        def final_fields(eval_s: float) -> dict:
+            return {
+                "model": model,
+                "done": True,
+                "done_reason": "stop",
+                "total_duration": int((time.perf_counter() - started) * 1e9),
+                "load_duration": int(load_s * 1e9),
+                "prompt_eval_count": max(1, math.ceil(len(prompt) / 4)),
+                "prompt_eval_duration": int(prompt_s * 1e9),
+                "eval_count": len(tokens),
+                "eval_duration": int(eval_s * 1e9)
+            }
+
+        if request.get("stream", True):
+            handler.send_response(200)
+            handler.send_header("Content-Type", "application/x-ndjson")
+            handler.send_header("Transfer-Encoding", "chunked")
+            handler.end_headers()
+
+            eval_started = time.perf_counter()
+            for token in tokens:
+                time.sleep(token_delay)
+                handler._write_chunk({"model": model, "response": token, "done": False})
+            handler._write_chunk({
+                "response": "",
+                **final_fields(time.perf_counter() - eval_started)
+            })
+            handler.wfile.write(b"0\r\n\r\n")
+            return
+
+        eval_s = token_delay * len(tokens)
+        time.sleep(eval_s)
+        handler._send_json(200, {"response": text, **final_fields(eval_s)})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Ollama stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--rules", help="JSON file with [{match, response}]")
+    parser.add_argument("--recording", help="JSONL of recorded prompt/response pairs")
+    parser.add_argument("--latency", default="fixed:0")
+    parser.add_argument("--load-latency", default="fixed:0")
+    parser.add_argument("--tokens-per-s", type=float, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rules = None
+    if args.rules:
+        with open(args.rules, encoding="utf-8") as f:
+            rules = json.load(f)
+
+    server = OllamaStubServer(
+        host=args.host,
+        port=args.port,
+        rules=rules,
+        recording=args.recording,
+        latency=args.latency,
+        load_latency=args.load_latency,
+        tokens_per_s=args.tokens_per_s,
+        seed=args.seed
+    )
+    print(f"Ollama stub listening on {server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
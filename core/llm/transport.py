@@ -0,0 +1,75 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 300
+
+
+class OllamaTransport:
+    """
+    Session-backed HTTP transport for the Ollama API.
+
+    Connections are kept alive and reused from a bounded pool, so
+    consecutive prompts do not pay a TCP handshake each time.
+    When every pooled connection is busy, callers wait for one to be
+    released instead of opening throwaway connections.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        keep_alive: bool = True
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = 0
+        self.timeout = (connect_timeout, read_timeout)
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.ensure_pool_size(pool_size)
+
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def ensure_pool_size(self, pool_size: int):
+        """
+        Grows the connection pool to at least `pool_size` (never shrinks
+        it). Requests in flight finish on the previous pool.
+        """
+        with self._lock:
+            if pool_size <= self.pool_size:
+                return
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=pool_size,
+                pool_block=True
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            self.pool_size = pool_size
+
+    def post(self, path: str, payload: dict, stream: bool = False) -> requests.Response:
+        """
+        POSTs a JSON payload to the Ollama server.
+
+        Raises:
+            requests.HTTPError: If the server returns an error status
+        """
+        response = self.session.post(
+            f"{self.base_url}{path}",
+            json=payload,
+            timeout=self.timeout,
+            stream=stream
+        )
+        response.raise_for_status()
+        return response
+
+    def close(self):
+        self.session.close()
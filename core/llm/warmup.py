@@ -0,0 +1,64 @@
+import threading
+from typing import Dict, List, Optional
+
+from config import LLM_KEEP_ALIVE, OLLAMA_HOSTS
+from .factory import get_metrics_sink
+from .ollama_client import OllamaLLM
+
+
+def warm_up_models(
+    models: Optional[Dict[str, object]] = None,
+    base_urls: Optional[List[str]] = None,
+    background: bool = False
+):
+    """
+    Preloads the configured models so the first real prompt does not pay
+    the model load, and sets each model's keep_alive.
+
+    Args:
+        models (dict): model name -> keep_alive (defaults to LLM_KEEP_ALIVE)
+        base_urls (list): Ollama servers (defaults to OLLAMA_HOSTS)
+        background (bool): Load in a daemon thread and return immediately,
+            so startup work (e.g. fetching tender pages) overlaps the load
+
+    Returns:
+        dict: (host, model) -> load seconds (None if it failed), or the
+        thread when background=True
+    """
+    models = models if models is not None else LLM_KEEP_ALIVE
+    base_urls = base_urls or OLLAMA_HOSTS
+
+    if background:
+        thread = threading.Thread(
+            target=warm_up_models,
+            kwargs={"models": models, "base_urls": base_urls},
+            name="ollama-warm-up",
+            daemon=True
+        )
+        thread.start()
+        return thread
+
+    timings = {}
+    for base_url in base_urls:
+        for model, keep_alive in models.items():
+            llm = OllamaLLM(
+                model=model,
+                base_url=base_url,
+                keep_alive=keep_alive,
+                metrics_sink=get_metrics_sink()
+            )
+            try:
+                seconds = llm.warm_up()
+                print(
+                    f"✔ Warmed up {model} on {base_url} in {seconds:.2f}s "
+                    f"(keep_alive={keep_alive})"
+                )
+            except Exception as e:
+                # Warm-up is best effort; the first real call will load instead
+                print(f"⚠️ Could not warm up {model} on {base_url}: {e}")
+                seconds = None
+            finally:
+                llm.transport.close()
+            timings[(base_url, model)] = seconds
+
+    return timings
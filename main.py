@@ -1,12 +1,38 @@
+import argparse
+
 from agents.sales_agent import run_sales_agent
-from agents.main_agent.main_agent import run_main_draft
+from agents.main_agent.main_agent import run_main_draft, run_main_agent_for_all
 from agents.technical_agent import run_technical_agent
 from agents.pricing_agent import run_pricing_agent
 
 from agents.main_agent.src.consolidate_response import consolidate_rfp_response
-from agents.main_agent.src.generate_pdf import generate_rfp_response_pdf
+from agents.main_agent.src.generate_pdf import generate_rfp_response_pdf, response_pdf_path
+from agents.main_agent.src.load_pdf import get_text_cache
+from agents.sales_agent.src.download_pdf import get_download_store
+from agents.sales_agent.src.host_scheduler import get_host_scheduler
+from core.llm import (
+    get_response_cache,
+    get_single_flight_group,
+    get_metrics,
+    warm_up_models
+)
+from config import RFP_FANOUT_CONCURRENCY
+
+
+def print_run_stats():
+    print("✔ LLM cache:", get_response_cache().stats())
+    print("✔ LLM single-flight:", get_single_flight_group().stats())
+    print("✔ Downloads:", get_download_store().stats())
+    print("✔ PDF text cache:", get_text_cache().stats())
+    print("✔ Portal requests:", get_host_scheduler().stats())
+    for stage, totals in get_metrics().summary().items():
+        print(f"✔ LLM [{stage}]:", totals)
+
 
 def main():
+    # Load models while the Sales Agent fetches tender pages
+    warm_up_models(background=True)
+
     # ------------------------------------------------------
     # Step 1: Run Sales Agent
     # ------------------------------------------------------
@@ -54,13 +80,11 @@ def main():
         technical_result=technical_result,
         pricing_result=pricing_result
     )
-    pdf_path = (
-        f"data/outputs/RFP_RESPONSE_"
-        f"{main_result['rfp_metadata']['tender_reference']}.pdf"
-    )
+    pdf_path = response_pdf_path(main_result["rfp_metadata"])
     generate_rfp_response_pdf(final_rfp_response, pdf_path)
     print("✔ Main Agent - Report saved Successfully.")
-    
+    print_run_stats()
+
     return {
         **main_result,
         "technical_recommendations": technical_result["rfp_items"],
@@ -68,7 +92,53 @@ def main():
         "final_rfp_response": final_rfp_response,
         "final_pdf_path": pdf_path
     }
-    
+
+
+def main_all(max_workers=RFP_FANOUT_CONCURRENCY):
+    """
+    Multi-RFP mode: every accepted RFP goes through download → Main →
+    Technical → Pricing → report, up to `max_workers` at once.
+    """
+    warm_up_models(background=True)
+
+    print(">> Running Sales Agent...")
+
+    rfps = []
+    for event in run_sales_agent():
+        if event.get("type") == "FINAL_RESULT":
+            rfps = event["data"]["accepted_rfps"]
+
+    print(">> Sales Agent completed.")
+    print(f"✔ Accepted RFPs: {len(rfps)}")
+
+    print(f"\n>> Processing {len(rfps)} RFPs ({max_workers} at once)")
+    results = run_main_agent_for_all(rfps, max_workers=max_workers)
+
+    print("\n>> Summary")
+    for entry in results:
+        if entry["status"] == "DONE":
+            print(f"✔ {entry['tender_reference']}: {entry['result']['final_pdf_path']}")
+        else:
+            print(f"⚠️ {entry['tender_reference']}: {entry['error']}")
+    print_run_stats()
+
+    return results
+
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Agentic RFP pipeline")
+    parser.add_argument(
+        "--all", action="store_true",
+        help="process every accepted RFP instead of only the selected one"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=RFP_FANOUT_CONCURRENCY,
+        help="RFPs processed at once with --all"
+    )
+    args = parser.parse_args()
+
+    if args.all:
+        main_all(max_workers=args.concurrency)
+    else:
+        main()
 
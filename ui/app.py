@@ -164,9 +164,17 @@ from agents.main_agent.main_agent import run_main_draft
 from agents.technical_agent import run_technical_agent
 from agents.pricing_agent import run_pricing_agent
 from agents.main_agent.src.consolidate_response import consolidate_rfp_response
-from agents.main_agent.src.generate_pdf import generate_rfp_response_pdf
+from agents.main_agent.src.generate_pdf import generate_rfp_response_pdf, response_pdf_path
 from state import init_state
+from components.summary_stream import make_summary_streamer
+from core.llm import warm_up_models
 
+@st.cache_resource
+def warm_up_llm():
+    # Runs once per Streamlit server process, not on every rerun
+    return warm_up_models(background=True)
+
+warm_up_llm()
 init_state()
 
 # ==================================================
@@ -280,7 +288,10 @@ if 'stage' in st.session_state:
         """, unsafe_allow_html=True)
 
         with st.spinner("Analyzing RFP and generating role-specific summaries..."):
-            main_result = run_main_draft(st.session_state['rfp'])
+            main_result = run_main_draft(
+                st.session_state['rfp'],
+                on_summary_chunk=make_summary_streamer()
+            )
         st.session_state['main_result'] = main_result
         st.session_state['stage'] = 'technical'
         st.rerun()
@@ -331,7 +342,7 @@ if 'stage' in st.session_state:
                 technical_result=st.session_state['technical_result'],
                 pricing_result=st.session_state['pricing_result']
             )
-            pdf_path = f"data/outputs/RFP_RESPONSE_{st.session_state['main_result']['rfp_metadata']['tender_reference']}.pdf"
+            pdf_path = response_pdf_path(st.session_state['main_result']['rfp_metadata'])
             generate_rfp_response_pdf(final_rfp_response, pdf_path)
 
         st.session_state['final_rfp_response'] = final_rfp_response
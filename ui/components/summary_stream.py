@@ -0,0 +1,25 @@
+import streamlit as st
+
+SECTION_LABELS = {
+    "technical_summary": "📝 Technical Summary",
+    "pricing_summary": "💰 Pricing Summary"
+}
+
+def make_summary_streamer():
+    """
+    Returns an on_chunk(section, text) callback that renders streamed
+    summary tokens into live placeholders, one per section.
+    """
+    buffers = {}
+    placeholders = {}
+
+    def on_chunk(section, text):
+        if section not in placeholders:
+            st.markdown(f"##### {SECTION_LABELS.get(section, section)}")
+            placeholders[section] = st.empty()
+            buffers[section] = ""
+
+        buffers[section] += text
+        placeholders[section].markdown(buffers[section] + " ▌")
+
+    return on_chunk
@@ -1,6 +1,7 @@
 import streamlit as st
 from agents.main_agent.main_agent import run_main_draft
 from agents.main_agent.src.consolidate_response import consolidate_rfp_response
+from components.summary_stream import make_summary_streamer
 
 # ==================================================
 # PAGE CONFIG & STYLING
@@ -256,7 +257,10 @@ if "main_draft" not in st.session_state:
     with col2:
         if st.button(" Generate Context", use_container_width=True, type="primary"):
             with st.spinner("🔄 Analyzing RFP structure and extracting key requirements..."):
-                st.session_state.main_draft = run_main_draft(rfp)
+                st.session_state.main_draft = run_main_draft(
+                    rfp,
+                    on_summary_chunk=make_summary_streamer()
+                )
                 st.rerun()
 else:
     st.success(" Context generation completed", icon="✅")